@@ -0,0 +1,37 @@
+"""Script de build optionnel : compilation AOT des modules chauds avec Cython.
+
+La configuration du projet reste dans pyproject.toml. Ce script ajoute
+uniquement les extensions compilées lorsque Cython est disponible :
+
+    pip install cython
+    python setup.py build_ext --inplace
+
+Sans Cython, aucune extension n'est construite et les modules `.py`
+restent utilisés tels quels (fallback Python pur).
+"""
+
+from setuptools import setup
+
+# Modules compilés : l'évaluateur (dispatch par nœud), l'AST (accès aux champs),
+# l'optimiseur (parcours postfixe), le pretty-printer (visite par nœud) et le
+# tokenizer (boucle de production des tokens)
+CYTHON_MODULES = [
+    "src/evaluator.py",
+    "src/ast.py",
+    "src/optimizer.py",
+    "src/pretty.py",
+    "src/tokenizer.py",
+]
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = cythonize(
+        CYTHON_MODULES,
+        compiler_directives={"language_level": 3},
+    )
+
+# Le package s'appelle `src` : désactiver la détection automatique du "src layout"
+setup(packages=["src"], package_dir={"": "."}, ext_modules=ext_modules)
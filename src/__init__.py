@@ -22,7 +22,7 @@ from .errors import (
     UnexpectedTokenError,
     UnknownVariableError,
 )
-from .evaluator import evaluate
+from .evaluator import compile_expr, evaluate, evaluate_many, truth_table
 from .optimizer import optimize
 from .parser import parse
 from .pretty import CaseStyle, pretty_print as smart_pretty_print
@@ -44,6 +44,9 @@ __all__ = [
     "parse",
     # Evaluator
     "evaluate",
+    "evaluate_many",
+    "truth_table",
+    "compile_expr",
     # Optimizer
     "optimize",
     # Tokenizer
@@ -0,0 +1,59 @@
+"""Noyaux compilés par Numba pour l'évaluateur.
+
+Module importé à la demande par `evaluator` : NumPy et Numba sont longs à
+importer et ne servent qu'aux grandes tables de suggestions.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def _lev_many_kernel(target, flat, offsets, cutoff):  # pragma: no cover - compilé par Numba
+    """Distances bornées entre `target` et chaque mot de `flat` (découpé par `offsets`)."""
+    m = target.shape[0]
+    over = cutoff + 1
+    count = offsets.shape[0] - 1
+    out = np.empty(count, dtype=np.int64)
+    prev = np.empty(m + 1, dtype=np.int64)
+    cur = np.empty(m + 1, dtype=np.int64)
+    for w in range(count):
+        start = offsets[w]
+        n = offsets[w + 1] - start
+        if abs(n - m) > cutoff:
+            out[w] = over
+            continue
+        for j in range(m + 1):
+            prev[j] = min(j, over)
+        result = -1
+        for i in range(1, n + 1):
+            c1 = flat[start + i - 1]
+            cur[0] = min(i, over)
+            row_min = cur[0]
+            for j in range(1, m + 1):
+                value = prev[j - 1] + (1 if c1 != target[j - 1] else 0)
+                value = min(value, prev[j] + 1, cur[j - 1] + 1, over)
+                cur[j] = value
+                row_min = min(row_min, value)
+            if row_min > cutoff:
+                result = over
+                break
+            prev, cur = cur, prev
+        out[w] = prev[m] if result < 0 else result
+    return out
+
+
+def lev_many(target: str, words: list[str], cutoff: int) -> list[int]:
+    """Distances bornées de `target` vers chaque mot (noyau Numba).
+
+    Les chaînes sont encodées en UTF-32 pour comparer des caractères (et non
+    des octets) dans le noyau compilé.
+    """
+    encoded = [word.encode("utf-32-le") for word in words]
+    offsets = np.zeros(len(words) + 1, dtype=np.int64)
+    np.cumsum([len(e) // 4 for e in encoded], out=offsets[1:])
+    flat = np.frombuffer(b"".join(encoded), dtype=np.uint32)
+    target_arr = np.frombuffer(target.encode("utf-32-le"), dtype=np.uint32)
+    return _lev_many_kernel(target_arr, flat, offsets, cutoff).tolist()
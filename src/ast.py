@@ -3,25 +3,33 @@
 Ce module contient :
 - Les nœuds AST (Var, BoolLit, Not, And, Or)
 - Le Visitor Pattern avec accept()
-- Comparaison d'égalité (__eq__)
-- Sérialisation JSON (to_json, from_json)
+- Comparaison d'égalité (__eq__) et hash structurel précalculé
+- Bit `foldable` précalculé (sous-arbre simplifiable par l'optimiseur)
+- Sérialisation JSON (to_json, from_json, write_json)
 - Pretty-printer de base (déplacé dans pretty.py pour version avancée)
 """
 
 from __future__ import annotations
 
+import io
 import json
-from dataclasses import dataclass, field
-from typing import Any
+import weakref
+from typing import Any, Callable
 
 from .visitors import ExprVisitor
 
 
-@dataclass(frozen=True)
 class Var:
     """Nœud AST représentant une variable (identifiant)."""
 
-    name: str
+    __slots__ = ("name", "_hash", "__weakref__")
+
+    # Voir Not.foldable : une variable seule n'est jamais simplifiable
+    foldable = False
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._hash = hash(("Var", name))
 
     def accept(self, visitor: ExprVisitor[Any]) -> Any:
         """Accepte un visiteur (Visitor Pattern)."""
@@ -29,20 +37,31 @@ class Var:
 
     def __eq__(self, other: object) -> bool:
         """Comparaison d'égalité."""
-        if not isinstance(other, Var):
-            return False
-        return self.name == other.name
+        return self is other or (
+            type(other) is Var and self._hash == other._hash and self.name == other.name
+        )
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __repr__(self) -> str:
+        return f"Var(name={self.name!r})"
 
     def to_json(self) -> dict[str, Any]:
         """Sérialise le nœud en JSON."""
         return {"type": "Var", "name": self.name}
 
 
-@dataclass(frozen=True)
 class BoolLit:
     """Nœud AST représentant un littéral booléen (TRUE/FALSE)."""
 
-    value: bool
+    __slots__ = ("value", "_hash", "__weakref__")
+
+    foldable = True
+
+    def __init__(self, value: bool) -> None:
+        self.value = value
+        self._hash = hash(("BoolLit", value))
 
     def accept(self, visitor: ExprVisitor[Any]) -> Any:
         """Accepte un visiteur (Visitor Pattern)."""
@@ -50,20 +69,32 @@ class BoolLit:
 
     def __eq__(self, other: object) -> bool:
         """Comparaison d'égalité."""
-        if not isinstance(other, BoolLit):
-            return False
-        return self.value == other.value
+        return self is other or (
+            type(other) is BoolLit and self._hash == other._hash and self.value == other.value
+        )
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __repr__(self) -> str:
+        return f"BoolLit(value={self.value!r})"
 
     def to_json(self) -> dict[str, Any]:
         """Sérialise le nœud en JSON."""
         return {"type": "BoolLit", "value": self.value}
 
 
-@dataclass(frozen=True)
 class Not:
     """Nœud AST représentant une négation logique (NOT)."""
 
-    expr: Expr
+    __slots__ = ("expr", "_hash", "foldable", "__weakref__")
+
+    def __init__(self, expr: Expr) -> None:
+        self.expr = expr
+        self._hash = hash(("Not", expr._hash))
+        # True si le sous-arbre contient un littéral ou une double négation,
+        # seuls motifs que l'optimiseur sait simplifier (calculé une fois)
+        self.foldable = expr.foldable or type(expr) is Not
 
     def accept(self, visitor: ExprVisitor[Any]) -> Any:
         """Accepte un visiteur (Visitor Pattern)."""
@@ -71,21 +102,31 @@ class Not:
 
     def __eq__(self, other: object) -> bool:
         """Comparaison d'égalité."""
-        if not isinstance(other, Not):
-            return False
-        return self.expr == other.expr
+        return self is other or (
+            type(other) is Not and self._hash == other._hash and _tree_eq(self.expr, other.expr)
+        )
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __repr__(self) -> str:
+        return f"Not(expr={self.expr!r})"
 
     def to_json(self) -> dict[str, Any]:
         """Sérialise le nœud en JSON."""
         return {"type": "Not", "expr": self.expr.to_json()}
 
 
-@dataclass(frozen=True)
 class And:
     """Nœud AST représentant une conjonction logique (AND)."""
 
-    left: Expr
-    right: Expr
+    __slots__ = ("left", "right", "_hash", "foldable", "__weakref__")
+
+    def __init__(self, left: Expr, right: Expr) -> None:
+        self.left = left
+        self.right = right
+        self._hash = hash(("And", left._hash, right._hash))
+        self.foldable = left.foldable or right.foldable
 
     def accept(self, visitor: ExprVisitor[Any]) -> Any:
         """Accepte un visiteur (Visitor Pattern)."""
@@ -93,21 +134,34 @@ class And:
 
     def __eq__(self, other: object) -> bool:
         """Comparaison d'égalité."""
-        if not isinstance(other, And):
-            return False
-        return self.left == other.left and self.right == other.right
+        return self is other or (
+            type(other) is And
+            and self._hash == other._hash
+            and _tree_eq(self.left, other.left)
+            and _tree_eq(self.right, other.right)
+        )
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __repr__(self) -> str:
+        return f"And(left={self.left!r}, right={self.right!r})"
 
     def to_json(self) -> dict[str, Any]:
         """Sérialise le nœud en JSON."""
         return {"type": "And", "left": self.left.to_json(), "right": self.right.to_json()}
 
 
-@dataclass(frozen=True)
 class Or:
     """Nœud AST représentant une disjonction logique (OR)."""
 
-    left: Expr
-    right: Expr
+    __slots__ = ("left", "right", "_hash", "foldable", "__weakref__")
+
+    def __init__(self, left: Expr, right: Expr) -> None:
+        self.left = left
+        self.right = right
+        self._hash = hash(("Or", left._hash, right._hash))
+        self.foldable = left.foldable or right.foldable
 
     def accept(self, visitor: ExprVisitor[Any]) -> Any:
         """Accepte un visiteur (Visitor Pattern)."""
@@ -115,9 +169,18 @@ class Or:
 
     def __eq__(self, other: object) -> bool:
         """Comparaison d'égalité."""
-        if not isinstance(other, Or):
-            return False
-        return self.left == other.left and self.right == other.right
+        return self is other or (
+            type(other) is Or
+            and self._hash == other._hash
+            and _tree_eq(self.left, other.left)
+            and _tree_eq(self.right, other.right)
+        )
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __repr__(self) -> str:
+        return f"Or(left={self.left!r}, right={self.right!r})"
 
     def to_json(self) -> dict[str, Any]:
         """Sérialise le nœud en JSON."""
@@ -128,9 +191,102 @@ class Or:
 Expr = Var | BoolLit | Not | And | Or
 
 
+def _tree_eq(left: Expr, right: Expr) -> bool:
+    """Égalité structurelle itérative (pile explicite, sans récursion Python).
+
+    Utilisée par les `__eq__` des nœuds composés : comparer deux arbres
+    profonds égaux mais distincts (clé de cache, dictionnaire) ne doit pas
+    dépasser la limite de récursion. Les sous-arbres identiques ou de hash
+    différent sont tranchés sans descendre.
+    """
+    pending = [(left, right)]
+    while pending:
+        a, b = pending.pop()
+        if a is b:
+            continue
+        a_type = type(a)
+        if a_type is not type(b) or a._hash != b._hash:
+            return False
+        if a_type is Not:
+            pending.append((a.expr, b.expr))
+        elif a_type is And or a_type is Or:
+            pending.append((a.right, b.right))
+            pending.append((a.left, b.left))
+        elif a != b:
+            return False
+    return True
+
+
+# Table d'internement (hash-consing) : les nœuds structurellement identiques
+# construits via les fabriques mk_* partagent la même instance. Les clés des
+# nœuds composés utilisent l'identité des enfants, valide tant que le nœud
+# (qui les référence) est vivant.
+_intern: weakref.WeakValueDictionary[tuple[Any, ...], Expr] = weakref.WeakValueDictionary()
+
+
+def mk_var(name: str) -> Var:
+    """Retourne l'instance canonique de Var(name)."""
+    key = ("Var", name)
+    node = _intern.get(key)
+    if node is None:
+        node = _intern[key] = Var(name=name)
+    return node  # type: ignore[return-value]
+
+
+def mk_bool(value: bool) -> BoolLit:
+    """Retourne l'instance canonique de BoolLit(value)."""
+    key = ("BoolLit", value)
+    node = _intern.get(key)
+    if node is None:
+        node = _intern[key] = BoolLit(value=value)
+    return node  # type: ignore[return-value]
+
+
+def mk_not(expr: Expr) -> Not:
+    """Retourne l'instance canonique de Not(expr)."""
+    key = ("Not", id(expr))
+    node = _intern.get(key)
+    if node is None:
+        node = _intern[key] = Not(expr=expr)
+    return node  # type: ignore[return-value]
+
+
+def mk_and(left: Expr, right: Expr) -> And:
+    """Retourne l'instance canonique de And(left, right)."""
+    key = ("And", id(left), id(right))
+    node = _intern.get(key)
+    if node is None:
+        node = _intern[key] = And(left=left, right=right)
+    return node  # type: ignore[return-value]
+
+
+def mk_or(left: Expr, right: Expr) -> Or:
+    """Retourne l'instance canonique de Or(left, right)."""
+    key = ("Or", id(left), id(right))
+    node = _intern.get(key)
+    if node is None:
+        node = _intern[key] = Or(left=left, right=right)
+    return node  # type: ignore[return-value]
+
+
+_loads = json.loads
+
+# Pour chaque type de nœud : champs enfants (dans l'ordre) et constructeur
+_JSON_NODES: dict[str, tuple[tuple[str, ...], Callable[[dict[str, Any], list[Expr]], Expr]]] = {
+    "Var": ((), lambda data, children: Var(name=data["name"])),
+    "BoolLit": ((), lambda data, children: BoolLit(value=data["value"])),
+    "Not": (("expr",), lambda data, children: Not(expr=children[0])),
+    "And": (("left", "right"), lambda data, children: And(left=children[0], right=children[1])),
+    "Or": (("left", "right"), lambda data, children: Or(left=children[0], right=children[1])),
+}
+
+
 def from_json(data: dict[str, Any] | str) -> Expr:
     """Désérialise un nœud AST depuis JSON.
 
+    Le parcours est itératif (pile explicite), ce qui permet de relire des
+    AST plus profonds que la limite de récursion de Python.
+
     Args:
         data: Dictionnaire JSON ou chaîne JSON
 
@@ -141,66 +297,150 @@ def from_json(data: dict[str, Any] | str) -> Expr:
         ValueError: Si le format JSON est invalide
     """
     if isinstance(data, str):
-        data = json.loads(data)
-
-    node_type = data.get("type")
-    if node_type == "Var":
-        return Var(name=data["name"])
-    elif node_type == "BoolLit":
-        return BoolLit(value=data["value"])
-    elif node_type == "Not":
-        return Not(expr=from_json(data["expr"]))
-    elif node_type == "And":
-        return And(left=from_json(data["left"]), right=from_json(data["right"]))
-    elif node_type == "Or":
-        return Or(left=from_json(data["left"]), right=from_json(data["right"]))
-    else:
-        raise ValueError(f"Type de nœud inconnu : {node_type}")
+        data = _loads(data)
+
+    results: list[Expr] = []
+    # Chaque entrée : (dictionnaire du nœud, enfants déjà empilés ?)
+    stack: list[tuple[dict[str, Any], bool]] = [(data, False)]
+    while stack:
+        node, expanded = stack.pop()
+        node_type = node.get("type")
+        spec = _JSON_NODES.get(node_type)
+        if spec is None:
+            raise ValueError(f"Type de nœud inconnu : {node_type}")
+        child_fields, build = spec
+
+        if child_fields and not expanded:
+            # Revisiter ce nœud une fois ses enfants construits
+            stack.append((node, True))
+            for name in reversed(child_fields):
+                stack.append((node[name], False))
+            continue
+
+        count = len(child_fields)
+        if count:
+            children = results[-count:]
+            del results[-count:]
+        else:
+            children = []
+        results.append(build(node, children))
+
+    return results[0]
+
+
+_encode_str = json.encoder.encode_basestring_ascii
+
+
+def write_json(expr: Expr, write: Callable[[str], Any], indent: int = 2) -> None:
+    """Écrit l'AST en JSON, fragment par fragment, sans construire de dict.
+
+    La sortie est identique à `json.dumps(expr.to_json(), indent=indent)`,
+    mais ni l'arbre de dictionnaires ni la chaîne complète ne sont alloués.
+    Le parcours est itératif (pile de fragments et de couples (nœud, niveau)).
+
+    Args:
+        expr: AST à sérialiser
+        write: Fonction d'écriture (ex. `sys.stdout.write`, `list.append`)
+        indent: Nombre d'espaces par niveau d'indentation
+    """
+    stack: list[str | tuple[Expr, int]] = [(expr, 0)]
+    pop, push = stack.pop, stack.append
+
+    while stack:
+        item = pop()
+        if type(item) is str:
+            write(item)
+            continue
+        node, level = item
+        pad = "\n" + " " * (indent * (level + 1))
+        close = "\n" + " " * (indent * level) + "}"
+        node_type = type(node)
+        if node_type is Var:
+            write(f'{{{pad}"type": "Var",{pad}"name": {_encode_str(node.name)}{close}')
+        elif node_type is BoolLit:
+            value = "true" if node.value else "false"
+            write(f'{{{pad}"type": "BoolLit",{pad}"value": {value}{close}')
+        elif node_type is Not:
+            write(f'{{{pad}"type": "Not",{pad}"expr": ')
+            push(close)
+            push((node.expr, level + 1))
+        elif node_type is And or node_type is Or:
+            name = "And" if node_type is And else "Or"
+            write(f'{{{pad}"type": "{name}",{pad}"left": ')
+            # Empiler en ordre inverse d'écriture
+            push(close)
+            push((node.right, level + 1))
+            push(f',{pad}"right": ')
+            push((node.left, level + 1))
+        else:
+            raise TypeError(f"Nœud AST inconnu : {node!r}")
+
+
+# Préfixes d'indentation précalculés (profondeurs usuelles)
+_INDENTS = ["  " * i for i in range(64)]
+
+
+def _dump(expr: Expr, write: Callable[[str], Any], depth: int) -> None:
+    """Écrit l'arbre indenté d'un sous-arbre (une ligne par nœud, en préordre).
+
+    Le parcours est itératif (pile explicite de couples (nœud, profondeur)).
+    """
+    stack: list[tuple[Expr, int]] = [(expr, depth)]
+    pop, push = stack.pop, stack.append
+    indents = _INDENTS
+    max_cached = len(indents)
+
+    while stack:
+        node, level = pop()
+        write(indents[level] if level < max_cached else "  " * level)
+        node_type = type(node)
+        if node_type is Var:
+            write(f"Var(name={node.name})\n")
+        elif node_type is BoolLit:
+            write("BoolLit(value=True)\n" if node.value else "BoolLit(value=False)\n")
+        elif node_type is Not:
+            write("Not\n")
+            push((node.expr, level + 1))
+        elif node_type is And or node_type is Or:
+            write("And\n" if node_type is And else "Or\n")
+            # Empiler à droite d'abord pour afficher la gauche en premier
+            push((node.right, level + 1))
+            push((node.left, level + 1))
+        else:
+            raise TypeError(f"Nœud AST inconnu : {node!r}")
 
 
 # Pretty-printer simple (version de base, la version avancée est dans pretty.py)
 class ASTPrettyPrinter(ExprVisitor[None]):
-    """Pretty-printer simple pour l'AST (affichage lisible et indenté)."""
+    """Pretty-printer simple pour l'AST (affichage lisible et indenté).
+
+    Utilisé comme visiteur, chaque nœud visité écrit son sous-arbre dans
+    `self.output`.
+    """
 
-    def __init__(self) -> None:
-        self._lines: list[str] = []
-        self._indent_level: int = 0
+    def __init__(self, output: io.StringIO | None = None) -> None:
+        self.output = output if output is not None else io.StringIO()
 
     def format(self, expr: Expr) -> str:
         """Formate une expression AST en chaîne lisible."""
-        self._lines = []
-        self._indent_level = 0
-        expr.accept(self)
-        return "\n".join(self._lines)
+        buf = io.StringIO()
+        _dump(expr, buf.write, 0)
+        return buf.getvalue()[:-1]  # sans le dernier saut de ligne
 
     def visit_var(self, expr: Var) -> None:
-        self._add_line(f"Var(name={expr.name})")
+        _dump(expr, self.output.write, 0)
 
     def visit_bool_lit(self, expr: BoolLit) -> None:
-        self._add_line(f"BoolLit(value={expr.value})")
+        _dump(expr, self.output.write, 0)
 
     def visit_not(self, expr: Not) -> None:
-        self._add_line("Not")
-        self._with_indent(lambda: expr.expr.accept(self))
+        _dump(expr, self.output.write, 0)
 
     def visit_and(self, expr: And) -> None:
-        self._add_line("And")
-        self._with_indent(lambda: (expr.left.accept(self), expr.right.accept(self)))
+        _dump(expr, self.output.write, 0)
 
     def visit_or(self, expr: Or) -> None:
-        self._add_line("Or")
-        self._with_indent(lambda: (expr.left.accept(self), expr.right.accept(self)))
-
-    def _add_line(self, text: str) -> None:
-        indent = "  " * self._indent_level
-        self._lines.append(f"{indent}{text}")
-
-    def _with_indent(self, func) -> None:
-        self._indent_level += 1
-        try:
-            func()
-        finally:
-            self._indent_level -= 1
+        _dump(expr, self.output.write, 0)
 
 
 def pretty_print(expr: Expr) -> str:
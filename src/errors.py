@@ -9,7 +9,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SourceLocation:
     """Représente une position dans le code source (ligne, colonne, offset)."""
 
@@ -34,6 +34,7 @@ class CompilerError(Exception):
         self.message = message
         self.location = location
         self.source = source
+        self._lines: list[str] | None = None  # source découpée, calculée à la demande
 
     def format_error(self, context_lines: int = 2) -> str:
         """Formate l'erreur avec contexte (style GCC/Clang).
@@ -47,7 +48,9 @@ class CompilerError(Exception):
         if not self.location or not self.source:
             return str(self.message)
 
-        lines = self.source.splitlines()
+        lines = self._lines
+        if lines is None:
+            lines = self._lines = self.source.splitlines()
         line_num = self.location.line - 1
 
         if line_num < 0 or line_num >= len(lines):
@@ -57,18 +60,20 @@ class CompilerError(Exception):
         start_line = max(0, line_num - context_lines)
         end_line = min(len(lines), line_num + context_lines + 1)
 
+        # Flèche pointant l'erreur (calculée une seule fois)
+        column = self.location.column
+        arrow = " " * (column + 10) + "^" * max(1, len(error_line) - column + 1)
+
         parts = [f"{self.__class__.__name__}: {self.message}"]
         parts.append(f"  --> {self.location}")
 
-        # Afficher les lignes de contexte
-        for i in range(start_line, end_line):
-            marker = ">>>" if i == line_num else "   "
-            parts.append(f"{marker} {i + 1:4d} | {lines[i]}")
-
-            # Afficher la flèche pointant l'erreur
-            if i == line_num:
-                arrow = " " * (self.location.column + 10) + "^" * max(1, len(error_line) - self.location.column + 1)
-                parts.append(f"       | {arrow}")
+        # Lignes de contexte avant l'erreur, ligne fautive + flèche, puis contexte après
+        for i in range(start_line, line_num):
+            parts.append(f"    {i + 1:4d} | {lines[i]}")
+        parts.append(f">>> {line_num + 1:4d} | {error_line}")
+        parts.append(f"       | {arrow}")
+        for i in range(line_num + 1, end_line):
+            parts.append(f"    {i + 1:4d} | {lines[i]}")
 
         return "\n".join(parts)
 
@@ -9,14 +9,93 @@ Ce module implémente un évaluateur robuste avec :
 from __future__ import annotations
 
 import logging
-from typing import Mapping
+from importlib.util import find_spec
+from typing import Any, Callable, Mapping, Sequence
 
 from . import ast
 from .errors import UnknownVariableError
 from .visitors import ExprVisitor
 
+# NumPy et Numba sont optionnels et lents à importer (plus de 100 ms) : seule
+# leur présence est vérifiée ici, l'import a lieu au premier usage
+HAS_NUMPY = find_spec("numpy") is not None
+HAS_NUMBA = HAS_NUMPY and find_spec("numba") is not None
+
 logger = logging.getLogger(__name__)
 
+# Au-delà de ce nombre de variables, les suggestions passent par le noyau Numba
+NUMBA_MIN_VARIABLES = 64
+_numba_fallback_logged = False
+
+
+def _lev(s1: str, s2: str, cutoff: int) -> int:
+    """Distance de Levenshtein bornée par `cutoff` (algorithme bit-parallèle de Myers).
+
+    Une colonne entière de la matrice de programmation dynamique est codée
+    par deux vecteurs de bits (différences verticales +1 / -1) : chaque
+    caractère de la chaîne la plus longue coûte une poignée d'opérations
+    bit à bit sur des entiers Python, quelle que soit la longueur de l'autre
+    (formulation de Hyyrö pour la distance globale).
+
+    Returns:
+        La distance si elle est <= cutoff, sinon cutoff + 1
+    """
+    if len(s1) < len(s2):
+        s1, s2 = s2, s1
+    m = len(s2)
+    over = cutoff + 1
+    if len(s1) - m > cutoff:
+        return over
+    if m == 0:
+        return len(s1)
+
+    # peq[c] : positions de `c` dans s2 (bit i <=> s2[i] == c)
+    peq: dict[str, int] = {}
+    bit = 1
+    for c in s2:
+        peq[c] = peq.get(c, 0) | bit
+        bit <<= 1
+    mask = bit - 1
+    last = bit >> 1  # Bit de la dernière ligne (porte le score)
+
+    pv = mask  # Différences verticales +1
+    mv = 0  # Différences verticales -1
+    score = m
+    for c in s1:
+        eq = peq.get(c, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | (mask & ~(xh | pv))
+        mh = pv & xh
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+        # Le `| 1` fixe la première ligne (distance globale, pas de recherche)
+        ph = ((ph << 1) | 1) & mask
+        mh = (mh << 1) & mask
+        pv = mh | (mask & ~(xv | ph))
+        mv = ph & xv
+
+    return score if score < over else over
+
+
+def _lev_many(target: str, words: list[str], cutoff: int) -> list[int]:
+    """Distances bornées de `target` vers chaque mot, via Numba si disponible."""
+    global _numba_fallback_logged
+    if HAS_NUMBA:
+        try:
+            from ._numba_kernels import lev_many
+        except ImportError:
+            pass
+        else:
+            return lev_many(target, words, cutoff)
+
+    if not _numba_fallback_logged:
+        logger.debug("Numba indisponible : suggestions calculées en Python pur")
+        _numba_fallback_logged = True
+    return [_lev(target, word, cutoff) for word in words]
+
 
 def levenshtein_distance(s1: str, s2: str) -> int:
     """Calcule la distance de Levenshtein entre deux chaînes.
@@ -28,23 +107,8 @@ def levenshtein_distance(s1: str, s2: str) -> int:
     Returns:
         Distance de Levenshtein
     """
-    if len(s1) < len(s2):
-        return levenshtein_distance(s2, s1)
-
-    if len(s2) == 0:
-        return len(s1)
-
-    previous_row = list(range(len(s2) + 1))
-    for i, c1 in enumerate(s1):
-        current_row = [i + 1]
-        for j, c2 in enumerate(s2):
-            insertions = previous_row[j + 1] + 1
-            deletions = current_row[j] + 1
-            substitutions = previous_row[j] + (c1 != c2)
-            current_row.append(min(insertions, deletions, substitutions))
-        previous_row = current_row
-
-    return previous_row[-1]
+    # La distance ne dépasse jamais la longueur de la plus longue chaîne
+    return _lev(s1, s2, max(len(s1), len(s2)))
 
 
 def find_similar_variables(variable_name: str, available_vars: list[str], max_distance: int = 3) -> list[str]:
@@ -58,17 +122,196 @@ def find_similar_variables(variable_name: str, available_vars: list[str], max_di
     Returns:
         Liste des variables similaires, triée par similarité
     """
-    candidates = []
-    for var in available_vars:
-        distance = levenshtein_distance(variable_name.lower(), var.lower())
-        if distance <= max_distance:
-            candidates.append((distance, var))
+    target = variable_name.lower()
+    if len(available_vars) >= NUMBA_MIN_VARIABLES:
+        distances = _lev_many(target, [var.lower() for var in available_vars], max_distance)
+    else:
+        distances = [_lev(target, var.lower(), max_distance) for var in available_vars]
+
+    candidates = [
+        (distance, var)
+        for distance, var in zip(distances, available_vars, strict=True)
+        if distance <= max_distance
+    ]
 
     # Trier par distance puis par nom
     candidates.sort(key=lambda x: (x[0], x[1]))
     return [var for _, var in candidates]
 
 
+def _ev_var(expr: ast.Var, env: Mapping[str, bool]) -> bool:
+    """Évalue une variable (lookup dans l'environnement)."""
+    name = expr.name
+    if name not in env:
+        # Trouver des suggestions
+        raise UnknownVariableError(
+            variable_name=name,
+            suggestions=find_similar_variables(name, list(env.keys())),
+        )
+
+    value = env[name]
+    if not isinstance(value, bool):
+        raise TypeError(f"Valeur non booléenne pour '{name}': {value!r}")
+    return value
+
+
+def _ev_lit(expr: ast.BoolLit, env: Mapping[str, bool]) -> bool:
+    """Évalue un littéral booléen."""
+    return expr.value
+
+
+# Les opérateurs lisent directement les opérandes Var (cas le plus fréquent)
+# sans repasser par la table de dispatch ; _ev_var ne sert qu'aux cas
+# d'erreur (variable inconnue ou valeur non booléenne).
+
+
+def _ev_not(expr: ast.Not, env: Mapping[str, bool]) -> bool:
+    """Évalue une négation."""
+    operand = expr.expr
+    if type(operand) is ast.Var:
+        value = env.get(operand.name)
+        if type(value) is not bool:
+            value = _ev_var(operand, env)
+        return not value
+    return not _DISPATCH[type(operand)](operand, env)
+
+
+def _ev_chain(expr: ast.And | ast.Or, env: Mapping[str, bool], absorbing: bool) -> bool:
+    """Évalue une chaîne gauche A op B op C ... comme une réduction n-aire.
+
+    C'est la forme produite par le parser pour les opérateurs associatifs :
+    une boucle sur les opérandes, de gauche à droite, au lieu d'un appel
+    récursif par niveau. `absorbing` est la valeur qui court-circuite
+    (False pour AND, True pour OR).
+    """
+    chain_type = type(expr)
+    operands = [expr.right]
+    node = expr.left
+    while type(node) is chain_type:
+        operands.append(node.right)
+        node = node.left
+    operands.append(node)
+
+    for operand in reversed(operands):
+        if type(operand) is ast.Var:
+            value = env.get(operand.name)
+            if type(value) is not bool:
+                value = _ev_var(operand, env)
+        else:
+            value = _DISPATCH[type(operand)](operand, env)
+        if value is absorbing:
+            return absorbing
+    return not absorbing
+
+
+def _ev_and(expr: ast.And, env: Mapping[str, bool]) -> bool:
+    """Évalue une conjonction (court-circuit : FALSE AND _ → FALSE)."""
+    left = expr.left
+    if type(left) is ast.And:
+        return _ev_chain(expr, env, False)
+    if type(left) is ast.Var:
+        value = env.get(left.name)
+        if type(value) is not bool:
+            value = _ev_var(left, env)
+    else:
+        value = _DISPATCH[type(left)](left, env)
+    if not value:
+        return False
+
+    right = expr.right
+    if type(right) is ast.Var:
+        value = env.get(right.name)
+        if type(value) is not bool:
+            value = _ev_var(right, env)
+        return value
+    return _DISPATCH[type(right)](right, env)
+
+
+def _ev_or(expr: ast.Or, env: Mapping[str, bool]) -> bool:
+    """Évalue une disjonction (court-circuit : TRUE OR _ → TRUE)."""
+    left = expr.left
+    if type(left) is ast.Or:
+        return _ev_chain(expr, env, True)
+    if type(left) is ast.Var:
+        value = env.get(left.name)
+        if type(value) is not bool:
+            value = _ev_var(left, env)
+    else:
+        value = _DISPATCH[type(left)](left, env)
+    if value:
+        return True
+
+    right = expr.right
+    if type(right) is ast.Var:
+        value = env.get(right.name)
+        if type(value) is not bool:
+            value = _ev_var(right, env)
+        return value
+    return _DISPATCH[type(right)](right, env)
+
+
+# Table de dispatch par type de nœud (évite accept() + visit_* à chaque nœud)
+_DISPATCH: dict[type, Callable[[Any, Mapping[str, bool]], bool]] = {
+    ast.Var: _ev_var,
+    ast.BoolLit: _ev_lit,
+    ast.Not: _ev_not,
+    ast.And: _ev_and,
+    ast.Or: _ev_or,
+}
+
+
+# Continuations de l'évaluateur itératif
+_EVAL, _NOT, _AND, _OR = 0, 1, 2, 3
+
+
+def _evaluate_iterative(expr: ast.Expr, env: Mapping[str, bool]) -> bool:
+    """Évalue une expression avec une pile explicite (sans récursion Python).
+
+    Utilisé pour les AST plus profonds que la limite de récursion (ex. longues
+    chaînes A AND B AND C ...). Même sémantique que la table de dispatch,
+    court-circuit compris.
+    """
+    work: list[tuple[int, Any]] = [(_EVAL, expr)]
+    values: list[bool] = []
+    pop, push = work.pop, work.append
+
+    while work:
+        op, node = pop()
+        if op == _EVAL:
+            node_type = type(node)
+            if node_type is ast.Var:
+                value = env.get(node.name)
+                if type(value) is not bool:
+                    value = _ev_var(node, env)
+                values.append(value)
+            elif node_type is ast.And:
+                push((_AND, node))
+                push((_EVAL, node.left))
+            elif node_type is ast.Or:
+                push((_OR, node))
+                push((_EVAL, node.left))
+            elif node_type is ast.Not:
+                push((_NOT, node))
+                push((_EVAL, node.expr))
+            elif node_type is ast.BoolLit:
+                values.append(node.value)
+            else:
+                raise TypeError(f"Nœud AST inconnu : {node!r}")
+        elif op == _AND:
+            # Gauche vraie : le résultat est celui de l'opérande droit
+            if values[-1]:
+                values.pop()
+                push((_EVAL, node.right))
+        elif op == _OR:
+            if not values[-1]:
+                values.pop()
+                push((_EVAL, node.right))
+        else:  # _NOT
+            values[-1] = not values[-1]
+
+    return values[0]
+
+
 class Evaluator(ExprVisitor[bool]):
     """Visiteur d'évaluation d'expressions booléennes."""
 
@@ -81,6 +324,14 @@ class Evaluator(ExprVisitor[bool]):
         """
         self._env = env
         self.debug = debug
+        # Méthodes visit_* liées une fois pour toutes (évite accept() par nœud)
+        self._visit: dict[type, Callable[[Any], bool]] = {
+            ast.Var: self.visit_var,
+            ast.BoolLit: self.visit_bool_lit,
+            ast.Not: self.visit_not,
+            ast.And: self.visit_and,
+            ast.Or: self.visit_or,
+        }
 
     def evaluate(self, expr: ast.Expr) -> bool:
         """Évalue une expression booléenne.
@@ -94,7 +345,14 @@ class Evaluator(ExprVisitor[bool]):
         Raises:
             UnknownVariableError: Si une variable inconnue est référencée
         """
-        result = expr.accept(self)
+        if not self.debug:
+            try:
+                return _DISPATCH[type(expr)](expr, self._env)
+            except RecursionError:
+                # AST trop profond pour la pile Python : reprise itérative
+                return _evaluate_iterative(expr, self._env)
+
+        result = self._visit[type(expr)](expr)
         assert isinstance(result, bool)
         return result
 
@@ -103,19 +361,7 @@ class Evaluator(ExprVisitor[bool]):
         if self.debug:
             logger.debug(f"  [EVAL] Variable: {expr.name}")
 
-        if expr.name not in self._env:
-            # Trouver des suggestions
-            available_vars = list(self._env.keys())
-            suggestions = find_similar_variables(expr.name, available_vars)
-
-            raise UnknownVariableError(
-                variable_name=expr.name,
-                suggestions=suggestions,
-            )
-
-        value = self._env[expr.name]
-        if not isinstance(value, bool):
-            raise TypeError(f"Valeur non booléenne pour '{expr.name}': {value!r}")
+        value = _ev_var(expr, self._env)
 
         if self.debug:
             logger.debug(f"  [EVAL] {expr.name} = {value}")
@@ -132,7 +378,7 @@ class Evaluator(ExprVisitor[bool]):
         """Évalue une négation."""
         if self.debug:
             logger.debug("  [EVAL] NOT")
-        operand = expr.expr.accept(self)
+        operand = self._visit[type(expr.expr)](expr.expr)
         result = not operand
         if self.debug:
             logger.debug(f"  [EVAL] NOT {operand} = {result}")
@@ -140,26 +386,32 @@ class Evaluator(ExprVisitor[bool]):
 
     def visit_and(self, expr: ast.And) -> bool:
         """Évalue une conjonction."""
-        if self.debug:
-            logger.debug("  [EVAL] AND")
-        left = expr.left.accept(self)
-        # Évaluation paresseuse possible, mais on évalue les deux pour le debug
-        right = expr.right.accept(self)
+        if not self.debug:
+            if not self._visit[type(expr.left)](expr.left):
+                return False
+            return self._visit[type(expr.right)](expr.right)
+
+        logger.debug("  [EVAL] AND")
+        left = self._visit[type(expr.left)](expr.left)
+        # En mode debug, on évalue les deux opérandes pour tracer tout l'arbre
+        right = self._visit[type(expr.right)](expr.right)
         result = left and right
-        if self.debug:
-            logger.debug(f"  [EVAL] {left} AND {right} = {result}")
+        logger.debug(f"  [EVAL] {left} AND {right} = {result}")
         return result
 
     def visit_or(self, expr: ast.Or) -> bool:
         """Évalue une disjonction."""
-        if self.debug:
-            logger.debug("  [EVAL] OR")
-        left = expr.left.accept(self)
-        # Évaluation paresseuse possible, mais on évalue les deux pour le debug
-        right = expr.right.accept(self)
+        if not self.debug:
+            if self._visit[type(expr.left)](expr.left):
+                return True
+            return self._visit[type(expr.right)](expr.right)
+
+        logger.debug("  [EVAL] OR")
+        left = self._visit[type(expr.left)](expr.left)
+        # En mode debug, on évalue les deux opérandes pour tracer tout l'arbre
+        right = self._visit[type(expr.right)](expr.right)
         result = left or right
-        if self.debug:
-            logger.debug(f"  [EVAL] {left} OR {right} = {result}")
+        logger.debug(f"  [EVAL] {left} OR {right} = {result}")
         return result
 
 
@@ -178,3 +430,193 @@ def evaluate(expr: ast.Expr, env: Mapping[str, bool], debug: bool = False) -> bo
         UnknownVariableError: Si une variable inconnue est référencée
     """
     return Evaluator(env, debug=debug).evaluate(expr)
+
+
+# Au-delà, le compilateur Python refuse l'expression générée (trop imbriquée)
+_COMPILE_MAX_DEPTH = 100
+
+
+def _codegen(expr: ast.Expr, slots: dict[str, str], depth: int) -> str | None:
+    """Traduit un AST en expression Python ; None s'il est trop profond.
+
+    Chaque variable est lue une seule fois dans une locale (`slots` associe
+    le nom de la variable au nom de la locale).
+    """
+    if depth > _COMPILE_MAX_DEPTH:
+        return None
+    node_type = type(expr)
+    if node_type is ast.Var:
+        slot = slots.get(expr.name)
+        if slot is None:
+            slot = slots[expr.name] = f"v{len(slots)}"
+        return slot
+    if node_type is ast.BoolLit:
+        return "True" if expr.value else "False"
+    if node_type is ast.Not:
+        operand = _codegen(expr.expr, slots, depth + 1)
+        return None if operand is None else f"(not {operand})"
+    if node_type is ast.And or node_type is ast.Or:
+        left = _codegen(expr.left, slots, depth + 1)
+        if left is None:
+            return None
+        right = _codegen(expr.right, slots, depth + 1)
+        if right is None:
+            return None
+        op = "and" if node_type is ast.And else "or"
+        return f"({left} {op} {right})"
+    raise TypeError(f"Nœud AST inconnu : {expr!r}")
+
+
+def compile_expr(expr: ast.Expr) -> Callable[[Mapping[str, bool]], bool]:
+    """Compile un AST en fonction Python `env -> bool`, à réutiliser.
+
+    L'AST est traduit une fois en code source Python puis compilé : chaque
+    appel n'est plus qu'une expression `and`/`or`/`not` native, sans
+    parcours de l'arbre. Si une variable est absente ou non booléenne, la
+    fonction délègue à `evaluate`, qui applique le court-circuit et lève
+    l'erreur habituelle (suggestions comprises). Les AST trop profonds pour
+    le compilateur Python sont toujours évalués par `evaluate`.
+
+    Args:
+        expr: L'expression à compiler
+
+    Returns:
+        Fonction qui évalue l'expression dans un environnement
+    """
+    slots: dict[str, str] = {}
+    body = _codegen(expr, slots, 0)
+    if body is None:
+        return lambda env: evaluate(expr, env)
+
+    lines = ["def _compiled(env):"]
+    if slots:
+        lines.append("    get = env.get")
+        lines.extend(f"    {slot} = get({name!r})" for name, slot in slots.items())
+        checks = " or ".join(f"type({slot}) is not bool" for slot in slots.values())
+        lines.append(f"    if {checks}:")
+        lines.append("        return _evaluate(_expr, env)")
+    lines.append(f"    return {body}")
+
+    namespace: dict[str, Any] = {"_evaluate": evaluate, "_expr": expr}
+    exec(compile("\n".join(lines), "<compile_expr>", "exec"), namespace)
+    return namespace["_compiled"]
+
+
+def _eval_columns(expr: ast.Expr, columns: dict[str, Any], ones: Any) -> Any:
+    """Évalue un AST sur des colonnes de bits empaquetées.
+
+    Les colonnes sont des mots uint64 NumPy ou des entiers Python ; seuls
+    `&`, `|` et `^ ones` (négation masquée) sont utilisés, valides pour les deux.
+    Parcours postfixe à pile explicite (comme `_evaluate_iterative`, sans
+    court-circuit) : aucune limite de profondeur.
+    """
+    work: list[tuple[int, Any]] = [(_EVAL, expr)]
+    values: list[Any] = []
+    pop, push = work.pop, work.append
+
+    while work:
+        op, node = pop()
+        if op == _EVAL:
+            node_type = type(node)
+            if node_type is ast.Var:
+                column = columns.get(node.name)
+                if column is None:
+                    raise UnknownVariableError(
+                        variable_name=node.name,
+                        suggestions=find_similar_variables(node.name, list(columns)),
+                    )
+                values.append(column)
+            elif node_type is ast.And or node_type is ast.Or:
+                push((_AND if node_type is ast.And else _OR, node))
+                push((_EVAL, node.right))
+                push((_EVAL, node.left))
+            elif node_type is ast.Not:
+                push((_NOT, node))
+                push((_EVAL, node.expr))
+            elif node_type is ast.BoolLit:
+                values.append(ones if node.value else ones ^ ones)
+            else:
+                raise TypeError(f"Nœud AST inconnu : {node!r}")
+        elif op == _NOT:
+            values[-1] = ones ^ values[-1]
+        else:
+            right = values.pop()
+            values[-1] = values[-1] & right if op == _AND else values[-1] | right
+
+    return values[0]
+
+
+def evaluate_many(expr: ast.Expr, var_order: Sequence[str], assignments: Any) -> Any:
+    """Évalue une expression sur un lot d'affectations (ex. table de vérité).
+
+    Chaque variable devient une colonne de bits empaquetée en mots uint64 :
+    une opération `&`, `|` ou `~` évalue ainsi 64 affectations à la fois.
+
+    Args:
+        expr: L'expression à évaluer
+        var_order: Noms des variables, dans l'ordre des colonnes de `assignments`
+        assignments: Tableau (lignes × variables) de booléens
+
+    Returns:
+        Tableau NumPy de booléens, un résultat par ligne
+
+    Raises:
+        UnknownVariableError: Si une variable inconnue est référencée
+        ValueError: Si `assignments` n'a pas une colonne par variable
+        ImportError: Si NumPy n'est pas installé
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("evaluate_many nécessite NumPy (pip install numpy)") from None
+
+    table = np.asarray(assignments, dtype=bool)
+    if table.ndim != 2 or table.shape[1] != len(var_order):
+        raise ValueError(
+            f"Affectations de forme {table.shape} incompatibles avec {len(var_order)} variable(s)"
+        )
+
+    rows = table.shape[0]
+    words = (rows + 63) // 64
+    # 8 lignes par octet, complété à un multiple de 8 octets pour la vue uint64
+    packed = np.zeros((words * 8, len(var_order)), dtype=np.uint8)
+    packed[: (rows + 7) // 8] = np.packbits(table, axis=0)
+    columns = {
+        name: np.ascontiguousarray(packed[:, i]).view(np.uint64) for i, name in enumerate(var_order)
+    }
+    ones = np.full(words, np.iinfo(np.uint64).max, dtype=np.uint64)
+
+    result = _eval_columns(expr, columns, ones)
+    return np.unpackbits(result.view(np.uint8))[:rows].astype(bool)
+
+
+def truth_table(expr: ast.Expr, var_order: Sequence[str]) -> int:
+    """Évalue une expression sur les 2^k affectations de `var_order`, sans NumPy.
+
+    Chaque variable devient une colonne de 2^k bits portée par un entier
+    Python : une opération `&`, `|` ou `^` sur ces entiers évalue toutes les
+    lignes à la fois.
+
+    Args:
+        expr: L'expression à évaluer
+        var_order: Noms des k variables ; la première est le bit de poids fort
+            du numéro de ligne (ordre usuel d'une table de vérité)
+
+    Returns:
+        Entier dont le bit r est le résultat pour la ligne r, où la variable
+        i vaut le bit (k - 1 - i) de r
+
+    Raises:
+        UnknownVariableError: Si une variable inconnue est référencée
+    """
+    k = len(var_order)
+    rows = 1 << k
+    ones = (1 << rows) - 1
+    columns: dict[str, int] = {}
+    for i, name in enumerate(var_order):
+        # Motif périodique : `period` lignes à 0 puis `period` lignes à 1
+        period = 1 << (k - 1 - i)
+        block = ((1 << period) - 1) << period
+        repeat = ones // ((1 << (2 * period)) - 1)  # 1 tous les 2*period bits
+        columns[name] = block * repeat
+    return _eval_columns(expr, columns, ones)
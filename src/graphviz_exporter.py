@@ -6,11 +6,15 @@ l'arbre syntaxique abstrait (AST) sous forme de graphe.
 
 from __future__ import annotations
 
-from typing import TextIO
+import io
+from typing import Any, Callable, TextIO
 
 from . import ast
 from .visitors import ExprVisitor
 
+# Table d'échappement des labels DOT (un seul passage via str.translate)
+_ESCAPE_TABLE = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n"})
+
 
 class GraphvizExporter(ExprVisitor[int]):
     """Visiteur qui génère une représentation Graphviz de l'AST."""
@@ -23,7 +27,19 @@ class GraphvizExporter(ExprVisitor[int]):
         """
         self.output = output
         self.node_counter = 0
-        self.node_ids: dict[ast.Expr, int] = {}
+        # IDs indexés par identité de nœud : l'AST exporté reste vivant pendant
+        # tout l'export, donc id() ne peut pas être réutilisé entre-temps
+        self.node_ids: dict[int, int] = {}
+        # Lignes DOT accumulées puis écrites en une seule fois par export()
+        self._parts: list[str] = []
+        # Dispatch par type de nœud (évite la double indirection accept → visit_*)
+        self._visit: dict[type, Callable[[Any], int]] = {
+            ast.Var: self.visit_var,
+            ast.BoolLit: self.visit_bool_lit,
+            ast.Not: self.visit_not,
+            ast.And: self.visit_and,
+            ast.Or: self.visit_or,
+        }
 
     def export(self, expr: ast.Expr, graph_name: str = "AST") -> None:
         """Exporte un AST en format Graphviz DOT.
@@ -34,71 +50,81 @@ class GraphvizExporter(ExprVisitor[int]):
         """
         self.node_counter = 0
         self.node_ids = {}
-
-        self.output.write(f"digraph {graph_name} {{\n")
-        self.output.write("  node [shape=box, style=rounded];\n")
-        self.output.write("  edge [fontsize=10];\n\n")
+        self._parts = [
+            f"digraph {graph_name} {{\n"
+            "  node [shape=box, style=rounded];\n"
+            "  edge [fontsize=10];\n\n"
+        ]
 
         # Visiter l'AST pour générer les nœuds et arêtes
-        root_id = expr.accept(self)
+        root_id = self._visit[type(expr)](expr)
 
-        self.output.write('  root [label="ROOT", shape=ellipse, style=filled, fillcolor=lightblue];\n')
-        self.output.write(f"  root -> n{root_id};\n")
-        self.output.write("}\n")
+        self._parts.append(
+            '  root [label="ROOT", shape=ellipse, style=filled, fillcolor=lightblue];\n'
+            f"  root -> n{root_id};\n"
+            "}\n"
+        )
+        self.output.write("".join(self._parts))
+        self._parts = []
 
     def _get_node_id(self, expr: ast.Expr) -> int:
         """Obtient ou crée un ID unique pour un nœud."""
-        if expr not in self.node_ids:
+        key = id(expr)
+        node_id = self.node_ids.get(key)
+        if node_id is None:
             self.node_counter += 1
-            self.node_ids[expr] = self.node_counter
-        return self.node_ids[expr]
+            node_id = self.node_ids[key] = self.node_counter
+        return node_id
 
     def _escape_label(self, text: str) -> str:
         """Échappe les caractères spéciaux pour les labels DOT."""
-        # Remplacer les guillemets et caractères spéciaux
-        text = text.replace("\\", "\\\\")  # Échapper les backslashes d'abord
-        text = text.replace('"', '\\"')    # Échapper les guillemets
-        text = text.replace("\n", "\\n")   # Échapper les newlines
-        return text
+        # Backslashes, guillemets et newlines échappés en un seul passage
+        return text.translate(_ESCAPE_TABLE)
 
     def visit_var(self, expr: ast.Var) -> int:
         node_id = self._get_node_id(expr)
         # Échapper le nom de la variable
         name_escaped = self._escape_label(expr.name)
         label_text = f"Var\\n{name_escaped}"
-        self.output.write(f'  n{node_id} [label="{label_text}"];\n')
+        self._parts.append(f'  n{node_id} [label="{label_text}"];\n')
         return node_id
 
     def visit_bool_lit(self, expr: ast.BoolLit) -> int:
         node_id = self._get_node_id(expr)
         value_str = "TRUE" if expr.value else "FALSE"
         label_text = f"BoolLit\\n{value_str}"
-        self.output.write(f'  n{node_id} [label="{label_text}", fillcolor=lightgreen, style="rounded,filled"];\n')
+        self._parts.append(f'  n{node_id} [label="{label_text}", fillcolor=lightgreen, style="rounded,filled"];\n')
         return node_id
 
     def visit_not(self, expr: ast.Not) -> int:
         node_id = self._get_node_id(expr)
-        self.output.write('  n{node_id} [label="NOT", fillcolor=lightyellow, style="rounded,filled"];\n'.format(node_id=node_id))
-        operand_id = expr.expr.accept(self)
-        self.output.write(f'  n{node_id} -> n{operand_id} [label="expr"];\n')
+        operand_id = self._visit[type(expr.expr)](expr.expr)
+        self._parts.append(
+            f'  n{node_id} [label="NOT", fillcolor=lightyellow, style="rounded,filled"];\n'
+            f'  n{node_id} -> n{operand_id} [label="expr"];\n'
+        )
         return node_id
 
     def visit_and(self, expr: ast.And) -> int:
         node_id = self._get_node_id(expr)
-        self.output.write('  n{node_id} [label="AND", fillcolor=lightcoral, style="rounded,filled"];\n'.format(node_id=node_id))
-        left_id = expr.left.accept(self)
-        right_id = expr.right.accept(self)
-        self.output.write(f'  n{node_id} -> n{left_id} [label="left"];\n')
-        self.output.write(f'  n{node_id} -> n{right_id} [label="right"];\n')
+        left_id = self._visit[type(expr.left)](expr.left)
+        right_id = self._visit[type(expr.right)](expr.right)
+        self._parts.append(
+            f'  n{node_id} [label="AND", fillcolor=lightcoral, style="rounded,filled"];\n'
+            f'  n{node_id} -> n{left_id} [label="left"];\n'
+            f'  n{node_id} -> n{right_id} [label="right"];\n'
+        )
         return node_id
 
     def visit_or(self, expr: ast.Or) -> int:
         node_id = self._get_node_id(expr)
-        self.output.write('  n{node_id} [label="OR", fillcolor=lightcyan, style="rounded,filled"];\n'.format(node_id=node_id))
-        left_id = expr.left.accept(self)
-        right_id = expr.right.accept(self)
-        self.output.write(f'  n{node_id} -> n{left_id} [label="left"];\n')
-        self.output.write(f'  n{node_id} -> n{right_id} [label="right"];\n')
+        left_id = self._visit[type(expr.left)](expr.left)
+        right_id = self._visit[type(expr.right)](expr.right)
+        self._parts.append(
+            f'  n{node_id} [label="OR", fillcolor=lightcyan, style="rounded,filled"];\n'
+            f'  n{node_id} -> n{left_id} [label="left"];\n'
+            f'  n{node_id} -> n{right_id} [label="right"];\n'
+        )
         return node_id
 
 
@@ -116,3 +142,18 @@ def export_to_dot(expr: ast.Expr, output: TextIO | str, graph_name: str = "AST")
     else:
         exporter = GraphvizExporter(output)
         exporter.export(expr, graph_name)
+
+
+def export_to_dot_string(expr: ast.Expr, graph_name: str = "AST") -> str:
+    """Retourne le code Graphviz DOT d'un AST sous forme de chaîne.
+
+    Args:
+        expr: L'expression AST à exporter
+        graph_name: Nom du graphe
+
+    Returns:
+        Le code DOT complet
+    """
+    output = io.StringIO()
+    GraphvizExporter(output).export(expr, graph_name)
+    return output.getvalue()
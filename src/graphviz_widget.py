@@ -2,26 +2,104 @@
 
 from __future__ import annotations
 
+import hashlib
+import shutil
 import subprocess
-import tempfile
-from pathlib import Path
+from collections import OrderedDict
 
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QPixmap
-from PyQt6.QtWidgets import QLabel, QPushButton, QVBoxLayout, QWidget
+from PyQt6.QtCore import (
+    QByteArray,
+    QObject,
+    QProcess,
+    QRunnable,
+    Qt,
+    QThreadPool,
+    QTimer,
+    pyqtSignal,
+)
+from PyQt6.QtSvgWidgets import QSvgWidget
+from PyQt6.QtWidgets import QApplication, QLabel, QPushButton, QVBoxLayout, QWidget
 
 from . import ast
-from .graphviz_exporter import export_to_dot
+from .graphviz_exporter import export_to_dot_string
+
+# Durée maximale d'un rendu `dot` avant interruption
+DOT_TIMEOUT_MS = 10_000
+
+# Délai de regroupement des mises à jour successives du graphique
+DEBOUNCE_MS = 150
+
+# Balise fermante d'un document SVG : délimite les images émises par le serveur
+_SVG_END = b"</svg>"
+
+_DOT_MISSING_MESSAGE = (
+    "Graphviz n'est pas installé.\n\n"
+    "Installez Graphviz pour visualiser les AST:\n"
+    "https://graphviz.org/download/"
+)
+_DOT_TIMEOUT_MESSAGE = "Timeout: La génération du graphique a pris trop de temps."
+
+# Nombre maximal d'images rendues conservées en mémoire (éviction LRU)
+SVG_CACHE_SIZE = 32
+
+
+def _dot_failure_message(stderr: bytes) -> str:
+    """Construit le message d'erreur d'un `dot` terminé en échec."""
+    error_msg = "Erreur lors de la génération du graphique"
+    stderr_text = stderr.decode("utf-8", errors="ignore")
+    if stderr_text:
+        error_msg += f":\n{stderr_text[:200]}"
+    return error_msg
 
 
 class GraphvizWidget(QWidget):
     """Widget moderne pour afficher et exporter des graphiques Graphviz."""
 
+    # Réutiliser un processus `dot` persistant (désactivé automatiquement si
+    # `dot` ne répond pas graphe par graphe)
+    use_dot_server = True
+
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
         self.current_expr: ast.Expr | None = None
+        # Chemin de `dot`, résolu une seule fois (None si Graphviz est absent)
+        self._dot_program: str | None = shutil.which("dot")
+        # Rendu ponctuel en cours (processus `dot` dédié)
+        self._proc: QProcess | None = None
+        # Empreinte DOT de l'expression affichée et lot du rendu ponctuel en cours
+        self._current_key: bytes | None = None
+        self._render_batch: list[tuple[bytes, bytes]] = []
+        # Expressions à rendre en plus de l'expression courante (update_graphs)
+        self._prerender: list[ast.Expr] = []
+        # Code DOT et empreinte des dernières expressions exportées. Les nœuds
+        # AST portent un hash structurel précalculé : la recherche est en O(1)
+        self._dot_sources: OrderedDict[ast.Expr, tuple[bytes, bytes]] = OrderedDict()
+        # Document SVG actuellement chargé dans svg_widget
+        self._shown_svg: QByteArray | None = None
+        # Processus `dot` persistant, graphes attendus (FIFO) et lot en attente
+        self._dot_server: QProcess | None = None
+        self._server_buffer = QByteArray()
+        self._server_pending: list[tuple[bytes, bytes]] = []
+        self._queued: list[tuple[bytes, bytes]] | None = None
+        # Export PNG en cours dans le pool de threads (référence maintenue)
+        self._export_job: _ExportJob | None = None
+        # Images SVG déjà rendues, indexées par l'empreinte du code DOT
+        self._svg_cache: OrderedDict[bytes, QByteArray] = OrderedDict()
+        self._timeout_timer = QTimer(self)
+        self._timeout_timer.setSingleShot(True)
+        self._timeout_timer.timeout.connect(self._on_dot_timeout)
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(DEBOUNCE_MS)
+        self._debounce.timeout.connect(self._do_render)
         self._init_ui()
 
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._shutdown_server)
+        # Démarrer `dot` dès que la boucle d'événements tourne
+        QTimer.singleShot(0, self._warm_up)
+
     def _init_ui(self) -> None:
         """Initialise l'interface du widget."""
         layout = QVBoxLayout(self)
@@ -39,6 +117,15 @@ class GraphvizWidget(QWidget):
         self.image_label.setScaledContents(False)
         layout.addWidget(self.image_label, stretch=1)
 
+        # Rendu vectoriel de l'AST (remplace le label quand un graphe est affiché)
+        self.svg_widget = QSvgWidget()
+        self.svg_widget.setObjectName("graphvizSvgWidget")
+        renderer = self.svg_widget.renderer()
+        if hasattr(renderer, "setAspectRatioMode"):  # Qt >= 6.7
+            renderer.setAspectRatioMode(Qt.AspectRatioMode.KeepAspectRatio)
+        self.svg_widget.hide()
+        layout.addWidget(self.svg_widget, stretch=1)
+
         # Bouton d'export
         self.export_btn = QPushButton("Exporter Graphviz (PNG)")
         self.export_btn.setMinimumHeight(40)
@@ -48,137 +135,342 @@ class GraphvizWidget(QWidget):
 
     def update_graph(self, expr: ast.Expr) -> None:
         """Met à jour le graphique avec une nouvelle expression.
-        
-        Écrit UNIQUEMENT dans self.image_label.
-        IMPORTANT: Ne supprime JAMAIS les fichiers avant que QPixmap les ait chargés.
+
+        Les appels rapprochés (frappe au clavier) sont regroupés : seule la
+        dernière expression reçue pendant DEBOUNCE_MS est rendue par
+        `_do_render`. Une expression (structurellement) identique à celle déjà
+        affichée est ignorée.
         """
+        if self._is_displayed(expr):
+            return
         self.current_expr = expr
-        
-        dot_path = None
-        png_path = None
-        
-        try:
-            # Générer le fichier DOT
-            with tempfile.NamedTemporaryFile(mode="w", suffix=".dot", delete=False, encoding="utf-8") as f:
-                dot_path = f.name
-                export_to_dot(expr, dot_path)
+        self._debounce.start()
+
+    def _is_displayed(self, expr: ast.Expr) -> bool:
+        """Indique si l'image de `expr` est déjà affichée, sans rendu en attente."""
+        if self._debounce.isActive() or self._prerender or expr != self.current_expr:
+            return False
+        shown = self._shown_svg
+        return shown is not None and self._svg_cache.get(self._current_key) is shown
+
+    def update_graphs(self, exprs: list[ast.Expr]) -> None:
+        """Met à jour le graphique en rendant plusieurs expressions d'un coup.
 
-            # Générer le PNG
-            png_path = dot_path.replace(".dot", ".png")
+        La dernière expression est affichée ; les précédentes sont rendues par
+        la même invocation de `dot` et placées en cache, ce qui rend leur
+        affichage ultérieur immédiat.
+
+        Args:
+            exprs: Les expressions à rendre (la dernière est affichée)
+        """
+        if not exprs:
+            return
+        self._prerender = list(exprs[:-1])
+        self.update_graph(exprs[-1])
+
+    def _do_render(self) -> None:
+        """Rend l'expression courante (slot du minuteur de regroupement).
+
+        Le rendu est asynchrone : l'image est affichée quand `dot` a répondu.
+        Une image déjà rendue pour le même code DOT est réaffichée
+        immédiatement, sans solliciter `dot`. Les graphes manquants (expression
+        courante et expressions de `update_graphs`) forment un seul lot.
+
+        En mode serveur, un seul processus `dot` reçoit les graphes successifs
+        sur son entrée standard. Si un rendu est déjà en cours, le nouveau lot
+        est mis en attente (seul le plus récent est conservé).
+        """
+        expr = self.current_expr
+        if expr is None:
+            return
+        if self._dot_program is None:
+            self._prerender = []
+            self._show_message(_DOT_MISSING_MESSAGE)
+            return
+        prerender, self._prerender = self._prerender, []
+        self._queued = None
+
+        batch: list[tuple[bytes, bytes]] = []
+        for other in prerender:
             try:
-                result = subprocess.run(
-                    ["dot", "-Tpng", dot_path, "-o", png_path],
-                    check=True,
-                    capture_output=True,
-                    timeout=10,
-                )
-
-                # Vérifier que le fichier PNG existe et n'est pas vide
-                if not Path(png_path).exists() or Path(png_path).stat().st_size == 0:
-                    raise ValueError("Le fichier PNG généré est vide ou n'existe pas")
-
-                # CRITIQUE: Charger l'image COMPLÈTEMENT AVANT de supprimer les fichiers
-                # QPixmap doit avoir le fichier disponible pendant TOUT le chargement
-                pixmap = QPixmap()
-                
-                # Charger depuis le fichier
-                if not pixmap.load(png_path):
-                    raise ValueError("Impossible de charger le fichier PNG")
-                
-                # Vérifier que le pixmap est valide
-                if pixmap.isNull():
-                    raise ValueError("Le pixmap chargé est null")
-                
-                # Redimensionner si trop grand
-                if pixmap.width() > 1000 or pixmap.height() > 800:
-                    pixmap = pixmap.scaled(
-                        1000, 800,
-                        Qt.AspectRatioMode.KeepAspectRatio,
-                        Qt.TransformationMode.SmoothTransformation
-                    )
-
-                # Afficher l'image (le pixmap est maintenant complètement chargé en mémoire)
-                self.image_label.clear()
-                self.image_label.setPixmap(pixmap)
-                self.image_label.setText("")
-                self.image_label.repaint()
-                self.export_btn.setEnabled(True)
-                
-                # MAINTENANT on peut supprimer les fichiers (le pixmap est complètement chargé en mémoire)
-                if dot_path and Path(dot_path).exists():
-                    Path(dot_path).unlink(missing_ok=True)
-                if png_path and Path(png_path).exists():
-                    Path(png_path).unlink(missing_ok=True)
-                dot_path = None
-                png_path = None
-            except FileNotFoundError:
-                error_msg = (
-                    "Graphviz n'est pas installé.\n\n"
-                    "Installez Graphviz pour visualiser les AST:\n"
-                    "https://graphviz.org/download/"
-                )
-                self.image_label.clear()
-                self.image_label.setPixmap(QPixmap())
-                self.image_label.setText(error_msg)
-                self.image_label.repaint()
-                self.export_btn.setEnabled(False)
-            except FileNotFoundError:
-                error_msg = (
-                    "Graphviz n'est pas installé.\n\n"
-                    "Installez Graphviz pour visualiser les AST:\n"
-                    "https://graphviz.org/download/"
-                )
-                self.image_label.clear()
-                self.image_label.setPixmap(QPixmap())
-                self.image_label.setText(error_msg)
-                self.image_label.repaint()
-                self.export_btn.setEnabled(False)
-            except subprocess.TimeoutExpired:
-                error_msg = "Timeout: La génération du graphique a pris trop de temps."
-                self.image_label.clear()
-                self.image_label.setPixmap(QPixmap())
-                self.image_label.setText(error_msg)
-                self.image_label.repaint()
-                self.export_btn.setEnabled(False)
-            except subprocess.CalledProcessError as e:
-                error_msg = "Erreur lors de la génération du graphique"
-                try:
-                    if e.stderr:
-                        stderr_text = e.stderr.decode('utf-8', errors='ignore')
-                        error_msg += f":\n{stderr_text[:200]}"
-                except Exception:
-                    pass
-                self.image_label.clear()
-                self.image_label.setPixmap(QPixmap())
-                self.image_label.setText(error_msg)
-                self.image_label.repaint()
-                self.export_btn.setEnabled(False)
-            except Exception as e:
-                error_msg = f"Erreur inattendue: {str(e)[:200]}"
-                self.image_label.clear()
-                self.image_label.setPixmap(QPixmap())
-                self.image_label.setText(error_msg)
-                self.image_label.repaint()
-                self.export_btn.setEnabled(False)
+                dot_bytes, key = self._dot_source(other)
+            except Exception:
+                continue  # Seule l'erreur de l'expression affichée est signalée
+            batch.append((key, dot_bytes))
+
+        try:
+            dot_bytes, key = self._dot_source(expr)
         except Exception as e:
-            error_msg = f"Erreur lors de l'export DOT: {str(e)[:200]}"
-            self.image_label.clear()
-            self.image_label.setPixmap(QPixmap())
-            self.image_label.setText(error_msg)
-            self.export_btn.setEnabled(False)
-        finally:
-            # Nettoyer les fichiers temporaires s'ils existent encore (seulement si pas déjà supprimés)
-            if dot_path and Path(dot_path).exists():
-                Path(dot_path).unlink(missing_ok=True)
-            if png_path and Path(png_path).exists():
-                Path(png_path).unlink(missing_ok=True)
+            self._current_key = None
+            self._cancel_render()
+            self._show_message(f"Erreur lors de l'export DOT: {str(e)[:200]}")
+            return
+        self._current_key = key
+        batch.append((key, dot_bytes))
+
+        cached = self._svg_cache.get(key)
+        if cached is not None:
+            self._svg_cache.move_to_end(key)
+            if cached is not self._shown_svg:  # Déjà affiché : rien à recharger
+                self._show_svg(cached)
+
+        # Ne garder que les graphes ni en cache ni déjà en cours de rendu
+        in_flight = {k for k, _ in self._server_pending}
+        if self._proc is not None:
+            in_flight.update(k for k, _ in self._render_batch)
+        batch = [item for item in dict(batch).items() if item[0] not in self._svg_cache]
+        missing = [item for item in batch if item[0] not in in_flight]
+
+        if not self.use_dot_server:
+            if missing:
+                self._render_one_shot(batch)
+            elif not batch:
+                self._cancel_render()
+        elif not self._server_pending:
+            if batch:
+                self._render_on_server(batch)
+        elif missing:
+            self._queued = missing
+
+    def _dot_source(self, expr: ast.Expr) -> tuple[bytes, bytes]:
+        """Retourne le code DOT d'une expression et son empreinte blake2b.
+
+        Le résultat est mémorisé par expression (clé : hash structurel de
+        l'AST) : un rafraîchissement avec un AST inchangé ne le sérialise pas.
+        """
+        source = self._dot_sources.get(expr)
+        if source is not None:
+            self._dot_sources.move_to_end(expr)
+            return source
+        dot_bytes = export_to_dot_string(expr).encode("utf-8")
+        source = self._dot_sources[expr] = (dot_bytes, hashlib.blake2b(dot_bytes, digest_size=16).digest())
+        if len(self._dot_sources) > SVG_CACHE_SIZE:
+            self._dot_sources.popitem(last=False)
+        return source
+
+    # ------------------------------------------------------------------
+    # Mode serveur : processus `dot` persistant
+    # ------------------------------------------------------------------
+
+    def _render_on_server(self, batch: list[tuple[bytes, bytes]]) -> None:
+        """Envoie un lot de graphes au processus `dot` persistant (démarré au besoin)."""
+        self._server_pending.extend(batch)
+        self._timeout_timer.start(DOT_TIMEOUT_MS)
+        server = self._start_server()
+        if server is not None:
+            server.write(b"".join(dot_bytes for _, dot_bytes in batch))
+
+    def _start_server(self) -> QProcess | None:
+        """Démarre le processus `dot` persistant s'il ne tourne pas déjà.
+
+        Returns:
+            Le processus, ou None si son lancement a échoué
+        """
+        server = self._dot_server
+        if server is None:
+            server = QProcess(self)
+            server.setProgram(self._dot_program)
+            server.setArguments(["-Tsvg"])
+            server.readyReadStandardOutput.connect(self._on_server_output)
+            server.errorOccurred.connect(self._on_server_error)
+            server.finished.connect(self._on_server_finished)
+            self._dot_server = server
+            self._server_buffer.clear()
+            server.start()
+            if self._dot_server is not server:
+                return None  # Échec du lancement déjà traité par _on_server_error
+        return server
+
+    def _warm_up(self) -> None:
+        """Lance `dot` avant le premier rendu (binaire et plugins chargés à
+        l'avance, hors du chemin de la première mise à jour)."""
+        if self.use_dot_server and self._dot_server is None and self._dot_program is not None:
+            self._start_server()
+
+    def _on_server_output(self) -> None:
+        """Découpe les documents SVG émis par le serveur (fin = `</svg>`)."""
+        server = self.sender()
+        if server is not self._dot_server:
+            return
+        # Les données restent dans des QByteArray : pas de copie vers `bytes`
+        buffer = self._server_buffer
+        buffer.append(server.readAllStandardOutput())
+        while self._server_pending:
+            end = buffer.indexOf(_SVG_END)
+            if end == -1:
+                return
+            end += len(_SVG_END)
+            svg = buffer.left(end)
+            buffer.remove(0, end)
+            key, _ = self._server_pending.pop(0)
+            self._display_svg(key, svg)
+            self._timeout_timer.start(DOT_TIMEOUT_MS)
+
+        self._timeout_timer.stop()
+        if self._queued is not None:
+            batch, self._queued = self._queued, None
+            self._render_on_server(batch)
+
+    def _on_server_error(self, error: QProcess.ProcessError) -> None:
+        """Gère l'échec du serveur `dot` (slot de QProcess.errorOccurred)."""
+        if self.sender() is not self._dot_server:
+            return
+        if error == QProcess.ProcessError.FailedToStart:
+            self._shutdown_server()
+            if not self._server_pending:
+                return  # Préchauffage : le message attend une vraie demande de rendu
+            self._server_pending = []
+            self._queued = None
+            self._timeout_timer.stop()
+            self._show_message(_DOT_MISSING_MESSAGE)
+        else:
+            self._fall_back_to_one_shot()
+
+    def _on_server_finished(self, exit_code: int, exit_status: QProcess.ExitStatus) -> None:
+        """Le serveur `dot` s'est arrêté : repasser en mode ponctuel."""
+        if self.sender() is self._dot_server:
+            self._fall_back_to_one_shot()
+
+    def _fall_back_to_one_shot(self) -> None:
+        """Abandonne le mode serveur et relance les rendus encore attendus."""
+        self.use_dot_server = False
+        self._shutdown_server()
+        batch = self._server_pending + (self._queued or [])
+        self._server_pending = []
+        self._queued = None
+        self._timeout_timer.stop()
+        if batch:
+            self._render_one_shot(batch)
+
+    def _shutdown_server(self) -> None:
+        """Arrête le processus `dot` persistant (s'il existe)."""
+        server = self._dot_server
+        if server is None:
+            return
+        self._dot_server = None
+        server.blockSignals(True)
+        server.kill()
+        server.waitForFinished(1000)
+        server.deleteLater()
+
+    # ------------------------------------------------------------------
+    # Mode ponctuel : un processus `dot` par lot de graphes
+    # ------------------------------------------------------------------
+
+    def _render_one_shot(self, batch: list[tuple[bytes, bytes]]) -> None:
+        """Lance un processus `dot` dédié (DOT sur stdin, SVG sur stdout)."""
+        self._cancel_render()
+        self._render_batch = batch
+        proc = QProcess(self)
+        proc.setProgram(self._dot_program)
+        proc.setArguments(["-Tsvg"])
+        proc.finished.connect(self._on_dot_finished)
+        proc.errorOccurred.connect(self._on_dot_error)
+        self._proc = proc
+        self._timeout_timer.start(DOT_TIMEOUT_MS)
+        proc.start()
+        proc.write(b"".join(dot_bytes for _, dot_bytes in batch))
+        proc.closeWriteChannel()
+
+    def _on_dot_finished(self, exit_code: int, exit_status: QProcess.ExitStatus) -> None:
+        """Charge les SVG lus sur la sortie de `dot` (slot de QProcess.finished)."""
+        proc = self.sender()
+        if proc is not self._proc:
+            return  # Rendu obsolète (annulé entre-temps)
+        self._timeout_timer.stop()
+
+        if exit_status != QProcess.ExitStatus.NormalExit or exit_code != 0:
+            self._show_message(_dot_failure_message(bytes(proc.readAllStandardError())))
+        else:
+            # Un document SVG par graphe, dans l'ordre des entrées
+            output = proc.readAllStandardOutput()
+            start = 0
+            for key, _ in self._render_batch:
+                end = output.indexOf(_SVG_END, start)
+                end = output.size() if end == -1 else end + len(_SVG_END)
+                self._display_svg(key, output.mid(start, end - start))
+                start = end
+        self._finish_render()
+
+    def _on_dot_error(self, error: QProcess.ProcessError) -> None:
+        """Gère l'échec du lancement de `dot` (slot de QProcess.errorOccurred)."""
+        if self.sender() is not self._proc:
+            return
+        # Les autres erreurs (crash, ...) sont traitées par _on_dot_finished
+        if error == QProcess.ProcessError.FailedToStart:
+            self._timeout_timer.stop()
+            self._show_message(_DOT_MISSING_MESSAGE)
+            self._finish_render()
+
+    def _on_dot_timeout(self) -> None:
+        """Interrompt un rendu `dot` trop long."""
+        if self._server_pending:
+            # Le serveur ne répond pas (sortie bufferisée ?) : mode ponctuel
+            self._fall_back_to_one_shot()
+            return
+        if self._proc is None:
+            return
+        self._cancel_render()
+        self._show_message(_DOT_TIMEOUT_MESSAGE)
+
+    def _cancel_render(self) -> None:
+        """Annule le rendu ponctuel en cours (s'il y en a un)."""
+        proc = self._proc
+        if proc is not None:
+            self._timeout_timer.stop()
+            self._proc = None
+            proc.blockSignals(True)
+            proc.kill()
+            proc.waitForFinished(1000)
+            proc.deleteLater()
+
+    def _finish_render(self) -> None:
+        """Libère le processus `dot` terminé."""
+        if self._proc is not None:
+            self._proc.deleteLater()
+            self._proc = None
+
+    def _display_svg(self, key: bytes, svg: QByteArray) -> None:
+        """Met en cache une image SVG rendue par `dot` et l'affiche si elle
+        correspond toujours à l'expression courante."""
+        # Le saut de ligne qui suit `</svg>` arrive en tête du document suivant
+        data = svg.trimmed()
+        if key == self._current_key and not self._show_svg(data):
+            return
+        self._svg_cache[key] = data
+        if len(self._svg_cache) > SVG_CACHE_SIZE:
+            self._svg_cache.popitem(last=False)
+
+    def _show_svg(self, data: QByteArray) -> bool:
+        """Affiche une image SVG, mise à l'échelle par QSvgWidget.
+
+        Returns:
+            False si le document SVG est invalide (un message est alors affiché)
+        """
+        self.svg_widget.load(data)
+        if not self.svg_widget.renderer().isValid():
+            self._show_message("Erreur inattendue: Impossible de charger l'image SVG produite par dot")
+            return False
+        self._shown_svg = data
+        self.image_label.hide()
+        self.svg_widget.show()
+        self.export_btn.setEnabled(True)
+        return True
+
+    def _show_message(self, message: str) -> None:
+        """Remplace l'image par un message (erreur ou information)."""
+        self._shown_svg = None
+        self.svg_widget.hide()
+        self.image_label.setText(message)
+        self.image_label.show()
+        self.export_btn.setEnabled(False)
 
     def _export_png(self) -> None:
         """Exporte le graphique actuel en PNG."""
         if self.current_expr is None:
             return
 
-        from PyQt6.QtWidgets import QFileDialog, QMessageBox
+        from PyQt6.QtWidgets import QFileDialog
 
         filename, _ = QFileDialog.getSaveFileName(
             self,
@@ -188,28 +480,81 @@ class GraphvizWidget(QWidget):
         )
 
         if filename:
-            try:
-                with tempfile.NamedTemporaryFile(mode="w", suffix=".dot", delete=False, encoding="utf-8") as f:
-                    dot_path = f.name
-                    export_to_dot(self.current_expr, dot_path)
-
-                subprocess.run(
-                    ["dot", "-Tpng", dot_path, "-o", filename],
-                    check=True,
-                    capture_output=True,
-                )
-
-                Path(dot_path).unlink(missing_ok=True)
-
-                msg = QMessageBox(self)
-                msg.setIcon(QMessageBox.Icon.Information)
-                msg.setWindowTitle("Export réussi")
-                msg.setText(f"Graphique exporté vers:\n{filename}")
-                msg.exec()
-
-            except Exception as e:
-                msg = QMessageBox(self)
-                msg.setIcon(QMessageBox.Icon.Critical)
-                msg.setWindowTitle("Erreur d'export")
-                msg.setText(f"Erreur lors de l'export:\n{e}")
-                msg.exec()
+            self._start_export(filename)
+
+    def _start_export(self, filename: str) -> None:
+        """Lance l'export PNG dans le pool de threads (l'interface reste réactive)."""
+        if self._dot_program is None:
+            self._on_export_finished(filename, _DOT_MISSING_MESSAGE)
+            return
+        try:
+            dot_bytes = self._dot_source(self.current_expr)[0]
+        except Exception as e:
+            self._on_export_finished(filename, str(e))
+            return
+
+        job = _ExportJob(self._dot_program, dot_bytes, filename)
+        job.signals.finished.connect(self._on_export_finished)
+        self._export_job = job
+        self.export_btn.setEnabled(False)
+        QThreadPool.globalInstance().start(job)
+
+    def _on_export_finished(self, filename: str, error: str) -> None:
+        """Affiche le résultat de l'export (slot appelé dans le thread GUI)."""
+        from PyQt6.QtWidgets import QMessageBox
+
+        self._export_job = None
+        self.export_btn.setEnabled(self.svg_widget.isVisibleTo(self))
+
+        msg = QMessageBox(self)
+        if error:
+            msg.setIcon(QMessageBox.Icon.Critical)
+            msg.setWindowTitle("Erreur d'export")
+            msg.setText(f"Erreur lors de l'export:\n{error}")
+        else:
+            msg.setIcon(QMessageBox.Icon.Information)
+            msg.setWindowTitle("Export réussi")
+            msg.setText(f"Graphique exporté vers:\n{filename}")
+        msg.exec()
+
+
+# Messages des échecs de l'export PNG, par type d'exception (défaut : str(e))
+_EXPORT_ERRORS: dict[type[Exception], str] = {
+    FileNotFoundError: _DOT_MISSING_MESSAGE,
+    subprocess.TimeoutExpired: _DOT_TIMEOUT_MESSAGE,
+}
+
+
+class _ExportSignals(QObject):
+    """Signaux d'un export PNG (QRunnable n'est pas un QObject)."""
+
+    # Nom du fichier, message d'erreur (vide en cas de succès)
+    finished = pyqtSignal(str, str)
+
+
+class _ExportJob(QRunnable):
+    """Exécute `dot -Tpng` hors du thread GUI pour l'export d'un fichier."""
+
+    def __init__(self, dot_program: str, dot_bytes: bytes, filename: str) -> None:
+        super().__init__()
+        self.dot_program = dot_program
+        self.dot_bytes = dot_bytes
+        self.filename = filename
+        self.signals = _ExportSignals()
+
+    def run(self) -> None:
+        error = ""
+        try:
+            subprocess.run(
+                [self.dot_program, "-Tpng", "-o", self.filename],
+                input=self.dot_bytes,
+                check=True,
+                capture_output=True,
+                timeout=DOT_TIMEOUT_MS / 1000,
+            )
+        except subprocess.CalledProcessError as e:
+            error = _dot_failure_message(e.stderr or b"")
+        except Exception as e:
+            template = _EXPORT_ERRORS.get(type(e), "{}")
+            error = template.format(e)
+        self.signals.finished.emit(self.filename, error)
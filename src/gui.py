@@ -10,13 +10,24 @@ Interface graphique professionnelle avec :
 
 from __future__ import annotations
 
+import functools
 import json
 import sys
 import warnings
 from pathlib import Path
 from typing import Dict
 
-from PyQt6.QtCore import QEasingCurve, QPropertyAnimation, QTimer, Qt
+from PyQt6.QtCore import (
+    QEasingCurve,
+    QObject,
+    QPropertyAnimation,
+    QRunnable,
+    QSignalBlocker,
+    Qt,
+    QThreadPool,
+    QTimer,
+    pyqtSignal,
+)
 from PyQt6.QtGui import QDragEnterEvent, QDropEvent, QFont
 from PyQt6.QtWidgets import (
     QApplication,
@@ -38,25 +49,188 @@ from PyQt6.QtWidgets import (
 )
 
 from . import ast
-from .about_dialog import AboutDialog
-from .evaluator import evaluate
+from .evaluator import compile_expr
 from .errors import CompilerError, LexicalError, ParseError
 from .graphviz_widget import GraphvizWidget
 from .optimizer import optimize
-from .parser import parse
+from .parser import Parser
 from .pretty import pretty_print as smart_pretty_print
 from .syntax_highlighter import LogicalExpressionHighlighter
-from .tokenizer import debug_tokens, tokenize
+from .tokenizer import Token, TokenType, debug_tokens, tokenize
+
+try:
+    import orjson
+except ImportError:  # orjson est optionnel : fallback sur json (plus lent)
+    HAS_ORJSON = False
+else:
+    HAS_ORJSON = True
 
 # Supprimer les warnings QSS
 warnings.filterwarnings("ignore")
 
+# Délai de regroupement de l'auto-évaluation (expression et environnement)
+AUTO_EVAL_DELAY_MS = 200
+
+# Valeurs (en minuscules) considérées comme vraies dans l'environnement
+_TRUTHY = frozenset({"true", "1", "yes", "on"})
+
+# Taille des caches des étapes de la chaîne de compilation (par source ou par AST)
+_PIPELINE_CACHE_SIZE = 64
+
+
+@functools.lru_cache(maxsize=1)
+def _read_qss() -> str:
+    """Lit le fichier de style QSS une seule fois (chaîne vide s'il est absent)."""
+    style_path = Path(__file__).parent / "style.qss"
+    try:
+        return style_path.read_text(encoding="utf-8")
+    except OSError:
+        return ""
+
+
+@functools.lru_cache(maxsize=_PIPELINE_CACHE_SIZE)
+def _cached_tokens(source: str) -> tuple[Token, ...]:
+    """Tokenise une source (mémorisé ; les erreurs ne sont pas mises en cache)."""
+    return tuple(tokenize(source))
+
+
+@functools.lru_cache(maxsize=_PIPELINE_CACHE_SIZE)
+def _cached_parse(source: str) -> ast.Expr:
+    """Parse une source à partir de ses tokens mémorisés (mémorisé)."""
+    return Parser(tokens=list(_cached_tokens(source)), source=source).parse_expression()
+
+
+@functools.lru_cache(maxsize=_PIPELINE_CACHE_SIZE)
+def _cached_tokens_text(source: str) -> str:
+    """Retourne l'affichage des tokens d'une source (mémorisé)."""
+    return debug_tokens(_cached_tokens(source))
+
+
+def _warm_pipeline(source: str) -> None:
+    """Calcule (et met en cache) toutes les étapes d'affichage d'une source.
+
+    Les erreurs de compilation ne sont pas mises en cache : elles seront
+    relevées à nouveau, et signalées, par le thread GUI.
+    """
+    _cached_tokens_text(source)
+    expr = _cached_parse(source)
+    _cached_ast_text(expr)
+    _cached_pretty(expr)
+    _cached_json_text(expr)
+
+
+class _CompileSignals(QObject):
+    """Signaux d'une compilation en arrière-plan (QRunnable n'est pas un QObject)."""
+
+    # Numéro de génération de la compilation terminée
+    finished = pyqtSignal(int)
+
+
+class _CompileWorker(QRunnable):
+    """Exécute la chaîne de compilation hors du thread GUI (remplit les caches)."""
+
+    def __init__(self, generation: int, source: str) -> None:
+        super().__init__()
+        self.generation = generation
+        self.source = source
+        self.signals = _CompileSignals()
+
+    def run(self) -> None:
+        try:
+            _warm_pipeline(self.source)
+        except Exception:
+            pass  # Erreur signalée par le thread GUI lors de l'affichage
+        self.signals.finished.emit(self.generation)
+
+
+def _token_signature(tokens: tuple[Token, ...]) -> tuple[tuple[TokenType, str], ...]:
+    """Tokens sans leurs positions : égaux si seuls espaces/commentaires diffèrent."""
+    return tuple((token.type, token.lexeme) for token in tokens)
+
+
+# Les caches suivants sont indexés par l'AST lui-même : les nœuds portent un
+# hash structurel précalculé et sont partagés par le parser (hash-consing)
+
+
+@functools.lru_cache(maxsize=_PIPELINE_CACHE_SIZE)
+def _cached_ast_text(expr: ast.Expr) -> str:
+    """Retourne l'arbre indenté d'un AST (mémorisé)."""
+    return ast.pretty_print(expr)
+
+
+@functools.lru_cache(maxsize=_PIPELINE_CACHE_SIZE)
+def _cached_pretty(expr: ast.Expr) -> str:
+    """Retourne l'expression reformatée d'un AST (mémorisé)."""
+    return smart_pretty_print(expr)
+
+
+@functools.lru_cache(maxsize=_PIPELINE_CACHE_SIZE)
+def _cached_json_text(expr: ast.Expr) -> str:
+    """Retourne la sérialisation JSON indentée d'un AST (mémorisé)."""
+    data = expr.to_json()
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+        except orjson.JSONEncodeError:
+            pass  # Imbrication au-delà de la limite d'orjson (255 niveaux)
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+# AST compilé en fonction `env -> bool` : réévaluer après un changement
+# d'environnement ne reparcourt plus l'arbre
+_cached_compiled = functools.lru_cache(maxsize=_PIPELINE_CACHE_SIZE)(compile_expr)
+
+
+def parse_environment(env_str: str) -> Dict[str, bool]:
+    """Parse une chaîne d'environnement (`A=true,B=false`) en dictionnaire.
+
+    Les valeurs reconnues comme vraies sont `true`, `1`, `yes` et `on` ; toute
+    autre valeur vaut False. Les paires sans `=` sont ignorées.
+    """
+    env: Dict[str, bool] = {}
+    for pair in env_str.split(","):
+        key, sep, value = pair.partition("=")
+        if sep:
+            env[key.strip()] = value.strip().lower() in _TRUTHY
+    return env
+
+
+class _FadeInAnimator:
+    """Fondu d'apparition réutilisable (opacité uniquement).
+
+    Un seul QGraphicsOpacityEffect et une seule QPropertyAnimation sont créés,
+    puis déplacés vers le widget à animer : aucun QObject n'est alloué par
+    fondu. Hors animation, l'effet est désactivé (rendu direct du widget).
+    """
+
+    def __init__(self, parent: QWidget) -> None:
+        self._effect = QGraphicsOpacityEffect(parent)
+        self._effect.setEnabled(False)
+        self._animation = QPropertyAnimation(self._effect, b"opacity", parent)
+        self._animation.setStartValue(0.3)
+        self._animation.setEndValue(1.0)
+        self._animation.setDuration(200)
+        self._animation.finished.connect(self._on_finished)
+
+    def fade_in(self, widget: QWidget) -> None:
+        """Anime l'apparition d'un widget. Ne modifie JAMAIS sa visibilité."""
+        self._animation.stop()
+        if widget.graphicsEffect() is not self._effect:
+            # L'effet est retiré de son widget précédent (sans être détruit)
+            widget.setGraphicsEffect(self._effect)
+        self._effect.setEnabled(True)
+        self._animation.start()
+
+    def _on_finished(self) -> None:
+        self._effect.setEnabled(False)
+
 
 class AnimatedTabWidget(QTabWidget):
     """QTabWidget avec animations fluides lors du changement d'onglet."""
 
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
+        self._fader = _FadeInAnimator(self)
         self.currentChanged.connect(self._animate_tab_change)
 
     def _animate_tab_change(self, index: int) -> None:
@@ -67,20 +241,7 @@ class AnimatedTabWidget(QTabWidget):
         widget = self.widget(index)
         if widget is None:
             return
-
-        try:
-            opacity_effect = QGraphicsOpacityEffect(widget)
-            widget.setGraphicsEffect(opacity_effect)
-
-            animation = QPropertyAnimation(opacity_effect, b"opacity")
-            animation.setStartValue(0.3)
-            animation.setEndValue(1.0)
-            animation.setDuration(200)
-            animation.start()
-
-            animation.finished.connect(lambda: widget.setGraphicsEffect(None))
-        except Exception:
-            widget.setGraphicsEffect(None)
+        self._fader.fade_in(widget)
 
 
 class LogicalExpressionApp(QMainWindow):
@@ -90,10 +251,27 @@ class LogicalExpressionApp(QMainWindow):
         super().__init__()
         self.current_expr: ast.Expr | None = None
         self.current_source: str = ""
+        # Source (et ses tokens sans positions) dont les onglets affichent
+        # actuellement le résultat complet
+        self._rendered_source: str | None = None
+        self._rendered_signature: tuple[tuple[TokenType, str], ...] | None = None
+        # Texte affiché par chaque onglet (par objectName), pour éviter de
+        # relancer la mise en page du QTextDocument avec un contenu identique
+        self._displayed_content: dict[str, str] = {}
+        # Dernier environnement analysé : (chaîne brute, dictionnaire)
+        self._env_cache: tuple[str, Dict[str, bool]] | None = None
         self.auto_eval_enabled = False
+        self._fader: _FadeInAnimator | None = None
+        # Un seul minuteur pour les deux champs ; les demandes sont cumulées
+        # ("full" : expression modifiée, "eval" : environnement modifié)
+        self._pending_intent: set[str] = set()
+        # Compilation en arrière-plan : seule la plus récente est affichée
+        self._compile_generation = 0
+        self._compile_worker: _CompileWorker | None = None
         self.auto_eval_timer = QTimer()
         self.auto_eval_timer.setSingleShot(True)
-        self.auto_eval_timer.timeout.connect(self.on_evaluate_clicked)
+        self.auto_eval_timer.setInterval(AUTO_EVAL_DELAY_MS)
+        self.auto_eval_timer.timeout.connect(self._on_auto_eval_timeout)
         
         self._setup_ui()
         self._load_style()
@@ -153,7 +331,7 @@ class LogicalExpressionApp(QMainWindow):
         dark_mode_action = options_menu.addAction("Mode sombre")
         dark_mode_action.setCheckable(True)
         dark_mode_action.setChecked(True)
-        dark_mode_action.triggered.connect(lambda checked: self._load_style())
+        dark_mode_action.triggered.connect(self._load_style)
 
         # Menu Aide
         help_menu = menubar.addMenu("Aide")
@@ -320,21 +498,20 @@ class LogicalExpressionApp(QMainWindow):
             if file_path.suffix in [".txt", ".expr", ".logical"]:
                 try:
                     content = file_path.read_text(encoding="utf-8").strip()
-                    self.expression_input.setPlainText(content)
-                    if self.auto_eval_enabled:
-                        self.on_evaluate_clicked()
+                    self._set_expression_text(content)
                 except Exception as e:
                     self.show_error(f"Erreur lors du chargement: {e}")
 
-    def _load_style(self) -> None:
-        """Charge le fichier de style QSS."""
-        style_path = Path(__file__).parent / "style.qss"
-        if style_path.exists():
-            try:
-                with open(style_path, "r", encoding="utf-8") as f:
-                    self.setStyleSheet(f.read())
-            except Exception:
-                pass
+    def _load_style(self, dark: bool = True) -> None:
+        """Applique le style QSS (mis en cache) ou le style Qt par défaut.
+
+        Args:
+            dark: Si True, applique le thème sombre de style.qss
+        """
+        style = _read_qss() if dark else ""
+        # Re-polir toute la fenêtre est coûteux : ne rien faire si inchangé
+        if style != self.styleSheet():
+            self.setStyleSheet(style)
 
     def _load_file(self) -> None:
         """Charge un fichier depuis le menu."""
@@ -347,18 +524,31 @@ class LogicalExpressionApp(QMainWindow):
         if filename:
             try:
                 content = Path(filename).read_text(encoding="utf-8").strip()
-                self.expression_input.setPlainText(content)
-                if self.auto_eval_enabled:
-                    self.on_evaluate_clicked()
+                self._set_expression_text(content)
             except Exception as e:
                 self.show_error(f"Erreur lors du chargement: {e}")
 
+    def _set_expression_text(self, content: str) -> None:
+        """Remplace l'expression par programme (fichier chargé ou déposé).
+
+        `textChanged` est bloqué pendant le remplacement : l'auto-évaluation
+        est lancée directement, sans passer par le minuteur.
+        """
+        with QSignalBlocker(self.expression_input):
+            self.expression_input.setPlainText(content)
+        self.error_label.hide()
+        self.current_source = content
+        if self.auto_eval_enabled:
+            self.on_evaluate_clicked()
+
     def _toggle_auto_eval(self, enabled: bool) -> None:
         """Active/désactive l'auto-évaluation."""
         self.auto_eval_enabled = enabled
 
     def _show_about(self) -> None:
         """Affiche la fenêtre À propos."""
+        from .about_dialog import AboutDialog
+
         dialog = AboutDialog(self)
         dialog.exec()
 
@@ -366,47 +556,93 @@ class LogicalExpressionApp(QMainWindow):
         """Appelé quand l'expression change."""
         self.error_label.hide()
         self.current_source = self.expression_input.toPlainText()
+        if self.current_source.strip() == self._rendered_source:
+            return  # Retour au texte déjà affiché : rien à recalculer
         if self.auto_eval_enabled:
-            self.auto_eval_timer.stop()
-            self.auto_eval_timer.start(500)
+            self._pending_intent.add("full")
+            self._arm_auto_eval_timer()
 
     def _on_env_changed(self) -> None:
         """Appelé quand l'environnement change."""
         if self.auto_eval_enabled and self.current_expr:
-            self.auto_eval_timer.stop()
-            self.auto_eval_timer.start(300)
+            self._pending_intent.add("eval")
+            self._arm_auto_eval_timer()
+
+    def _arm_auto_eval_timer(self) -> None:
+        """Démarre le minuteur d'auto-évaluation s'il n'est pas déjà armé.
+
+        Les frappes suivantes ne le relancent pas (limitation de débit) : au
+        plus une évaluation par AUTO_EVAL_DELAY_MS pendant la saisie, au lieu
+        de redémarrer le minuteur à chaque caractère.
+        """
+        if not self.auto_eval_timer.isActive():
+            self.auto_eval_timer.start()
+
+    def _on_auto_eval_timeout(self) -> None:
+        """Exécute les demandes d'auto-évaluation regroupées par le minuteur.
+
+        Une modification de l'environnement seule ne relance que l'évaluation
+        (pas de tokens, AST, JSON ni rendu Graphviz).
+        """
+        intent = self._pending_intent
+        self._pending_intent = set()
+        if "full" in intent:
+            self._start_background_compile()
+        elif intent:
+            self.update_result_only()
+
+    def _start_background_compile(self) -> None:
+        """Compile l'expression saisie dans le pool de threads.
+
+        Le worker remplit les caches de la chaîne de compilation ; à la fin,
+        `on_evaluate_clicked` met les onglets à jour sans recalcul.
+        """
+        source = self.expression_input.toPlainText().strip()
+        if not source or source == self._rendered_source:
+            self.on_evaluate_clicked()  # Rien de coûteux à déporter
+            return
+        self._compile_generation += 1
+        worker = _CompileWorker(self._compile_generation, source)
+        worker.signals.finished.connect(self._on_background_compile_finished)
+        self._compile_worker = worker
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_background_compile_finished(self, generation: int) -> None:
+        """Affiche le résultat d'une compilation en arrière-plan (thread GUI)."""
+        worker = self._compile_worker
+        if generation != self._compile_generation or worker is None:
+            return  # Compilation obsolète
+        self._compile_worker = None
+        if self.expression_input.toPlainText().strip() != worker.source:
+            return  # Texte modifié entre-temps : une nouvelle compilation suivra
+        self.on_evaluate_clicked()
 
     def _animate_fade_in(self, widget: QWidget) -> None:
         """Anime un widget avec un fade-in fluide (opacité uniquement).
         
         IMPORTANT: Ne modifie JAMAIS la visibilité du widget.
         """
-        try:
-            opacity_effect = QGraphicsOpacityEffect(widget)
-            widget.setGraphicsEffect(opacity_effect)
-
-            animation = QPropertyAnimation(opacity_effect, b"opacity")
-            animation.setStartValue(0.3)
-            animation.setEndValue(1.0)
-            animation.setDuration(200)
-            animation.start()
-
-            animation.finished.connect(lambda: widget.setGraphicsEffect(None))
-        except Exception:
-            widget.setGraphicsEffect(None)
+        if self._fader is None:
+            self._fader = _FadeInAnimator(self)
+        self._fader.fade_in(widget)
 
     def _update_widget_content(self, widget: QTextEdit, content: str) -> None:
         """Met à jour le contenu d'un widget de manière isolée.
         
-        Version simplifiée : juste setPlainText() + repaint().
-        Ne modifie JAMAIS la visibilité.
+        Version simplifiée : juste setPlainText() + repaint(), ignorés si le
+        widget affiche déjà ce contenu. Ne modifie JAMAIS la visibilité.
         """
         if widget is None:
             return
         
         # Vérification d'isolation
-        assert widget.objectName() in ["tokensText", "astText", "prettyText", "optimizedText", "jsonText"], \
-            f"Widget {widget.objectName()} non autorisé!"
+        name = widget.objectName()
+        assert name in ["tokensText", "astText", "prettyText", "optimizedText", "jsonText"], \
+            f"Widget {name} non autorisé!"
+        
+        if self._displayed_content.get(name) == content:
+            return
+        self._displayed_content[name] = content
         
         # Mettre le texte et forcer le rafraîchissement
         widget.setPlainText(content)
@@ -418,8 +654,7 @@ class LogicalExpressionApp(QMainWindow):
             return
 
         try:
-            tokens = tokenize(source)
-            tokens_str = debug_tokens(tokens)
+            tokens_str = _cached_tokens_text(source)
             self._update_widget_content(self.tokens_text, tokens_str)
         except Exception as e:
             if self.tokens_text is not None:
@@ -431,7 +666,7 @@ class LogicalExpressionApp(QMainWindow):
             return
 
         try:
-            ast_str = ast.pretty_print(expr)
+            ast_str = _cached_ast_text(expr)
             self._update_widget_content(self.ast_text, ast_str)
         except Exception as e:
             if self.ast_text is not None:
@@ -443,12 +678,12 @@ class LogicalExpressionApp(QMainWindow):
             return
 
         try:
-            pretty_str = smart_pretty_print(expr)
+            pretty_str = _cached_pretty(expr)
             if show_result:
                 env_str = self.environment_input.text()
                 env = self.parse_environment(env_str)
                 try:
-                    result = evaluate(expr, env)
+                    result = _cached_compiled(expr)(env)
                     pretty_str = f"Résultat: {result}\n\nExpression: {pretty_str}\n\nEnvironnement: {env}"
                 except Exception as e:
                     pretty_str = f"Expression: {pretty_str}\n\nErreur d'évaluation: {e}"
@@ -464,7 +699,7 @@ class LogicalExpressionApp(QMainWindow):
             return
 
         try:
-            ast_str = ast.pretty_print(expr)
+            ast_str = _cached_ast_text(expr)
             self._update_widget_content(self.optimized_text, ast_str)
         except Exception as e:
             if self.optimized_text is not None:
@@ -476,25 +711,42 @@ class LogicalExpressionApp(QMainWindow):
             return
 
         try:
-            json_data = expr.to_json()
-            json_str = json.dumps(json_data, indent=2, ensure_ascii=False)
+            json_str = _cached_json_text(expr)
             self._update_widget_content(self.json_text, json_str)
         except Exception as e:
             if self.json_text is not None:
                 self._update_widget_content(self.json_text, f"Erreur: {e}")
 
-    def update_graphviz_tab(self, expr: ast.Expr) -> None:
-        """Met à jour l'onglet Graphviz."""
+    def update_graphviz_tab(self, expr: ast.Expr, *also_render: ast.Expr) -> None:
+        """Met à jour l'onglet Graphviz.
+
+        Args:
+            expr: L'expression à afficher
+            *also_render: Expressions rendues dans le même appel à `dot` et mises
+                en cache (affichage immédiat si elles sont demandées ensuite)
+        """
         if self.graphviz_widget is None:
             return
 
         try:
-            self.graphviz_widget.update_graph(expr)
+            if also_render:
+                self.graphviz_widget.update_graphs([*also_render, expr])
+            else:
+                self.graphviz_widget.update_graph(expr)
         except Exception:
             pass
 
+    def update_result_only(self) -> None:
+        """Réévalue l'expression courante (seul l'onglet Pretty-Printer change)."""
+        if self.current_expr is not None:
+            self.update_pretty_tab(self.current_expr, show_result=True)
+
     def on_evaluate_clicked(self) -> None:
-        """Évalue l'expression et met à jour tous les onglets."""
+        """Évalue l'expression et met à jour tous les onglets.
+
+        Si les onglets affichent déjà cette source (seul l'environnement a
+        changé), seule l'évaluation est relancée.
+        """
         self.error_label.hide()
         source = self.expression_input.toPlainText().strip()
 
@@ -502,9 +754,22 @@ class LogicalExpressionApp(QMainWindow):
             self.show_error("Veuillez saisir une expression.")
             return
 
+        if source == self._rendered_source and self.current_expr is not None:
+            self.update_result_only()
+            return
+
         try:
+            # Seuls des espaces ou commentaires ont changé : même AST, seuls
+            # les positions (onglet Tokens) et le résultat sont à rafraîchir
+            signature = _token_signature(_cached_tokens(source))
+            if signature == self._rendered_signature and self.current_expr is not None:
+                self.update_tokens_tab(source)
+                self.update_result_only()
+                self._rendered_source = source
+                return
+
             # Parser (doit être fait en premier pour avoir expr)
-            expr = parse(source)
+            expr = _cached_parse(source)
             self.current_expr = expr
             self.current_source = source
 
@@ -515,17 +780,11 @@ class LogicalExpressionApp(QMainWindow):
             self.update_pretty_tab(expr, show_result=True)
             self.update_json_tab(expr)
             self.update_graphviz_tab(expr)
+            self._rendered_source = source
+            self._rendered_signature = signature
 
-        except LexicalError as e:
-            self.show_compiler_error(e, "Erreur lexicale")
-            if hasattr(e, "location") and e.location:
-                try:
-                    self.highlighter.highlight_error(e.location.offset, 1)
-                except Exception:
-                    pass
-        except ParseError as e:
-            self.show_compiler_error(e, "Erreur de parsing")
-            if hasattr(e, "location") and e.location:
+        except CompilerError as e:
+            if self._report_compiler_error(e) and e.location:
                 try:
                     self.highlighter.highlight_error(e.location.offset, 1)
                 except Exception:
@@ -542,9 +801,13 @@ class LogicalExpressionApp(QMainWindow):
             self.show_error("Veuillez saisir une expression.")
             return
 
+        # Les onglets vont afficher la vue optimisée
+        self._rendered_source = None
+        self._rendered_signature = None
+
         try:
             # Parser
-            expr = parse(source)
+            expr = _cached_parse(source)
             self.current_expr = expr
 
             # Optimiser
@@ -556,8 +819,8 @@ class LogicalExpressionApp(QMainWindow):
             self.update_optimized_ast_tab(optimized_expr)
             
             # Pretty-print avec comparaison
-            optimized_pretty = smart_pretty_print(optimized_expr)
-            original_pretty = smart_pretty_print(expr)
+            optimized_pretty = _cached_pretty(optimized_expr)
+            original_pretty = _cached_pretty(expr)
             pretty_output = f"Expression originale:\n{original_pretty}\n\nExpression optimisée:\n{optimized_pretty}"
             if self.pretty_text is not None:
                 self._update_widget_content(self.pretty_text, pretty_output)
@@ -565,35 +828,47 @@ class LogicalExpressionApp(QMainWindow):
             # JSON optimisé
             self.update_json_tab(optimized_expr)
 
-            # Graphviz optimisé
-            self.update_graphviz_tab(optimized_expr)
+            # Graphviz optimisé (l'AST original est rendu dans le même lot)
+            self.update_graphviz_tab(optimized_expr, expr)
 
             # Passer à l'onglet optimisé
             self.tabs.setCurrentIndex(3)
 
-        except LexicalError as e:
-            self.show_compiler_error(e, "Erreur lexicale")
-        except ParseError as e:
-            self.show_compiler_error(e, "Erreur de parsing")
+        except CompilerError as e:
+            self._report_compiler_error(e)
         except Exception as e:
             self.show_error(f"Erreur inattendue: {e}")
 
     def parse_environment(self, env_str: str) -> Dict[str, bool]:
-        """Parse une chaîne d'environnement en dictionnaire."""
-        env: Dict[str, bool] = {}
-        if not env_str.strip():
-            return env
-
-        for pair in env_str.split(","):
-            pair = pair.strip()
-            if "=" in pair:
-                key, value = pair.split("=", 1)
-                key = key.strip()
-                value = value.strip().lower()
-                env[key] = value in ("true", "1", "yes", "on")
+        """Parse une chaîne d'environnement en dictionnaire.
+
+        Le résultat de la dernière chaîne est mis en cache (l'environnement
+        change rarement quand on édite l'expression) : ne pas le modifier.
+        """
+        cached = self._env_cache
+        if cached is not None and cached[0] == env_str:
+            return cached[1]
 
+        env = parse_environment(env_str)
+        self._env_cache = (env_str, env)
         return env
 
+    def _report_compiler_error(self, error: CompilerError) -> bool:
+        """Affiche une erreur de compilation avec le titre adapté à son type.
+
+        Returns:
+            True pour une erreur lexicale ou de parsing (position dans la
+            source), False pour une autre erreur, signalée comme inattendue
+        """
+        if isinstance(error, LexicalError):
+            self.show_compiler_error(error, "Erreur lexicale")
+        elif isinstance(error, ParseError):
+            self.show_compiler_error(error, "Erreur de parsing")
+        else:
+            self.show_error(f"Erreur inattendue: {error}")
+            return False
+        return True
+
     def show_compiler_error(self, error: CompilerError, title: str) -> None:
         """Affiche une erreur du compilateur."""
         error_msg = str(error)
@@ -630,6 +905,9 @@ class LogicalExpressionApp(QMainWindow):
 
     def _clear_all_tabs(self) -> None:
         """Vide tous les onglets."""
+        self._rendered_source = None
+        self._rendered_signature = None
+        self._displayed_content.clear()
         widgets = [self.tokens_text, self.ast_text, self.pretty_text, 
                    self.optimized_text, self.json_text]
         for widget in widgets:
@@ -6,8 +6,14 @@ PLY utilise la même syntaxe que Flex, mais génère du code Python pur.
 
 from __future__ import annotations
 
+import re
+import sys
+import threading
+from collections import namedtuple
+from itertools import product
+from typing import Any, Iterator
+
 import ply.lex as lex
-from typing import Any
 
 from .errors import LexicalError, SourceLocation
 
@@ -32,31 +38,48 @@ t_ignore = " \t"
 
 # Ignorer les commentaires (# jusqu'à la fin de la ligne)
 def t_COMMENT(t: lex.LexToken) -> None:
-    r"#.*"
+    r"\#.*"  # `#` échappé : PLY compile les règles en mode re.VERBOSE
     # Ne retourne rien, donc le token est ignoré
     pass
 
 
+# Mots-clés (en majuscules) -> type de token
+_KW = {
+    "AND": "AND",
+    "OR": "OR",
+    "NOT": "NOT",
+    "TRUE": "BOOL",
+    "FALSE": "BOOL",
+}
+
+
+def _case_variants(word: str) -> Iterator[str]:
+    """Toutes les écritures d'un mot en mélangeant majuscules et minuscules."""
+    return map("".join, product(*((c.upper(), c.lower()) for c in word)))
+
+
+# Toutes les écritures d'un mot-clé -> (type, valeur normalisée ou None) :
+# une seule recherche par identifiant, sans `upper()` ni test de longueur
+_KW_TABLE: dict[str, tuple[str, str | None]] = {
+    variant: (kind, keyword if kind == "BOOL" else None)
+    for keyword, kind in _KW.items()
+    for variant in _case_variants(keyword)
+}
+
+
 # Règle pour les identifiants et mots-clés
 def t_IDENT(t: lex.LexToken) -> lex.LexToken:
     r"[A-Za-z_][A-Za-z0-9_]*"
-    # Vérifier si c'est un mot-clé
-    keywords = {
-        "AND": "AND",
-        "OR": "OR",
-        "NOT": "NOT",
-        "TRUE": "BOOL",
-        "FALSE": "BOOL",
-    }
-    upper = t.value.upper()
-    if upper in keywords:
-        t.type = keywords[upper]
-        if t.type == "BOOL":
-            # Pour les booléens, on normalise la casse
-            t.value = upper
-    else:
-        # C'est un identifiant, on garde la casse originale
+    hit = _KW_TABLE.get(t.value)
+    if hit is None:
+        # C'est un identifiant, on garde la casse originale (nom interné)
         t.type = "IDENT"
+        t.value = sys.intern(t.value)
+        return t
+    t.type, normalized = hit
+    if normalized is not None:
+        # Pour les booléens, on normalise la casse
+        t.value = normalized
     return t
 
 
@@ -66,51 +89,119 @@ def t_newline(t: lex.LexToken) -> None:
     t.lexer.lineno += len(t.value)
 
 
-# Gestion des erreurs
-def t_error(t: lex.LexToken) -> None:
-    """Gère les caractères invalides."""
+def _unexpected_char(source: str, lexpos: int, lineno: int) -> LexicalError:
+    """Construit l'erreur pour un caractère invalide à la position donnée."""
     # Calculer la colonne (trouver le début de la ligne actuelle)
-    line_start = t.lexer.lexdata.rfind("\n", 0, t.lexpos)
+    line_start = source.rfind("\n", 0, lexpos)
     if line_start == -1:
-        column = t.lexpos + 1
+        column = lexpos + 1
     else:
-        column = t.lexpos - line_start
+        column = lexpos - line_start
     location = SourceLocation(
-        line=t.lineno,
+        line=lineno,
         column=column,
-        offset=t.lexpos,
+        offset=lexpos,
     )
-    raise LexicalError(
-        f"Caractère inattendu '{t.value[0]}'",
+    return LexicalError(
+        f"Caractère inattendu '{source[lexpos]}'",
         location=location,
-        source=t.lexer.lexdata,
+        source=source,
     )
 
 
-# Créer le lexer
+# Gestion des erreurs
+def t_error(t: lex.LexToken) -> None:
+    """Gère les caractères invalides."""
+    raise _unexpected_char(t.lexer.lexdata, t.lexpos, t.lineno)
+
+
+# Créer le lexer de base (jamais utilisé directement pour tokeniser)
 lexer = lex.lex()
 
+# Un clone du lexer par thread : l'état de lecture (lexdata, lexpos, lineno)
+# est propre à chaque thread, les tables compilées sont partagées
+_local = threading.local()
+
+
+def get_lexer() -> lex.Lexer:
+    """Retourne le lexer du thread courant (créé au premier appel).
+
+    Returns:
+        Un clone du lexer de base, réutilisé pour tous les appels du thread
+    """
+    thread_lexer = getattr(_local, "lexer", None)
+    if thread_lexer is None:
+        thread_lexer = _local.lexer = lexer.clone()
+    return thread_lexer
+
+
+# Token léger renvoyé par tokenize_ply (mêmes attributs que LexToken)
+Tok = namedtuple("Tok", "type value lineno lexpos")
+
+# Scanner équivalent aux règles PLY ci-dessus, en une seule regex :
+# `finditer` + `lastgroup` évitent la boucle `lexer.token()` de PLY
+_MASTER = re.compile(
+    r"(?P<SPACE>[ \t]+)"
+    r"|(?P<NL>\n+)"
+    r"|(?P<COMMENT>#[^\n]*)"
+    r"|(?P<LPAREN>\()"
+    r"|(?P<RPAREN>\))"
+    r"|(?P<IDENT>[A-Za-z_][A-Za-z0-9_]*)"
+    r"|(?P<ERR>.)",
+    re.DOTALL,
+)
+
 
-def tokenize_ply(source: str) -> list[lex.LexToken]:
-    """Tokenise une chaîne source avec PLY.
+def iter_tokens_ply(source: str) -> Iterator[Tok]:
+    """Produit les tokens un par un (sans construire de liste).
+
+    Args:
+        source: Code source à tokeniser
+
+    Yields:
+        Les tokens (`Tok` : type, value, lineno, lexpos), dans l'ordre
+
+    Raises:
+        LexicalError: Si un caractère invalide est rencontré (au moment où
+            le générateur l'atteint)
+    """
+    lineno = 1
+    for m in _MASTER.finditer(source):
+        kind = m.lastgroup
+        if kind == "IDENT":
+            value = m.group()
+            hit = _KW_TABLE.get(value)
+            if hit is None:
+                yield Tok("IDENT", sys.intern(value), lineno, m.start())
+            else:
+                # Pour les booléens, on normalise la casse
+                yield Tok(hit[0], hit[1] or value, lineno, m.start())
+        elif kind == "SPACE" or kind == "COMMENT":
+            continue
+        elif kind == "NL":
+            lineno += m.end() - m.start()
+        elif kind == "ERR":
+            raise _unexpected_char(source, m.start(), lineno)
+        else:
+            yield Tok(kind, m.group(), lineno, m.start())
+
+
+def tokenize_ply(source: str) -> list[Tok]:
+    """Tokenise une chaîne source (mêmes règles que le lexer PLY).
+
+    Le parser PLY continue d'utiliser `get_lexer()` ; cette fonction passe
+    par `_MASTER`, nettement plus rapide que la boucle `lexer.token()`.
 
     Args:
         source: Code source à tokeniser
 
     Returns:
-        Liste des tokens PLY
+        Liste des tokens (`Tok` : type, value, lineno, lexpos)
 
     Raises:
         LexicalError: Si un caractère invalide est rencontré
     """
-    lexer.input(source)
-    tokens: list[lex.LexToken] = []
-    while True:
-        tok = lexer.token()
-        if not tok:
-            break
-        tokens.append(tok)
-    return tokens
+    return list(iter_tokens_ply(source))
 
 
 # Fonction de compatibilité avec l'ancien tokenizer
@@ -132,6 +223,6 @@ if __name__ == "__main__":
     test_input = "A AND (B OR NOT C) # commentaire"
     print(f"Input: {test_input}")
     print("\nTokens:")
-    for token in tokenize_ply(test_input):
+    for token in iter_tokens_ply(test_input):
         print(f"  {token.type:10} = {token.value!r} (ligne {token.lineno}, pos {token.lexpos})")
 
@@ -8,17 +8,132 @@ Ce module implémente un optimiseur qui applique des règles de simplification :
 - TRUE OR X → TRUE
 - FALSE OR X → X
 - NOT NOT X → X
+
+Le parcours est ascendant : chaque règle ne renvoie que des sous-arbres déjà
+optimisés, donc un seul passage atteint le point fixe (optimize(optimize(e))
+renvoie le même nœud que optimize(e)).
 """
 
 from __future__ import annotations
 
+import functools
 import logging
+from typing import Callable
 
 from . import ast
 from .visitors import ExprVisitor
 
 logger = logging.getLogger(__name__)
 
+# Nombre d'expressions dont le résultat optimisé est conservé par `optimize`
+_CACHE_SIZE = 1024
+
+# Littéraux canoniques (références fortes : jamais évincés de la table d'internement)
+_TRUE = ast.mk_bool(True)
+_FALSE = ast.mk_bool(False)
+
+# Étiquette d'un opérande pour les tables de règles
+_TAG_TRUE, _TAG_FALSE, _TAG_OTHER = 0, 1, 2
+
+Fold = Callable[[ast.Expr, ast.Expr], ast.Expr]
+
+
+def _tag(expr: ast.Expr) -> int:
+    """Étiquette d'un opérande optimisé : littéral TRUE, littéral FALSE ou autre.
+
+    L'optimiseur remplace chaque littéral par `_TRUE` ou `_FALSE` : un test
+    d'identité suffit.
+    """
+    if expr is _TRUE:
+        return _TAG_TRUE
+    if expr is _FALSE:
+        return _TAG_FALSE
+    return _TAG_OTHER
+
+
+def _rule_table(rules: list[tuple[str, int, str, Fold]]) -> dict[tuple[int, int], tuple[str, Fold]]:
+    """Construit la table (étiquette gauche, étiquette droite) -> règle.
+
+    Les règles sont données par priorité décroissante sous la forme
+    (côté testé, étiquette attendue, message de debug, repli). Les paires
+    sans règle applicable sont absentes de la table.
+    """
+    table: dict[tuple[int, int], tuple[str, Fold]] = {}
+    for left_tag in (_TAG_TRUE, _TAG_FALSE, _TAG_OTHER):
+        for right_tag in (_TAG_TRUE, _TAG_FALSE, _TAG_OTHER):
+            for side, tag, message, fold in rules:
+                if (left_tag if side == "left" else right_tag) == tag:
+                    table[(left_tag, right_tag)] = (message, fold)
+                    break
+    return table
+
+
+def _keep_left(left: ast.Expr, right: ast.Expr) -> ast.Expr:
+    return left
+
+
+def _keep_right(left: ast.Expr, right: ast.Expr) -> ast.Expr:
+    return right
+
+
+def _always_true(left: ast.Expr, right: ast.Expr) -> ast.Expr:
+    return _TRUE
+
+
+def _always_false(left: ast.Expr, right: ast.Expr) -> ast.Expr:
+    return _FALSE
+
+
+_AND_RULES = _rule_table([
+    ("left", _TAG_TRUE, "TRUE AND X → X", _keep_right),
+    ("left", _TAG_FALSE, "FALSE AND X → FALSE", _always_false),
+    ("right", _TAG_TRUE, "X AND TRUE → X", _keep_left),
+    ("right", _TAG_FALSE, "X AND FALSE → FALSE", _always_false),
+])
+
+_OR_RULES = _rule_table([
+    ("left", _TAG_TRUE, "TRUE OR X → TRUE", _always_true),
+    ("left", _TAG_FALSE, "FALSE OR X → X", _keep_right),
+    ("right", _TAG_TRUE, "X OR TRUE → TRUE", _always_true),
+    ("right", _TAG_FALSE, "X OR FALSE → X", _keep_left),
+])
+
+# NOT d'un littéral, indexé par sa valeur
+_NOT_RULES: dict[bool, tuple[str, ast.Expr]] = {
+    True: ("NOT TRUE → FALSE", _FALSE),
+    False: ("NOT FALSE → TRUE", _TRUE),
+}
+
+
+def fold_not(operand: ast.Expr) -> ast.Expr:
+    """Construit NOT operand en appliquant directement les règles de l'optimiseur.
+
+    Pour un opérande déjà optimisé, le résultat est celui de `optimize` sur
+    le nœud NOT : utilisable pour plier les expressions pendant leur
+    construction (voir `parse(..., simplify=True)`).
+    """
+    if operand is _TRUE or operand is _FALSE:
+        return _NOT_RULES[operand is _TRUE][1]
+    if type(operand) is ast.Not:
+        return operand.expr
+    return ast.mk_not(operand)
+
+
+def fold_and(left: ast.Expr, right: ast.Expr) -> ast.Expr:
+    """Construit left AND right en appliquant les règles de `_AND_RULES`."""
+    rule = _AND_RULES.get((_tag(left), _tag(right)))
+    if rule is not None:
+        return rule[1](left, right)
+    return ast.mk_and(left, right)
+
+
+def fold_or(left: ast.Expr, right: ast.Expr) -> ast.Expr:
+    """Construit left OR right en appliquant les règles de `_OR_RULES`."""
+    rule = _OR_RULES.get((_tag(left), _tag(right)))
+    if rule is not None:
+        return rule[1](left, right)
+    return ast.mk_or(left, right)
+
 
 class Optimizer(ExprVisitor[ast.Expr]):
     """Visiteur qui optimise l'AST en appliquant des règles de constant folding."""
@@ -30,133 +145,152 @@ class Optimizer(ExprVisitor[ast.Expr]):
             debug: Si True, log les optimisations effectuées
         """
         self.debug = debug
+        # Traces actives seulement si le logger émet le niveau DEBUG
+        self._log_debug = debug and logger.isEnabledFor(logging.DEBUG)
+        # Résultats déjà calculés, indexés par identité de nœud (sous-arbres
+        # partagés) ; valable uniquement pendant un passage de `optimize`
+        self._memo: dict[int, ast.Expr] = {}
 
     def optimize(self, expr: ast.Expr) -> ast.Expr:
         """Optimise une expression AST.
 
+        Le parcours postfixe utilise une pile explicite : pas de récursion
+        Python, quelle que soit la profondeur de l'arbre.
+
         Args:
             expr: L'expression à optimiser
 
         Returns:
             L'expression optimisée
         """
-        return expr.accept(self)
+        self._memo = {}
+        try:
+            return self._optimize_iterative(expr)
+        finally:
+            self._memo = {}
+
+    def _optimize_iterative(self, root: ast.Expr) -> ast.Expr:
+        """Parcours postfixe itératif : enfants d'abord, puis règles du nœud.
+
+        `todo` contient des paires (nœud, état) : l'état 0 empile les enfants,
+        l'état 1 dépile leurs résultats dans `results` et applique les règles.
+        L'arbre d'entrée reste vivant pendant tout le passage, donc `id()`
+        identifie ses nœuds de manière stable (sous-arbres partagés
+        optimisés une seule fois).
+        """
+        memo = self._memo
+        todo: list[tuple[ast.Expr, int]] = [(root, 0)]
+        results: list[ast.Expr] = []
+        push, pop = todo.append, todo.pop
+
+        while todo:
+            node, state = pop()
+            node_type = type(node)
+            if state == 0:
+                if not node.foldable:
+                    # Aucune règle ne peut s'appliquer : sous-arbre inchangé
+                    results.append(node)
+                    continue
+                done = memo.get(id(node))
+                if done is not None:
+                    results.append(done)
+                elif node_type is ast.And or node_type is ast.Or:
+                    push((node, 1))
+                    push((node.right, 0))
+                    push((node.left, 0))
+                elif node_type is ast.Not:
+                    push((node, 1))
+                    push((node.expr, 0))
+                else:
+                    # Littéral remplacé par son singleton
+                    leaf = _TRUE if node.value else _FALSE
+                    memo[id(node)] = leaf
+                    results.append(leaf)
+                continue
+
+            if node_type is ast.Not:
+                result = self._fold_not(node, results.pop())
+            else:
+                right = results.pop()
+                left = results.pop()
+                if node_type is ast.And:
+                    result = self._fold_and(node, left, right)
+                else:
+                    result = self._fold_or(node, left, right)
+            memo[id(node)] = result
+            results.append(result)
+
+        return results[0]
 
     def visit_var(self, expr: ast.Var) -> ast.Expr:
         """Les variables ne peuvent pas être optimisées."""
         return expr
 
     def visit_bool_lit(self, expr: ast.BoolLit) -> ast.Expr:
-        """Les littéraux booléens ne peuvent pas être optimisés."""
-        return expr
+        """Les littéraux booléens sont remplacés par leur singleton."""
+        return _TRUE if expr.value else _FALSE
 
     def visit_not(self, expr: ast.Not) -> ast.Expr:
-        """Optimise NOT selon les règles :
+        """Optimise NOT (voir `_fold_not`)."""
+        return self.optimize(expr)
+
+    def visit_and(self, expr: ast.And) -> ast.Expr:
+        """Optimise AND (voir `_fold_and`)."""
+        return self.optimize(expr)
+
+    def visit_or(self, expr: ast.Or) -> ast.Expr:
+        """Optimise OR (voir `_fold_or`)."""
+        return self.optimize(expr)
+
+    def _fold_not(self, expr: ast.Not, operand: ast.Expr) -> ast.Expr:
+        """Optimise NOT (opérande déjà optimisé) selon les règles :
         - NOT TRUE → FALSE
         - NOT FALSE → TRUE
         - NOT NOT X → X (double négation)
         """
-        operand = expr.expr.accept(self)
-
-        # NOT TRUE → FALSE
-        if isinstance(operand, ast.BoolLit) and operand.value:
-            if self.debug:
-                logger.debug("  [OPT] NOT TRUE → FALSE")
-            return ast.BoolLit(value=False)
-
-        # NOT FALSE → TRUE
-        if isinstance(operand, ast.BoolLit) and not operand.value:
-            if self.debug:
-                logger.debug("  [OPT] NOT FALSE → TRUE")
-            return ast.BoolLit(value=True)
+        if operand is _TRUE or operand is _FALSE:
+            message, folded = _NOT_RULES[operand is _TRUE]
+            if self._log_debug:
+                logger.debug(f"  [OPT] {message}")
+            return folded
 
         # NOT NOT X → X (double négation)
-        if isinstance(operand, ast.Not):
-            if self.debug:
+        if type(operand) is ast.Not:
+            if self._log_debug:
                 logger.debug("  [OPT] NOT NOT X → X")
             return operand.expr
 
         # Pas d'optimisation possible
         if operand is not expr.expr:
-            return ast.Not(expr=operand)
+            return ast.mk_not(operand)
         return expr
 
-    def visit_and(self, expr: ast.And) -> ast.Expr:
-        """Optimise AND selon les règles :
-        - TRUE AND X → X
-        - FALSE AND X → FALSE
-        - X AND TRUE → X
-        - X AND FALSE → FALSE
-        """
-        left = expr.left.accept(self)
-        right = expr.right.accept(self)
-
-        # TRUE AND X → X
-        if isinstance(left, ast.BoolLit) and left.value:
-            if self.debug:
-                logger.debug("  [OPT] TRUE AND X → X")
-            return right
-
-        # FALSE AND X → FALSE
-        if isinstance(left, ast.BoolLit) and not left.value:
-            if self.debug:
-                logger.debug("  [OPT] FALSE AND X → FALSE")
-            return ast.BoolLit(value=False)
-
-        # X AND TRUE → X
-        if isinstance(right, ast.BoolLit) and right.value:
-            if self.debug:
-                logger.debug("  [OPT] X AND TRUE → X")
-            return left
-
-        # X AND FALSE → FALSE
-        if isinstance(right, ast.BoolLit) and not right.value:
-            if self.debug:
-                logger.debug("  [OPT] X AND FALSE → FALSE")
-            return ast.BoolLit(value=False)
+    def _fold_and(self, expr: ast.And, left: ast.Expr, right: ast.Expr) -> ast.Expr:
+        """Optimise AND (opérandes déjà optimisés) selon les règles de `_AND_RULES`."""
+        rule = _AND_RULES.get((_tag(left), _tag(right)))
+        if rule is not None:
+            message, fold = rule
+            if self._log_debug:
+                logger.debug(f"  [OPT] {message}")
+            return fold(left, right)
 
         # Pas d'optimisation possible
         if left is not expr.left or right is not expr.right:
-            return ast.And(left=left, right=right)
+            return ast.mk_and(left, right)
         return expr
 
-    def visit_or(self, expr: ast.Or) -> ast.Expr:
-        """Optimise OR selon les règles :
-        - TRUE OR X → TRUE
-        - FALSE OR X → X
-        - X OR TRUE → TRUE
-        - X OR FALSE → X
-        """
-        left = expr.left.accept(self)
-        right = expr.right.accept(self)
-
-        # TRUE OR X → TRUE
-        if isinstance(left, ast.BoolLit) and left.value:
-            if self.debug:
-                logger.debug("  [OPT] TRUE OR X → TRUE")
-            return ast.BoolLit(value=True)
-
-        # FALSE OR X → X
-        if isinstance(left, ast.BoolLit) and not left.value:
-            if self.debug:
-                logger.debug("  [OPT] FALSE OR X → X")
-            return right
-
-        # X OR TRUE → TRUE
-        if isinstance(right, ast.BoolLit) and right.value:
-            if self.debug:
-                logger.debug("  [OPT] X OR TRUE → TRUE")
-            return ast.BoolLit(value=True)
-
-        # X OR FALSE → X
-        if isinstance(right, ast.BoolLit) and not right.value:
-            if self.debug:
-                logger.debug("  [OPT] X OR FALSE → X")
-            return left
+    def _fold_or(self, expr: ast.Or, left: ast.Expr, right: ast.Expr) -> ast.Expr:
+        """Optimise OR (opérandes déjà optimisés) selon les règles de `_OR_RULES`."""
+        rule = _OR_RULES.get((_tag(left), _tag(right)))
+        if rule is not None:
+            message, fold = rule
+            if self._log_debug:
+                logger.debug(f"  [OPT] {message}")
+            return fold(left, right)
 
         # Pas d'optimisation possible
         if left is not expr.left or right is not expr.right:
-            return ast.Or(left=left, right=right)
+            return ast.mk_or(left, right)
         return expr
 
 
@@ -167,9 +301,19 @@ def optimize(expr: ast.Expr, debug: bool = False) -> ast.Expr:
         expr: L'expression à optimiser
         debug: Si True, log les optimisations effectuées
 
+    Les résultats hors mode debug sont mis en cache (LRU borné) : les AST
+    sont immuables et leur hash est précalculé.
+
     Returns:
         L'expression optimisée
     """
-    optimizer = Optimizer(debug=debug)
-    return optimizer.optimize(expr)
+    if debug and logger.isEnabledFor(logging.DEBUG):
+        return Optimizer(debug=True).optimize(expr)
+    return _optimize_cached(expr)
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def _optimize_cached(expr: ast.Expr) -> ast.Expr:
+    """Optimise `expr` sans traces (mémoïsé par `optimize`)."""
+    return Optimizer().optimize(expr)
 
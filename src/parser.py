@@ -9,12 +9,14 @@ Ce module implémente un parser robuste avec :
 
 from __future__ import annotations
 
+import functools
 import logging
 from dataclasses import dataclass
-from typing import List, Sequence
+from typing import Callable, Sequence
 
 from . import ast
 from .errors import (
+    CompilerError,
     EndOfInputError,
     LexicalError,
     MissingOperandError,
@@ -23,10 +25,38 @@ from .errors import (
     SourceLocation,
     UnexpectedTokenError,
 )
-from .tokenizer import Token, TokenType, tokenize
+from .optimizer import fold_and, fold_not, fold_or, optimize
+from .tokenizer import Token, TokenType, iter_tokens, tokenize
 
 logger = logging.getLogger(__name__)
 
+# Opérateurs binaires : priorité (plus grande = plus liante) et constructeur
+_BINARY = {
+    TokenType.OR: (1, ast.mk_or),
+    TokenType.AND: (2, ast.mk_and),
+}
+# Même table avec les constructeurs qui appliquent les règles de l'optimiseur
+_BINARY_FOLDING = {
+    TokenType.OR: (1, fold_or),
+    TokenType.AND: (2, fold_and),
+}
+_LOWEST_PREC = 1
+
+# Nombre de sources dont l'AST est conservé par `parse`
+_CACHE_SIZE = 1024
+
+# Littéraux canoniques (lexèmes BOOL déjà normalisés en majuscules par le lexer)
+_TRUE = ast.mk_bool(True)
+_FALSE = ast.mk_bool(False)
+
+# Types de tokens testés par `_parse_stream` (comparaisons par identité)
+_TT_NOT = TokenType.NOT
+_TT_IDENT = TokenType.IDENT
+_TT_BOOL = TokenType.BOOL
+_TT_LPAREN = TokenType.LPAREN
+_TT_RPAREN = TokenType.RPAREN
+_TT_EOF = TokenType.EOF
+
 
 @dataclass
 class Parser:
@@ -37,6 +67,11 @@ class Parser:
     current: int = 0
     debug: bool = False
 
+    def __post_init__(self) -> None:
+        # Les traces ne sont produites que si le logger les émettrait :
+        # évalué une fois ici plutôt qu'à chaque token.
+        self._log_debug = self.debug and logger.isEnabledFor(logging.DEBUG)
+
     def _peek(self, k: int = 0) -> Token:
         """Regarde le token à k positions d'avance (lookahead).
 
@@ -71,7 +106,7 @@ class Parser:
         """Vérifie si le token actuel correspond à l'un des types donnés et avance si oui."""
         for t in types:
             if self._check(t):
-                if self.debug:
+                if self._log_debug:
                     logger.debug(f"  [MATCH] {t.name}")
                 self._advance()
                 return True
@@ -106,6 +141,18 @@ class Parser:
             source=self.source,
         )
 
+    def _consume_closing_paren(self) -> Token:
+        """Consomme la parenthèse fermante ou lève MissingParenthesisError."""
+        try:
+            return self._consume(TokenType.RPAREN, "parenthèse fermante ')'")
+        except UnexpectedTokenError as e:
+            # Convertir en MissingParenthesisError
+            raise MissingParenthesisError(
+                kind="fermante",
+                location=e.location,
+                source=self.source,
+            ) from e
+
     def _error_location(self) -> SourceLocation:
         """Retourne la location du token actuel pour les erreurs."""
         return self._peek().location
@@ -129,7 +176,11 @@ class Parser:
         Raises:
             ParseError: Si une erreur de syntaxe est rencontrée
         """
-        if self.debug:
+        tokens = self.tokens
+        if not self._log_debug and tokens and tokens[-1].type is TokenType.EOF:
+            return self._parse_fast()
+
+        if self._log_debug:
             logger.debug("[ENTER] parse_expression")
         expr = self.parse_or()
         if not self._is_at_end():
@@ -140,90 +191,94 @@ class Parser:
                 location=token.location,
                 source=self.source,
             )
-        if self.debug:
+        if self._log_debug:
             logger.debug("[EXIT] parse_expression")
         return expr
 
+    def _parse_fast(self) -> ast.Expr:
+        """parse_expression sans mode debug (voir `_parse_stream`).
+
+        En cas de succès, `current` pointe sur le token EOF.
+        """
+        tokens = self.tokens
+        start = self.current
+        remaining = iter(tokens) if start == 0 else iter(tokens[start:])
+        expr = _parse_stream(remaining.__next__, self.source)
+        self.current = len(tokens) - 1
+        return expr
+
     def parse_or(self) -> ast.Expr:
         """Parse une expression OR (priorité la plus faible)."""
-        if self.debug:
+        if self._log_debug:
             logger.debug("[ENTER] parse_or")
         expr = self.parse_and()
 
         while self._match(TokenType.OR):
-            if self.debug:
+            if self._log_debug:
                 logger.debug("  [REDUCE] OR")
             right = self.parse_and()
-            expr = ast.Or(left=expr, right=right)
+            expr = ast.mk_or(expr, right)
 
-        if self.debug:
+        if self._log_debug:
             logger.debug("[EXIT] parse_or")
         return expr
 
     def parse_and(self) -> ast.Expr:
         """Parse une expression AND."""
-        if self.debug:
+        if self._log_debug:
             logger.debug("[ENTER] parse_and")
         expr = self.parse_not()
 
         while self._match(TokenType.AND):
-            if self.debug:
+            if self._log_debug:
                 logger.debug("  [REDUCE] AND")
             right = self.parse_not()
-            expr = ast.And(left=expr, right=right)
+            expr = ast.mk_and(expr, right)
 
-        if self.debug:
+        if self._log_debug:
             logger.debug("[EXIT] parse_and")
         return expr
 
     def parse_not(self) -> ast.Expr:
         """Parse une expression NOT (priorité la plus forte)."""
-        if self.debug:
+        if self._log_debug:
             logger.debug("[ENTER] parse_not")
         if self._match(TokenType.NOT):
-            if self.debug:
+            if self._log_debug:
                 logger.debug("  [REDUCE] NOT")
             operand = self.parse_not()  # NOT est associatif à droite
-            expr = ast.Not(expr=operand)
-            if self.debug:
+            expr = ast.mk_not(operand)
+            if self._log_debug:
                 logger.debug("[EXIT] parse_not")
             return expr
         expr = self.parse_primary()
-        if self.debug:
+        if self._log_debug:
             logger.debug("[EXIT] parse_not")
         return expr
 
     def parse_primary(self) -> ast.Expr:
         """Parse un élément primaire (identifiant, booléen, ou parenthèse)."""
-        if self.debug:
+        if self._log_debug:
             logger.debug("[ENTER] parse_primary")
         token = self._peek()
 
         if self._match(TokenType.BOOL):
-            value = token.lexeme.upper() == "TRUE"
-            if self.debug:
+            value = token.lexeme == "TRUE"  # lexème normalisé par le lexer
+            if self._log_debug:
                 logger.debug(f"  [REDUCE] BOOL({value})")
-            return ast.BoolLit(value=value)
+            return _TRUE if value else _FALSE
 
         if self._match(TokenType.IDENT):
-            if self.debug:
+            if self._log_debug:
                 logger.debug(f"  [REDUCE] IDENT({token.lexeme})")
-            return ast.Var(name=token.lexeme)
+            return ast.mk_var(token.lexeme)
 
         if self._match(TokenType.LPAREN):
-            if self.debug:
+            if self._log_debug:
                 logger.debug("  [REDUCE] LPAREN")
             expr = self.parse_or()
-            try:
-                self._consume(TokenType.RPAREN, "parenthèse fermante ')'")
-            except UnexpectedTokenError as e:
-                # Convertir en MissingParenthesisError
-                raise MissingParenthesisError(
-                    kind="fermante",
-                    location=e.location,
-                    source=self.source,
-                ) from e
-            if self.debug:
+            self._consume_closing_paren()
+            if self._log_debug:
                 logger.debug("[EXIT] parse_primary")
             return expr
 
@@ -243,12 +298,126 @@ class Parser:
         )
 
 
-def parse(source: str, debug: bool = False) -> ast.Expr:
+def _parse_stream(
+    next_token: Callable[[], Token], source: str, simplify: bool = False
+) -> ast.Expr:
+    """Parse une expression sans mode debug à partir d'un flux de tokens.
+
+    Même grammaire et mêmes erreurs que les méthodes parse_* de `Parser`,
+    mais le token courant est une variable locale (`nonlocal`) : pas
+    d'appel à _peek/_check/_match par token. La grammaire est LL(1), donc
+    le flux n'est jamais matérialisé ; il doit se terminer par EOF, qui
+    n'est jamais consommé. Les opérateurs binaires sont lus par precedence
+    climbing (table _BINARY) et les suites de NOT par une boucle.
+
+    Args:
+        next_token: Retourne le token suivant du flux
+        source: Code source (pour les messages d'erreur)
+        simplify: Si True, les nœuds sont pliés dès leur construction
+            (même résultat que `optimize` sur l'AST complet, en une passe)
+
+    Returns:
+        L'AST de l'expression
+
+    Raises:
+        ParseError: Si une erreur de syntaxe est rencontrée
+    """
+    mk_not = fold_not if simplify else ast.mk_not
+    binary = _BINARY_FOLDING if simplify else _BINARY
+    tok = next_token()
+
+    def parse_binary(min_prec: int) -> ast.Expr:
+        # Precedence climbing : un seul appel par opérande au lieu de
+        # descendre or → and → not → primary pour chaque feuille.
+        nonlocal tok
+        left = parse_prefix()
+        while True:
+            rule = binary.get(tok.type)
+            if rule is None or rule[0] < min_prec:
+                return left
+            tok = next_token()
+            # prec + 1 : associativité à gauche pour AND et OR
+            left = rule[1](left, parse_binary(rule[0] + 1))
+
+    def parse_prefix() -> ast.Expr:
+        # NOT* puis primaire, dans le même appel
+        nonlocal tok
+        negations = 0
+        while tok.type is _TT_NOT:
+            tok = next_token()
+            negations += 1
+        token = tok
+        token_type = token.type
+        if token_type is _TT_IDENT:
+            tok = next_token()
+            expr = ast.mk_var(token.lexeme)
+        elif token_type is _TT_BOOL:
+            tok = next_token()
+            expr = _TRUE if token.lexeme == "TRUE" else _FALSE
+        elif token_type is _TT_LPAREN:
+            tok = next_token()
+            expr = parse_binary(_LOWEST_PREC)
+            if tok.type is not _TT_RPAREN:
+                raise MissingParenthesisError(
+                    kind="fermante",
+                    location=tok.location,
+                    source=source,
+                )
+            tok = next_token()
+        elif token_type is _TT_EOF:
+            raise EndOfInputError(
+                expected="identifiant, booléen, ou parenthèse ouvrante",
+                location=token.location,
+                source=source,
+            )
+        else:
+            raise UnexpectedTokenError(
+                expected=["identifiant", "booléen (TRUE/FALSE)", "parenthèse ouvrante ('(')"],
+                found=f"{token.type.name}('{token.lexeme}')",
+                location=token.location,
+                source=source,
+            )
+        for _ in range(negations):  # NOT est associatif à droite
+            expr = mk_not(expr)
+        return expr
+
+    expr = parse_binary(_LOWEST_PREC)
+    if tok.type is not _TT_EOF:
+        raise UnexpectedTokenError(
+            expected="fin d'expression",
+            found=f"{tok.type.name}('{tok.lexeme}')",
+            location=tok.location,
+            source=source,
+        )
+    return expr
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def _parse_cached(source: str, simplify: bool) -> ast.Expr:
+    """Parse sans traces, lexing et parsing fusionnés (mémoïsé par `parse`).
+
+    Les tokens sont consommés au fil de l'eau, sans construire la liste
+    complète. Les erreurs ne sont pas mises en cache.
+    """
+    try:
+        return _parse_stream(iter_tokens(source).__next__, source, simplify)
+    except (CompilerError, RecursionError):
+        raise
+    except Exception as e:
+        raise ParseError(f"Erreur lexicale : {e}", source=source) from e
+
+
+def parse(source: str, debug: bool = False, simplify: bool = False) -> ast.Expr:
     """Fonction utilitaire : tokenise puis parse une chaîne source.
 
+    Hors mode debug, les résultats sont mis en cache (LRU borné) par
+    source : les AST sont immuables.
+
     Args:
         source: Code source à parser
         debug: Si True, active le mode debug du parser
+        simplify: Si True, retourne directement l'AST optimisé (les règles de
+            l'optimiseur sont appliquées pendant la construction)
 
     Returns:
         L'AST de l'expression
@@ -257,12 +426,16 @@ def parse(source: str, debug: bool = False) -> ast.Expr:
         ParseError: Si une erreur de syntaxe est rencontrée
         LexicalError: Si une erreur lexicale est rencontrée
     """
+    if not (debug and logger.isEnabledFor(logging.DEBUG)):
+        return _parse_cached(source, simplify)
+
+    parser = Parser(tokens=(), source=source, debug=True)
     try:
-        tokens: List[Token] = tokenize(source)
+        parser.tokens = tokenize(source)
     except Exception as e:
         if isinstance(e, LexicalError):
             raise
         raise ParseError(f"Erreur lexicale : {e}", source=source) from e
-
-    parser = Parser(tokens=tokens, source=source, debug=debug)
-    return parser.parse_expression()
+    expr = parser.parse_expression()
+    # En mode debug, l'arbre tracé est l'arbre brut : optimisation séparée
+    return optimize(expr) if simplify else expr
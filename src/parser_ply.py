@@ -11,7 +11,8 @@ from typing import Any
 
 from . import ast
 from .errors import ParseError, SourceLocation
-from .lexer_ply import lexer, tokens
+from .lexer_ply import get_lexer, tokens
+from .optimizer import fold_and, fold_not, fold_or
 
 # Import des tokens depuis le lexer
 # (tokens est déjà défini dans lexer_ply.py)
@@ -25,58 +26,50 @@ from .lexer_ply import lexer, tokens
 # not_expr    -> NOT not_expr | primary
 # primary     -> IDENT | BOOL | '(' expression ')'
 
+# Littéraux canoniques, partagés par toutes les analyses
+_TRUE = ast.mk_bool(True)
+_FALSE = ast.mk_bool(False)
 
-def p_expression(p: yacc.YaccProduction) -> None:
-    """expression : or_expr"""
-    p[0] = p[1]
 
+# Grammaire aplatie + table de précédence : pas de réductions unitaires
+# (expression → or_expr → and_expr → not_expr → primary), donc un seul appel
+# d'action par nœud construit. Même langage et même AST que la grammaire BNF
+# ci-dessus.
+precedence = (
+    ("left", "OR"),
+    ("left", "AND"),
+    ("right", "NOT"),
+)
 
-def p_or_expr(p: yacc.YaccProduction) -> None:
-    """or_expr : and_expr
-    | or_expr OR and_expr"""
-    if len(p) == 2:
-        # or_expr -> and_expr
-        p[0] = p[1]
-    else:
-        # or_expr -> or_expr OR and_expr
-        p[0] = ast.Or(left=p[1], right=p[3])
 
+def p_expression_or(p: yacc.YaccProduction) -> None:
+    """expression : expression OR expression"""
+    p[0] = (fold_or if p.lexer.simplify else ast.mk_or)(p[1], p[3])
 
-def p_and_expr(p: yacc.YaccProduction) -> None:
-    """and_expr : not_expr
-    | and_expr AND not_expr"""
-    if len(p) == 2:
-        # and_expr -> not_expr
-        p[0] = p[1]
-    else:
-        # and_expr -> and_expr AND not_expr
-        p[0] = ast.And(left=p[1], right=p[3])
 
+def p_expression_and(p: yacc.YaccProduction) -> None:
+    """expression : expression AND expression"""
+    p[0] = (fold_and if p.lexer.simplify else ast.mk_and)(p[1], p[3])
 
-def p_not_expr(p: yacc.YaccProduction) -> None:
-    """not_expr : NOT not_expr
-    | primary"""
-    if len(p) == 2:
-        # not_expr -> primary
-        p[0] = p[1]
-    else:
-        # not_expr -> NOT not_expr
-        p[0] = ast.Not(expr=p[2])
+
+def p_expression_not(p: yacc.YaccProduction) -> None:
+    """expression : NOT expression"""
+    p[0] = (fold_not if p.lexer.simplify else ast.mk_not)(p[2])
 
 
 def p_primary_ident(p: yacc.YaccProduction) -> None:
-    """primary : IDENT"""
-    p[0] = ast.Var(name=p[1])
+    """expression : IDENT"""
+    p[0] = ast.mk_var(p[1])
 
 
 def p_primary_bool(p: yacc.YaccProduction) -> None:
-    """primary : BOOL"""
-    value = p[1].upper() == "TRUE"
-    p[0] = ast.BoolLit(value=value)
+    """expression : BOOL"""
+    # Le lexer normalise déjà la casse des booléens
+    p[0] = _TRUE if p[1] == "TRUE" else _FALSE
 
 
 def p_primary_paren(p: yacc.YaccProduction) -> None:
-    """primary : LPAREN expression RPAREN"""
+    """expression : LPAREN expression RPAREN"""
     p[0] = p[2]
 
 
@@ -109,12 +102,14 @@ def p_error(p: yacc.YaccProduction | None) -> None:
 parser = yacc.yacc(debug=False, write_tables=False)
 
 
-def parse(source: str, debug: bool = False) -> ast.Expr:
+def parse(source: str, debug: bool = False, simplify: bool = False) -> ast.Expr:
     """Parse une expression avec PLY.
 
     Args:
         source: Code source à parser
         debug: Si True, active le mode debug du parser
+        simplify: Si True, retourne directement l'AST optimisé (les règles de
+            l'optimiseur sont appliquées par les actions de la grammaire)
 
     Returns:
         L'AST de l'expression
@@ -122,8 +117,11 @@ def parse(source: str, debug: bool = False) -> ast.Expr:
     Raises:
         ParseError: Si une erreur de syntaxe est rencontrée
     """
-    # Réinitialiser le lexer
-    lexer.input(source)
+    # Lexer du thread courant, réinitialisé
+    lexer = get_lexer()
+    lexer.lineno = 1
+    # Lu par les actions de la grammaire (le lexer est propre au thread)
+    lexer.simplify = simplify
 
     # Parser
     try:
@@ -32,8 +32,14 @@ class PrettyOptions:
     indent: int = 0  # Indentation pour les expressions multi-lignes (0 = une ligne)
 
 
-class SmartPrettyPrinter(ExprVisitor[str]):
-    """Pretty-printer intelligent qui minimise les parenthèses."""
+class SmartPrettyPrinter(ExprVisitor[None]):
+    """Pretty-printer intelligent qui minimise les parenthèses.
+
+    Les fragments de texte sont ajoutés, de gauche à droite, à un
+    accumulateur unique joint une seule fois à la fin de `format` : pas de
+    chaîne intermédiaire recopiée à chaque niveau de l'arbre. Le parcours
+    (`_emit`) est itératif ; les méthodes visit_* y délèguent.
+    """
 
     # Priorités des opérateurs (plus élevé = plus prioritaire)
     PREC_NOT = 3
@@ -49,6 +55,8 @@ class SmartPrettyPrinter(ExprVisitor[str]):
         """
         self.options = options or PrettyOptions()
         self._parent_precedence = self.PREC_PAREN  # Contexte de précédence parent
+        self._out: list[str] = []  # Fragments de la sortie en cours
+        self._specialize()
 
     def format(self, expr: ast.Expr) -> str:
         """Formate une expression AST en chaîne lisible.
@@ -59,8 +67,13 @@ class SmartPrettyPrinter(ExprVisitor[str]):
         Returns:
             Chaîne formatée
         """
-        self._parent_precedence = self.PREC_PAREN
-        return expr.accept(self)
+        self._parent_precedence = self._specialize()
+        self._out = out = []
+        try:
+            self._emit(expr)
+        finally:
+            self._out = []
+        return "".join(out)
 
     def _format_keyword(self, keyword: str) -> str:
         """Formate un mot-clé selon le style de casse."""
@@ -80,75 +93,111 @@ class SmartPrettyPrinter(ExprVisitor[str]):
         else:  # MIXED
             return "True" if value else "False"
 
-    def _needs_parens(self, expr_precedence: int) -> bool:
-        """Détermine si des parenthèses sont nécessaires selon la précédence."""
-        if self.options.show_parentheses == "always":
-            return True
-        if self.options.show_parentheses == "never":
-            return False
-        # "minimal" : parenthèses seulement si nécessaire
-        return expr_precedence < self._parent_precedence
-
-    def _wrap_if_needed(self, s: str, expr_precedence: int) -> str:
-        """Enveloppe une expression dans des parenthèses si nécessaire."""
-        if self._needs_parens(expr_precedence):
-            return f"({s})"
-        return s
-
-    def visit_var(self, expr: ast.Var) -> str:
-        return expr.name
-
-    def visit_bool_lit(self, expr: ast.BoolLit) -> str:
-        return self._format_bool(expr.value)
-
-    def visit_not(self, expr: ast.Not) -> str:
-        not_keyword = self._format_keyword("NOT")
-        # NOT a la priorité la plus élevée
-        old_prec = self._parent_precedence
-        self._parent_precedence = self.PREC_NOT
-        operand_str = expr.expr.accept(self)
-        self._parent_precedence = old_prec
-
-        # Si l'opérande est un NOT, on peut avoir besoin de parenthèses
-        # selon les options
-        if isinstance(expr.expr, ast.Not) and self._needs_parens(self.PREC_NOT):
-            operand_str = f"({operand_str})"
-
-        return f"{not_keyword} {operand_str}"
-
-    def visit_and(self, expr: ast.And) -> str:
-        and_keyword = self._format_keyword("AND")
-        old_prec = self._parent_precedence
-        self._parent_precedence = self.PREC_AND
-
-        # Visiter les opérandes avec la précédence AND
-        left_str = expr.left.accept(self)
-        right_str = expr.right.accept(self)
-
-        self._parent_precedence = old_prec
-
-        # Vérifier si les opérandes ont besoin de parenthèses
-        if isinstance(expr.left, (ast.Or)) and self._needs_parens(self.PREC_OR):
-            left_str = f"({left_str})"
-        if isinstance(expr.right, (ast.Or)) and self._needs_parens(self.PREC_OR):
-            right_str = f"({right_str})"
-
-        result = f"{left_str} {and_keyword} {right_str}"
-        return self._wrap_if_needed(result, self.PREC_AND)
-
-    def visit_or(self, expr: ast.Or) -> str:
-        or_keyword = self._format_keyword("OR")
-        old_prec = self._parent_precedence
-        self._parent_precedence = self.PREC_OR
-
-        # Visiter les opérandes avec la précédence OR
-        left_str = expr.left.accept(self)
-        right_str = expr.right.accept(self)
-
-        self._parent_precedence = old_prec
-
-        result = f"{left_str} {or_keyword} {right_str}"
-        return self._wrap_if_needed(result, self.PREC_OR)
+    def _specialize(self) -> int:
+        """Précalcule, pour un appel à `format`, tout ce qui ne dépend que
+        des options : mots-clés et littéraux dans la bonne casse, et mode de
+        parenthésage (True/False imposé, None pour "minimal").
+
+        Returns:
+            La précédence de départ (PREC_PAREN)
+        """
+        self._not_kw = self._format_keyword("NOT")
+        self._and_sep = f" {self._format_keyword('AND')} "
+        self._or_sep = f" {self._format_keyword('OR')} "
+        self._true_lit = self._format_bool(True)
+        self._false_lit = self._format_bool(False)
+        mode = self.options.show_parentheses
+        self._parens_mode = True if mode == "always" else False if mode == "never" else None
+        return self.PREC_PAREN
+
+    def _emit(self, root: ast.Expr) -> None:
+        """Écrit `root` dans l'accumulateur, dans le contexte de précédence courant.
+
+        Parcours itératif (pas de récursion Python, quelle que soit la
+        profondeur) : la pile contient des fragments de texte à écrire tels
+        quels et des couples (nœud, précédence du parent). Les parenthèses
+        d'un nœud dépendent uniquement de cette précédence, elles sont donc
+        décidées quand le nœud est dépilé.
+        """
+        append = self._out.append
+        forced = self._parens_mode
+        not_prefix = f"{self._not_kw} "
+        and_sep, or_sep = self._and_sep, self._or_sep
+        true_lit, false_lit = self._true_lit, self._false_lit
+        prec_not, prec_and, prec_or = self.PREC_NOT, self.PREC_AND, self.PREC_OR
+
+        stack: list[str | tuple[ast.Expr, int]] = [(root, self._parent_precedence)]
+        pop, push = stack.pop, stack.append
+        while stack:
+            item = pop()
+            if type(item) is str:
+                append(item)
+                continue
+            node, parent = item
+            node_type = type(node)
+
+            if node_type is ast.Var:
+                append(node.name)
+            elif node_type is ast.BoolLit:
+                append(true_lit if node.value else false_lit)
+            elif node_type is ast.Not:
+                append(not_prefix)
+                operand = node.expr
+                # Un NOT sous un NOT peut recevoir des parenthèses selon les options
+                if type(operand) is ast.Not and (
+                    forced if forced is not None else prec_not < parent
+                ):
+                    append("(")
+                    push(")")
+                push((operand, prec_not))
+            elif node_type is ast.And:
+                if forced is None:
+                    wrap, wrap_or = prec_and < parent, prec_or < parent
+                else:
+                    wrap = wrap_or = forced
+                if wrap:
+                    append("(")
+                    push(")")
+                # Empiler à droite d'abord ; un opérande OR peut recevoir des
+                # parenthèses supplémentaires
+                right, left = node.right, node.left
+                if wrap_or and type(right) is ast.Or:
+                    push(")")
+                    push((right, prec_and))
+                    push("(")
+                else:
+                    push((right, prec_and))
+                push(and_sep)
+                if wrap_or and type(left) is ast.Or:
+                    push(")")
+                    push((left, prec_and))
+                    push("(")
+                else:
+                    push((left, prec_and))
+            elif node_type is ast.Or:
+                if forced if forced is not None else prec_or < parent:
+                    append("(")
+                    push(")")
+                push((node.right, prec_or))
+                push(or_sep)
+                push((node.left, prec_or))
+            else:
+                raise TypeError(f"Nœud AST inconnu : {node!r}")
+
+    def visit_var(self, expr: ast.Var) -> None:
+        self._emit(expr)
+
+    def visit_bool_lit(self, expr: ast.BoolLit) -> None:
+        self._emit(expr)
+
+    def visit_not(self, expr: ast.Not) -> None:
+        self._emit(expr)
+
+    def visit_and(self, expr: ast.And) -> None:
+        self._emit(expr)
+
+    def visit_or(self, expr: ast.Or) -> None:
+        self._emit(expr)
 
 
 def pretty_print(
@@ -1,29 +1,23 @@
 """REPL (Read-Eval-Print Loop) améliorée pour le langage logique.
 
 Ce module implémente une REPL interactive avec :
-- Commandes avancées (:ast, :tokens, :opt, :json, :dot, :debug, :env, :help)
+- Commandes avancées (:ast, :tokens, :opt, :json, :dot, :truthtable, :debug, :env, :help)
 - Colorisation de sortie (colorama)
-- Historique et auto-complétion (readline)
+- Historique et auto-complétion (readline, en session interactive)
 - Mode debug
 """
 
 from __future__ import annotations
 
-import json
+import functools
 import logging
+import re
 import sys
-from io import StringIO
 from typing import Dict
 
 try:
-    import readline  # noqa: F401 - pour l'historique et auto-complétion
-except ImportError:
-    pass  # readline n'est pas disponible sur Windows par défaut
-
-try:
-    from colorama import Fore, Style, init
+    from colorama import Fore, Style
 
-    init(autoreset=True)
     HAS_COLORAMA = True
 except ImportError:
     # Fallback si colorama n'est pas installé
@@ -42,33 +36,134 @@ except ImportError:
     HAS_COLORAMA = False
 
 from . import ast
-from .evaluator import evaluate
+from .evaluator import evaluate, truth_table
 from .optimizer import optimize
 from .parser import parse
-from .pretty import pretty_print as smart_pretty_print
 from .tokenizer import debug_tokens, tokenize
-from .graphviz_exporter import export_to_dot
 
-logger = logging.getLogger(__name__)
+# Nombre maximal de résultats mémorisés par la REPL pour un environnement
+_RESULT_CACHE_SIZE = 256
+
+# Affectations `NOM=valeur` séparées par des blancs ou des virgules
+_ENV_PAIR_RE = re.compile(r"([^\s,=]+)\s*=\s*([^\s,]*)")
+_TRUE_VALUES = frozenset(("true", "1", "yes", "on"))
+_FALSE_VALUES = frozenset(("false", "0", "no", "off"))
+
+# Taille maximale de l'historique readline (session interactive)
+_HISTORY_LENGTH = 500
+
+# Au-delà, la table de vérité (2^k lignes) n'est pas affichée
+_TRUTH_TABLE_MAX_VARS = 12
+
+
+@functools.cache
+def _init_colorama() -> None:
+    """Initialise colorama (enveloppe de stdout) au premier texte colorisé."""
+    if HAS_COLORAMA:
+        from colorama import init
+
+        init(autoreset=True)
 
 
 def _colorize(text: str, color: str) -> str:
     """Colorise un texte si colorama est disponible."""
     if HAS_COLORAMA:
+        _init_colorama()
         return f"{color}{text}{Style.RESET_ALL}"
     return text
 
 
-def _print_banner() -> None:
-    """Affiche la bannière de bienvenue."""
-    banner = """
+# Textes constants colorisés une fois pour toutes (codes ANSI déjà insérés ;
+# sans colorama, Fore/Style valent des chaînes vides). L'écriture passe
+# toujours par `_init_colorama`, appelé par la bannière.
+_BANNER = """
 ╔══════════════════════════════════════════════════════════════╗
 ║   REPL - Langage d'expressions logiques (AND, OR, NOT)     ║
 ║   Priorité: NOT > AND > OR                                  ║
 ╚══════════════════════════════════════════════════════════════╝
 """
-    print(_colorize(banner, Fore.CYAN))
-    print(_colorize("Tapez une expression ou ':help' pour voir les commandes.\n", Fore.YELLOW))
+_HELP_TEXT = """
+Commandes disponibles:
+
+  :ast      Afficher l'AST formaté de la dernière expression
+  :tokens   Afficher les tokens de la dernière expression
+  :opt      Afficher l'AST optimisé de la dernière expression
+  :json     Afficher l'AST en format JSON
+  :dot      Exporter l'AST en format Graphviz DOT
+  :truthtable  Afficher la table de vérité de la dernière expression
+  :debug    Activer/désactiver le mode debug (on/off)
+  :env      Afficher ou modifier l'environnement (A=true,B=false)
+  :help     Afficher cette aide
+  :quit     Quitter la REPL
+
+Exemples:
+  A AND B
+  NOT (A OR B)
+  :env A=true,B=false,C=true
+  :debug on
+"""
+_BANNER_COLORED = (
+    f"{Fore.CYAN}{_BANNER}{Style.RESET_ALL}\n"
+    f"{Fore.YELLOW}Tapez une expression ou ':help' pour voir les commandes.\n{Style.RESET_ALL}"
+)
+_HELP_COLORED = f"{Fore.CYAN}{_HELP_TEXT}{Style.RESET_ALL}"
+_PROMPT = f"{Fore.GREEN}expr> {Style.RESET_ALL}"
+# Le résultat n'est connu qu'à l'exécution : seuls préfixe et suffixe sont figés
+_RESULT_PREFIX = f"{Fore.GREEN}Résultat: "
+_COLOR_RESET = Style.RESET_ALL
+
+
+def _variables(expr: ast.Expr) -> list[str]:
+    """Noms des variables de `expr`, dans l'ordre de première apparition."""
+    names: dict[str, None] = {}
+    stack = [expr]
+    while stack:
+        node = stack.pop()
+        node_type = type(node)
+        if node_type is ast.Var:
+            names.setdefault(node.name)
+        elif node_type is ast.Not:
+            stack.append(node.expr)
+        elif node_type is ast.And or node_type is ast.Or:
+            stack.append(node.right)
+            stack.append(node.left)
+    return list(names)
+
+
+def _format_truth_table(expr: ast.Expr) -> str:
+    """Table de vérité de `expr` (une ligne par affectation, 1 = vrai)."""
+    names = _variables(expr)
+    table = truth_table(expr, names)
+    k = len(names)
+    header = " ".join(names)
+    lines = [f"{header} | Résultat" if names else "Résultat"]
+    for row in range(1 << k):
+        # Bit de poids fort = première variable (ordre de truth_table)
+        cells = " ".join(
+            f"{row >> (k - 1 - i) & 1:<{len(name)}}" for i, name in enumerate(names)
+        )
+        result = table >> row & 1
+        lines.append(f"{cells} | {result}" if names else str(result))
+    return "\n".join(lines)
+
+
+def _enable_readline() -> None:
+    """Active l'historique et l'édition de ligne (readline) si disponible.
+
+    Appelé uniquement pour une session interactive : sur une entrée redirigée,
+    readline n'apporte rien et ralentit chaque lecture.
+    """
+    try:
+        import readline
+    except ImportError:
+        return  # readline n'est pas disponible sur Windows par défaut
+    readline.set_history_length(_HISTORY_LENGTH)
+
+
+def _print_banner() -> None:
+    """Affiche la bannière de bienvenue."""
+    _init_colorama()
+    print(_BANNER_COLORED)
 
 
 def _parse_env(args: list[str]) -> Dict[str, bool]:
@@ -78,17 +173,12 @@ def _parse_env(args: list[str]) -> Dict[str, bool]:
     """
     env: Dict[str, bool] = {}
     for arg in args:
-        # Support des deux formats : "A=true B=false" et "A=true,B=false"
-        pairs = arg.split(",") if "," in arg else [arg]
-        for pair in pairs:
-            if "=" not in pair:
-                continue
-            name, value = pair.split("=", 1)
-            name = name.strip()
-            v = value.strip().lower()
-            if v in ("true", "1", "yes", "on"):
+        # Un seul balayage par argument, pour les deux formats
+        for name, value in _ENV_PAIR_RE.findall(arg):
+            v = value.lower()
+            if v in _TRUE_VALUES:
                 env[name] = True
-            elif v in ("false", "0", "no", "off"):
+            elif v in _FALSE_VALUES:
                 env[name] = False
             else:
                 print(
@@ -114,29 +204,43 @@ class REPL:
         self.debug = False
         self.last_expr: ast.Expr | None = None
         self.last_source: str = ""
+        # Résultats déjà évalués dans l'environnement courant ; clés comparées
+        # structurellement (hash précalculé, puis __eq__ nœud par nœud, court-
+        # circuité pour les AST internés identiques) ; vidé à chaque :env
+        self._results: Dict[ast.Expr, bool] = {}
+        # Sortie en attente, écrite d'un bloc par `_flush` (un seul write
+        # par commande au lieu d'un print par ligne)
+        self._out: list[str] = []
+
+    def _emit(self, text: str, color: str | None = None) -> None:
+        """Ajoute une ligne (éventuellement colorisée) à la sortie en attente."""
+        self._out.append((_colorize(text, color) if color else text) + "\n")
+
+    def _flush(self) -> None:
+        """Écrit la sortie en attente sur stdout en un seul appel."""
+        if self._out:
+            sys.stdout.write("".join(self._out))
+            sys.stdout.flush()
+            self._out.clear()
+
+    def _evaluate(self, expr: ast.Expr) -> bool:
+        """Évalue `expr` dans l'environnement courant, avec mémoïsation.
+
+        Le mode debug évalue toujours (pour afficher les traces).
+        """
+        if self.debug:
+            return evaluate(expr, self.env, debug=True)
+        result = self._results.get(expr)
+        if result is None:
+            result = evaluate(expr, self.env)
+            if len(self._results) >= _RESULT_CACHE_SIZE:
+                self._results.clear()
+            self._results[expr] = result
+        return result
 
     def _print_help(self) -> None:
         """Affiche l'aide des commandes."""
-        help_text = """
-Commandes disponibles:
-
-  :ast      Afficher l'AST formaté de la dernière expression
-  :tokens   Afficher les tokens de la dernière expression
-  :opt      Afficher l'AST optimisé de la dernière expression
-  :json     Afficher l'AST en format JSON
-  :dot      Exporter l'AST en format Graphviz DOT
-  :debug    Activer/désactiver le mode debug (on/off)
-  :env      Afficher ou modifier l'environnement (A=true,B=false)
-  :help     Afficher cette aide
-  :quit     Quitter la REPL
-
-Exemples:
-  A AND B
-  NOT (A OR B)
-  :env A=true,B=false,C=true
-  :debug on
-"""
-        print(_colorize(help_text, Fore.CYAN))
+        self._emit(_HELP_COLORED)
 
     def _handle_command(self, line: str) -> bool:
         """Gère une commande REPL. Retourne True si la commande a été traitée."""
@@ -155,83 +259,126 @@ Exemples:
             return True  # Signal pour quitter
         elif cmd_name == "ast":
             if self.last_expr:
-                print(_colorize("AST:", Fore.BLUE))
-                print(ast.pretty_print(self.last_expr))
+                self._emit("AST:", Fore.BLUE)
+                self._emit(ast.pretty_print(self.last_expr))
             else:
-                print(_colorize("Aucune expression précédente.", Fore.YELLOW))
+                self._emit("Aucune expression précédente.", Fore.YELLOW)
         elif cmd_name == "tokens":
             if self.last_source:
                 try:
                     tokens = tokenize(self.last_source)
-                    print(_colorize("Tokens:", Fore.BLUE))
-                    print(debug_tokens(tokens))
+                    self._emit("Tokens:", Fore.BLUE)
+                    self._emit(debug_tokens(tokens))
                 except Exception as e:
-                    print(_colorize(f"Erreur: {e}", Fore.RED))
+                    self._emit(f"Erreur: {e}", Fore.RED)
             else:
-                print(_colorize("Aucune expression précédente.", Fore.YELLOW))
+                self._emit("Aucune expression précédente.", Fore.YELLOW)
         elif cmd_name == "opt":
             if self.last_expr:
+                from .pretty import pretty_print as smart_pretty_print
+
                 optimized = optimize(self.last_expr, debug=self.debug)
-                print(_colorize("AST optimisé:", Fore.BLUE))
-                print(ast.pretty_print(optimized))
-                print(_colorize("Expression optimisée:", Fore.GREEN))
-                print(smart_pretty_print(optimized))
+                self._emit("AST optimisé:", Fore.BLUE)
+                self._emit(ast.pretty_print(optimized))
+                self._emit("Expression optimisée:", Fore.GREEN)
+                self._emit(smart_pretty_print(optimized))
             else:
-                print(_colorize("Aucune expression précédente.", Fore.YELLOW))
+                self._emit("Aucune expression précédente.", Fore.YELLOW)
         elif cmd_name == "json":
             if self.last_expr:
-                json_str = json.dumps(self.last_expr.to_json(), indent=2)
-                print(_colorize("AST JSON:", Fore.BLUE))
-                print(json_str)
+                self._emit("AST JSON:", Fore.BLUE)
+                self._flush()
+                # Écriture directe dans le tampon de stdout, fragment par fragment
+                ast.write_json(self.last_expr, sys.stdout.write)
+                sys.stdout.write("\n")
+                sys.stdout.flush()
             else:
-                print(_colorize("Aucune expression précédente.", Fore.YELLOW))
+                self._emit("Aucune expression précédente.", Fore.YELLOW)
         elif cmd_name == "dot":
             if self.last_expr:
+                from .graphviz_exporter import export_to_dot
+
                 filename = args.strip() if args else "ast.dot"
                 try:
                     export_to_dot(self.last_expr, filename)
-                    print(_colorize(f"AST exporté vers {filename}", Fore.GREEN))
+                    self._emit(f"AST exporté vers {filename}", Fore.GREEN)
                 except Exception as e:
-                    print(_colorize(f"Erreur: {e}", Fore.RED))
+                    self._emit(f"Erreur: {e}", Fore.RED)
             else:
-                print(_colorize("Aucune expression précédente.", Fore.YELLOW))
+                self._emit("Aucune expression précédente.", Fore.YELLOW)
+        elif cmd_name == "truthtable":
+            if self.last_expr:
+                count = len(_variables(self.last_expr))
+                if count > _TRUTH_TABLE_MAX_VARS:
+                    self._emit(
+                        f"Trop de variables ({count}) pour afficher la table de vérité.",
+                        Fore.YELLOW,
+                    )
+                else:
+                    try:
+                        table = _format_truth_table(self.last_expr)
+                        self._emit("Table de vérité:", Fore.BLUE)
+                        self._emit(table)
+                    except Exception as e:
+                        self._emit(f"Erreur: {e}", Fore.RED)
+            else:
+                self._emit("Aucune expression précédente.", Fore.YELLOW)
         elif cmd_name == "debug":
             if args.lower() in ("on", "true", "1", "yes"):
                 self.debug = True
-                logging.basicConfig(level=logging.DEBUG)
-                print(_colorize("Mode debug activé", Fore.GREEN))
+                logging.getLogger().setLevel(logging.DEBUG)
+                self._emit("Mode debug activé", Fore.GREEN)
             elif args.lower() in ("off", "false", "0", "no"):
                 self.debug = False
-                logging.basicConfig(level=logging.WARNING)
-                print(_colorize("Mode debug désactivé", Fore.YELLOW))
+                logging.getLogger().setLevel(logging.WARNING)
+                self._emit("Mode debug désactivé", Fore.YELLOW)
             else:
                 status = "activé" if self.debug else "désactivé"
-                print(_colorize(f"Mode debug: {status}", Fore.CYAN))
+                self._emit(f"Mode debug: {status}", Fore.CYAN)
         elif cmd_name == "env":
             if args:
                 # Modifier l'environnement
                 new_env = _parse_env([args])
                 self.env.update(new_env)
-                print(_colorize(f"Environnement mis à jour: {self.env}", Fore.GREEN))
+                self._results.clear()
+                self._emit(f"Environnement mis à jour: {self.env}", Fore.GREEN)
             else:
                 # Afficher l'environnement
-                print(_colorize(f"Environnement: {self.env}", Fore.CYAN))
+                self._emit(f"Environnement: {self.env}", Fore.CYAN)
         else:
-            print(_colorize(f"Commande inconnue: :{cmd_name}. Tapez :help pour l'aide.", Fore.RED))
+            self._emit(f"Commande inconnue: :{cmd_name}. Tapez :help pour l'aide.", Fore.RED)
 
+        self._flush()
         return False  # Ne pas quitter
 
     def run(self) -> None:
         """Lance la boucle REPL."""
+        # Handler par défaut installé une fois ; `:debug` ne change que le niveau
+        logging.basicConfig()
         _print_banner()
-        print(_colorize(f"Environnement initial: {self.env}\n", Fore.CYAN))
+        self._emit(f"Environnement initial: {self.env}\n", Fore.CYAN)
+
+        interactive = sys.stdin.isatty()
+        if interactive:
+            _enable_readline()
+        prompt = _PROMPT
 
         while True:
+            self._flush()  # Avant l'invite : la sortie du cycle précédent
             try:
-                line = input(_colorize("expr> ", Fore.GREEN)).strip()
+                if interactive:
+                    line = input(prompt)
+                else:
+                    # Entrée redirigée : lecture directe, sans readline
+                    sys.stdout.write(prompt)
+                    sys.stdout.flush()
+                    line = sys.stdin.readline()
+                    if not line:
+                        raise EOFError
             except (EOFError, KeyboardInterrupt):
-                print()
+                self._emit("")
                 break
+            line = line.strip()
 
             if not line:
                 continue
@@ -249,25 +396,29 @@ Exemples:
                 expr = parse(line, debug=self.debug)
                 self.last_expr = expr
             except Exception as e:
-                print(_colorize(f"[Erreur de parsing] {e}", Fore.RED))
+                self._emit(f"[Erreur de parsing] {e}", Fore.RED)
                 if hasattr(e, "format_error"):
-                    print(e.format_error())
+                    self._emit(e.format_error())
                 continue
 
             # Afficher l'AST si demandé (ou en mode debug)
             if self.debug:
-                print(_colorize("AST:", Fore.BLUE))
-                print(ast.pretty_print(expr))
+                self._emit("AST:", Fore.BLUE)
+                self._emit(ast.pretty_print(expr))
+                # Écrit avant l'évaluation : ses traces (logging) suivent l'AST
+                self._flush()
 
             # Évaluer
             try:
-                result = evaluate(expr, self.env, debug=self.debug)
-                print(_colorize(f"Résultat: {result}", Fore.GREEN))
+                result = self._evaluate(expr)
+                self._emit(f"{_RESULT_PREFIX}{result}{_COLOR_RESET}")
             except Exception as e:
-                print(_colorize(f"[Erreur d'évaluation] {e}", Fore.RED))
+                self._emit(f"[Erreur d'évaluation] {e}", Fore.RED)
                 continue
 
-            print()  # Ligne vide pour la lisibilité
+            self._emit("")  # Ligne vide pour la lisibilité
+
+        self._flush()
 
 
 def repl(initial_env: Dict[str, bool] | None = None) -> None:
@@ -18,46 +18,56 @@ class LogicalExpressionHighlighter(QSyntaxHighlighter):
         self.setup_highlighting_rules()
 
     def setup_highlighting_rules(self) -> None:
-        """Configure les règles de colorisation."""
-        self.highlighting_rules: list[tuple[QRegularExpression, QTextCharFormat]] = []
+        """Configure les règles de colorisation.
+
+        Toutes les règles sont fusionnées en un seul pattern à groupes
+        alternés : un unique parcours gauche-droite par bloc, le groupe
+        capturé désignant le format à appliquer. L'ordre des groupes fixe la
+        priorité (commentaire, puis mot-clé avant identifiant).
+        """
+        # Commentaires (# ...) - Gris
+        comment_format = QTextCharFormat()
+        comment_format.setForeground(QColor("#757575"))  # Gris Material
+        comment_format.setFontItalic(True)
 
         # Mots-clés (AND, OR, NOT, TRUE, FALSE) - Bleu clair
         keyword_format = QTextCharFormat()
         keyword_format.setForeground(QColor("#64B5F6"))  # Bleu clair Material
         keyword_format.setFontWeight(600)
-        keywords = ["AND", "OR", "NOT", "TRUE", "FALSE"]
-        for keyword in keywords:
-            pattern = QRegularExpression(rf"\b{keyword}\b", QRegularExpression.PatternOption.CaseInsensitiveOption)
-            self.highlighting_rules.append((pattern, keyword_format))
 
         # Variables (identifiants) - Blanc
         variable_format = QTextCharFormat()
         variable_format.setForeground(QColor("#FFFFFF"))
         variable_format.setFontWeight(500)
-        pattern = QRegularExpression(r"\b[A-Za-z_][A-Za-z0-9_]*\b")
-        self.highlighting_rules.append((pattern, variable_format))
 
         # Parenthèses - Jaune
         paren_format = QTextCharFormat()
         paren_format.setForeground(QColor("#FFC107"))  # Jaune Material
         paren_format.setFontWeight(700)
-        pattern = QRegularExpression(r"[()]")
-        self.highlighting_rules.append((pattern, paren_format))
 
-        # Commentaires (# ...) - Gris
-        comment_format = QTextCharFormat()
-        comment_format.setForeground(QColor("#757575"))  # Gris Material
-        comment_format.setFontItalic(True)
-        pattern = QRegularExpression(r"#.*")
-        self.highlighting_rules.append((pattern, comment_format))
+        self.highlighting_rules: list[tuple[str, QTextCharFormat]] = [
+            (r"#.*", comment_format),
+            (r"\b(?:AND|OR|NOT|TRUE|FALSE)\b", keyword_format),
+            (r"\b[A-Za-z_][A-Za-z0-9_]*\b", variable_format),
+            (r"[()]", paren_format),
+        ]
+        self._master_re = QRegularExpression(
+            "|".join(f"({pattern})" for pattern, _ in self.highlighting_rules),
+            QRegularExpression.PatternOption.CaseInsensitiveOption,
+        )
+        # Format indexé par numéro de groupe (le groupe 0 est le match entier)
+        self._group_formats = [None] + [fmt for _, fmt in self.highlighting_rules]
 
     def highlightBlock(self, text: str) -> None:
         """Applique la colorisation à un bloc de texte."""
-        for pattern, format_char in self.highlighting_rules:
-            iterator = pattern.globalMatch(text)
-            while iterator.hasNext():
-                match = iterator.next()
-                self.setFormat(match.capturedStart(), match.capturedLength(), format_char)
+        formats = self._group_formats
+        iterator = self._master_re.globalMatch(text)
+        while iterator.hasNext():
+            match = iterator.next()
+            # Un seul groupe (sans groupe imbriqué) participe au match
+            self.setFormat(
+                match.capturedStart(), match.capturedLength(), formats[match.lastCapturedIndex()]
+            )
 
     def highlight_error(self, position: int, length: int = 1) -> None:
         """Surligne une erreur en rouge."""
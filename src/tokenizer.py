@@ -9,10 +9,13 @@ Ce module implémente un lexer robuste avec :
 
 from __future__ import annotations
 
+import functools
 import re
+import sys
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import Iterable, List
+from types import MappingProxyType
+from typing import Iterable, Iterator, List
 
 from .errors import LexicalError, SourceLocation
 
@@ -30,7 +33,7 @@ class TokenType(Enum):
     EOF = auto()
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class Token:
     """Représente un token avec sa position dans le code source."""
 
@@ -47,24 +50,52 @@ class Token:
         return f"{self.type.name}({self.lexeme!r})@{self.location}"
 
 
-# Patterns regex pour le lexing
-_IDENT_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
-_WHITESPACE_RE = re.compile(r"\s+")
-_COMMENT_RE = re.compile(r"#.*")  # Commentaire jusqu'à la fin de la ligne
+# Pattern maître : une alternative nommée par catégorie, essayées dans
+# l'ordre ; ERR capture tout autre caractère (erreur lexicale, dont '#'
+# quand les commentaires sont désactivés). SKIP avale d'un seul match toute
+# suite de blancs et de commentaires.
+_TOKEN_PATTERN = (
+    r"|(?P<IDENT>[A-Za-z_][A-Za-z0-9_]*)"
+    r"|(?P<LPAREN>\()"
+    r"|(?P<RPAREN>\))"
+    r"|(?P<ERR>.)"
+)
+_MASTER_RE = re.compile(
+    r"(?P<SKIP>(?:\s+|\#[^\n]*)+)" + _TOKEN_PATTERN,
+    re.DOTALL,
+)
+_MASTER_RE_NO_COMMENTS = re.compile(r"(?P<SKIP>\s+)" + _TOKEN_PATTERN, re.DOTALL)
+
+# Nombre de sources dont les tokens sont conservés par `tokenize`
+_CACHE_SIZE = 256
 
 # Mots-clés du langage (insensibles à la casse)
-_KEYWORDS = {
-    "AND": TokenType.AND,
-    "OR": TokenType.OR,
-    "NOT": TokenType.NOT,
-    "TRUE": TokenType.BOOL,
-    "FALSE": TokenType.BOOL,
-}
+_KEYWORDS = MappingProxyType(
+    {
+        "AND": TokenType.AND,
+        "OR": TokenType.OR,
+        "NOT": TokenType.NOT,
+        "TRUE": TokenType.BOOL,
+        "FALSE": TokenType.BOOL,
+    }
+)
+
+# Initiales possibles d'un mot-clé (dans les deux casses) : les identifiants
+# qui commencent autrement sont des variables sans passer par `upper()`
+_KEYWORD_INITIALS = frozenset("ANOTFanotf")
 
 
 class Lexer:
     """Analyseur lexical avec tracking de ligne/colonne."""
 
+    # Attributs typés au niveau de la classe (spécialisables à la compilation)
+    source: str
+    enable_comments: bool
+    offset: int
+    line: int
+    column: int
+    length: int
+
     def __init__(self, source: str, enable_comments: bool = True) -> None:
         """Initialise le lexer.
 
@@ -83,94 +114,92 @@ class Lexer:
         """Retourne la position actuelle dans le code source."""
         return SourceLocation(line=self.line, column=self.column, offset=self.offset)
 
-    def _advance(self, count: int = 1) -> None:
-        """Avance le curseur de `count` caractères."""
-        for _ in range(count):
-            if self.offset < self.length:
-                if self.source[self.offset] == "\n":
-                    self.line += 1
-                    self.column = 1
-                else:
-                    self.column += 1
-                self.offset += 1
-
-    def _match_regex(self, pattern: re.Pattern[str]) -> re.Match[str] | None:
-        """Tente de matcher un pattern regex à la position actuelle."""
-        return pattern.match(self.source, self.offset)
-
-    def _skip_whitespace(self) -> None:
-        """Saute les espaces blancs."""
-        while self.offset < self.length:
-            m = self._match_regex(_WHITESPACE_RE)
-            if m:
-                self._advance(m.end() - m.start())
+    def iter_tokens(self) -> Iterator[Token]:
+        """Produit les tokens un à un, EOF compris (lexing paresseux).
+
+        Un seul `finditer` sur `_MASTER_RE` parcourt la source. La ligne et
+        la colonne ne sont calculées que pour les tokens produits : on compte
+        les sauts de ligne depuis le dernier token et on retient l'index du
+        dernier, ce qui rend la colonne O(1).
+
+        Raises:
+            LexicalError: Au moment où un caractère invalide est atteint
+        """
+        source = self.source
+        count_nl, rfind_nl = source.count, source.rfind
+        keywords = _KEYWORDS
+        keyword_initials = _KEYWORD_INITIALS
+        ident = TokenType.IDENT
+        intern = sys.intern
+        master_re = _MASTER_RE if self.enable_comments else _MASTER_RE_NO_COMMENTS
+        line = 1
+        line_start = 0  # Offset du premier caractère de la ligne courante
+        scanned = 0  # Offset jusqu'où les sauts de ligne ont été comptés
+
+        for m in master_re.finditer(source):
+            kind = m.lastgroup
+            if kind == "SKIP":
+                continue
+
+            start = m.start()
+            newlines = count_nl("\n", scanned, start)
+            if newlines:
+                line += newlines
+                line_start = rfind_nl("\n", scanned, start) + 1
+            scanned = start
+            location = SourceLocation(line=line, column=start - line_start + 1, offset=start)
+
+            if kind == "IDENT":
+                lexeme = m.group()
+                if lexeme[0] in keyword_initials:
+                    upper = lexeme.upper()
+                    token_type = keywords.get(upper, ident)
+                    if token_type is not ident:
+                        yield Token(token_type, intern(upper), location)
+                        continue
+                # Pour les identifiants, on garde la casse originale ; les
+                # lexèmes sont internés (une seule chaîne par nom)
+                yield Token(ident, intern(lexeme), location)
+            elif kind == "LPAREN":
+                yield Token(TokenType.LPAREN, "(", location)
+            elif kind == "RPAREN":
+                yield Token(TokenType.RPAREN, ")", location)
             else:
-                break
-
-    def _skip_comment(self) -> bool:
-        """Saute un commentaire si présent. Retourne True si un commentaire a été sauté."""
-        if not self.enable_comments:
-            return False
-        m = self._match_regex(_COMMENT_RE)
-        if m:
-            self._advance(m.end() - m.start())
-            return True
-        return False
-
-    def _read_token(self) -> Token | None:
-        """Lit le prochain token. Retourne None si EOF."""
-        # Sauter espaces et commentaires
-        while True:
-            self._skip_whitespace()
-            if not self._skip_comment():
-                break
-
-        if self.offset >= self.length:
-            return Token(TokenType.EOF, "", self._current_location())
-
-        location = self._current_location()
-        ch = self.source[self.offset]
-
-        # Parenthèses
-        if ch == "(":
-            self._advance()
-            return Token(TokenType.LPAREN, "(", location)
-        if ch == ")":
-            self._advance()
-            return Token(TokenType.RPAREN, ")", location)
-
-        # Identifiants / mots-clés
-        m = self._match_regex(_IDENT_RE)
-        if m:
-            lexeme = m.group(0)
-            upper = lexeme.upper()
-            token_type = _KEYWORDS.get(upper, TokenType.IDENT)
-            # Pour les identifiants, on garde la casse originale
-            final_lexeme = upper if token_type != TokenType.IDENT else lexeme
-            self._advance(len(lexeme))
-            return Token(token_type, final_lexeme, location)
-
-        # Rien ne correspond - erreur lexicale
-        raise LexicalError(
-            f"Caractère inattendu '{ch}'",
-            location=location,
-            source=self.source,
-        )
+                # Rien ne correspond - erreur lexicale
+                self.offset, self.line, self.column = location.offset, line, location.column
+                raise LexicalError(
+                    f"Caractère inattendu '{source[start]}'",
+                    location=location,
+                    source=source,
+                )
+
+        # EOF : position après le dernier caractère
+        end = self.length
+        newlines = count_nl("\n", scanned, end)
+        if newlines:
+            line += newlines
+            line_start = rfind_nl("\n", scanned, end) + 1
+        self.offset, self.line, self.column = end, line, end - line_start + 1
+        yield Token(TokenType.EOF, "", self._current_location())
 
     def tokenize(self) -> List[Token]:
         """Tokenise le code source et retourne la liste des tokens."""
-        tokens: List[Token] = []
-        while True:
-            token = self._read_token()
-            tokens.append(token)
-            if token.type == TokenType.EOF:
-                break
-        return tokens
+        return list(self.iter_tokens())
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def _tokenize_cached(source: str, enable_comments: bool) -> tuple[Token, ...]:
+    """Tokens de `source`, mis en cache (tuple immuable, copié par `tokenize`)."""
+    return tuple(Lexer(source, enable_comments=enable_comments).iter_tokens())
 
 
 def tokenize(source: str, enable_comments: bool = True) -> List[Token]:
     """Fonction utilitaire pour tokeniser une chaîne source.
 
+    Les résultats sont mis en cache (LRU borné) par source : une expression
+    rejouée (historique de la REPL, :tokens) n'est analysée qu'une fois.
+    Les erreurs ne sont pas mises en cache.
+
     Args:
         source: Code source à tokeniser
         enable_comments: Si True, les commentaires (# ...) sont ignorés
@@ -181,8 +210,23 @@ def tokenize(source: str, enable_comments: bool = True) -> List[Token]:
     Raises:
         LexicalError: Si un caractère invalide est rencontré
     """
-    lexer = Lexer(source, enable_comments=enable_comments)
-    return lexer.tokenize()
+    return list(_tokenize_cached(source, enable_comments))
+
+
+def iter_tokens(source: str, enable_comments: bool = True) -> Iterator[Token]:
+    """Version paresseuse de `tokenize` : les tokens sont produits à la demande.
+
+    Args:
+        source: Code source à tokeniser
+        enable_comments: Si True, les commentaires (# ...) sont ignorés
+
+    Returns:
+        Itérateur sur les tokens, terminé par EOF
+
+    Raises:
+        LexicalError: Au moment où le caractère invalide est atteint
+    """
+    return Lexer(source, enable_comments=enable_comments).iter_tokens()
 
 
 def debug_tokens(tokens: Iterable[Token]) -> str:
@@ -0,0 +1,28 @@
+"""Fixtures partagées par les tests.
+
+L'application Qt (`qapp`, portée session) et `qtbot` sont fournis par le
+plugin pytest-qt.
+"""
+
+import pytest
+
+
+@pytest.fixture
+def window(qtbot):
+    """Fenêtre principale neuve, fermée et détruite par qtbot après le test."""
+    from src.gui import LogicalExpressionApp
+
+    w = LogicalExpressionApp()
+    qtbot.addWidget(w)
+    return w
+
+
+@pytest.fixture(scope="session")
+def shared_window(qapp):
+    """Fenêtre principale partagée par les tests en lecture seule."""
+    from src.gui import LogicalExpressionApp
+
+    w = LogicalExpressionApp()
+    yield w
+    w.close()
+    w.deleteLater()
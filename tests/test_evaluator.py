@@ -1,9 +1,19 @@
 """Tests pour l'évaluateur amélioré."""
 
+import itertools
+import subprocess
+import sys
+
 import pytest
 
-from src import ast
-from src.evaluator import evaluate, find_similar_variables
+from src.evaluator import (
+    compile_expr,
+    evaluate,
+    evaluate_many,
+    find_similar_variables,
+    levenshtein_distance,
+    truth_table,
+)
 from src.errors import UnknownVariableError
 from src.parser import parse
 
@@ -30,9 +40,8 @@ def test_evaluate_parentheses():
 
 def test_unknown_variable_raises():
     expr = parse("UNKNOWN")
-    with pytest.raises(UnknownVariableError) as exc_info:
+    with pytest.raises(UnknownVariableError, match="UNKNOWN") as exc_info:
         evaluate(expr, {"A": True})
-    assert "UNKNOWN" in str(exc_info.value)
     assert exc_info.value.variable_name == "UNKNOWN"
 
 
@@ -52,6 +61,35 @@ def test_find_similar_variables():
     assert "alpha" in suggestions or "ALPHA" in suggestions
 
 
+def test_levenshtein_distance():
+    assert levenshtein_distance("kitten", "sitting") == 3
+    assert levenshtein_distance("", "abc") == 3
+    assert levenshtein_distance("same", "same") == 0
+
+
+def test_levenshtein_distance_long_names():
+    # Plus de 64 caractères : les vecteurs de bits dépassent un mot machine
+    base = "x" * 70
+    assert levenshtein_distance(base, base[:35] + "y" + base[36:] + "z") == 2
+    assert levenshtein_distance("a" * 100, "b" * 100) == 100
+
+
+def test_find_similar_variables_respects_max_distance():
+    suggestions = find_similar_variables("abcdef", ["abcdxx", "uvwxyz", "ABCDEF"], max_distance=2)
+    assert suggestions == ["ABCDEF", "abcdxx"]
+
+
+def test_find_similar_variables_large_table():
+    # Au-delà du seuil, le calcul passe par le noyau Numba (s'il est installé)
+    available = [f"VAR_{i}" for i in range(200)] + ["alpha"]
+    assert find_similar_variables("alpa", available, max_distance=1) == ["alpha"]
+
+
+def test_non_bool_value_raises():
+    with pytest.raises(TypeError):
+        evaluate(parse("A AND NOT B"), {"A": True, "B": 1})
+
+
 def test_nested_not_evaluation():
     expr = parse("NOT NOT A")
     result = evaluate(expr, {"A": True})
@@ -63,3 +101,106 @@ def test_evaluate_bool_literals():
     expr = parse("TRUE AND FALSE")
     result = evaluate(expr, {})
     assert result is False
+
+
+def test_evaluate_debug_matches_fast_path():
+    expr = parse("(A OR NOT B) AND (C OR FALSE)")
+    env = {"A": False, "B": False, "C": True}
+    assert evaluate(expr, env) is evaluate(expr, env, debug=True) is True
+
+
+def test_short_circuit_skips_right_operand():
+    # L'opérande droit (variable inconnue) n'est pas évalué hors mode debug
+    assert evaluate(parse("A AND UNKNOWN"), {"A": False}) is False
+    assert evaluate(parse("A OR UNKNOWN"), {"A": True}) is True
+    with pytest.raises(UnknownVariableError):
+        evaluate(parse("A AND UNKNOWN"), {"A": False}, debug=True)
+
+
+def test_evaluate_many_truth_table():
+    np = pytest.importorskip("numpy")
+    expr = parse("(A OR NOT B) AND (C OR FALSE)")
+    names = ["A", "B", "C"]
+    # 70 lignes : plus d'un mot de 64 bits
+    rows = (list(itertools.product([False, True], repeat=3)) * 9)[:70]
+    results = evaluate_many(expr, names, np.array(rows))
+    assert results.tolist() == [evaluate(expr, dict(zip(names, row, strict=True))) for row in rows]
+
+
+def test_evaluate_many_unknown_variable():
+    np = pytest.importorskip("numpy")
+    with pytest.raises(UnknownVariableError):
+        evaluate_many(parse("A AND D"), ["A", "B"], np.zeros((4, 2), dtype=bool))
+
+
+def test_evaluate_deep_expression():
+    # Chaîne gauche de 5000 AND : plus profonde que la limite de récursion
+    source = " AND ".join(["A"] * 5000) + " OR NOT NOT B"
+    assert evaluate(parse(source), {"A": True, "B": False}) is True
+    assert evaluate(parse(source), {"A": False, "B": True}) is True
+    assert evaluate(parse(source), {"A": False, "B": False}) is False
+
+
+def test_compile_expr_matches_evaluate():
+    expr = parse("(A OR NOT B) AND (C OR FALSE) OR A AND TRUE")
+    compiled = compile_expr(expr)
+    for row in itertools.product([False, True], repeat=3):
+        env = dict(zip("ABC", row, strict=True))
+        assert compiled(env) is evaluate(expr, env)
+
+
+def test_compile_expr_errors_match_evaluate():
+    compiled = compile_expr(parse("A AND UNKNOWN"))
+    assert compiled({"A": False}) is False
+    with pytest.raises(UnknownVariableError):
+        compiled({"A": True, "UNKNOWM": True})
+    with pytest.raises(TypeError):
+        compile_expr(parse("A AND NOT B"))({"A": True, "B": 1})
+
+
+def test_compile_expr_deep_expression():
+    source = " AND ".join(["A"] * 5000) + " OR NOT NOT B"
+    compiled = compile_expr(parse(source))
+    assert compiled({"A": True, "B": False}) is True
+    assert compiled({"A": False, "B": False}) is False
+
+
+def test_import_does_not_load_numba():
+    code = "import sys, src; assert 'numba' not in sys.modules and 'numpy' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_left_chains_short_circuit_left_to_right():
+    env = {"A": True, "B": False}
+    # L'opérande inconnu n'est jamais atteint
+    assert evaluate(parse("A AND B AND UNKNOWN AND A"), env) is False
+    assert evaluate(parse("B OR A OR UNKNOWN OR B"), env) is True
+    with pytest.raises(UnknownVariableError):
+        evaluate(parse("A AND A AND UNKNOWN AND B"), env)
+    assert evaluate(parse(" OR ".join(["B"] * 3000 + ["A"])), env) is True
+
+
+def test_truth_table_matches_evaluate_on_every_row():
+    expr = parse("(A AND NOT B) OR (C AND TRUE) OR NOT (A OR FALSE)")
+    names = ["A", "B", "C"]
+    table = truth_table(expr, names)
+    for row, values in enumerate(itertools.product([False, True], repeat=3)):
+        assert bool(table >> row & 1) == evaluate(expr, dict(zip(names, values, strict=True)))
+
+
+def test_truth_table_unknown_variable():
+    with pytest.raises(UnknownVariableError):
+        truth_table(parse("A AND Z"), ["A", "B"])
+
+
+def test_truth_table_and_evaluate_many_deep_expression():
+    # Chaîne gauche de 5000 AND : plus profonde que la limite de récursion
+    expr = parse(" AND ".join(["A"] * 5000) + " OR NOT NOT B")
+    names = ["A", "B"]
+    rows = list(itertools.product([False, True], repeat=2))
+    expected = [evaluate(expr, dict(zip(names, row, strict=True))) for row in rows]
+    table = truth_table(expr, names)
+    assert [bool(table >> r & 1) for r in range(len(rows))] == expected
+
+    np = pytest.importorskip("numpy")
+    assert evaluate_many(expr, names, np.array(rows)).tolist() == expected
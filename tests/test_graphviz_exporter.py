@@ -0,0 +1,54 @@
+"""Tests pour l'export Graphviz (DOT)."""
+
+import io
+
+from src.graphviz_exporter import GraphvizExporter, export_to_dot, export_to_dot_string
+from src.parser import parse
+
+
+def export(source: str) -> str:
+    output = io.StringIO()
+    export_to_dot(parse(source), output)
+    return output.getvalue()
+
+
+def test_export_structure():
+    dot = export("A AND NOT B")
+    assert dot.startswith("digraph AST {\n")
+    assert dot.endswith("}\n")
+    assert 'label="AND"' in dot
+    assert 'label="NOT"' in dot
+    assert 'label="Var\\nA"' in dot
+    assert "root -> n1;" in dot
+
+
+def test_export_edges():
+    dot = export("A OR TRUE")
+    assert 'n1 -> n2 [label="left"];' in dot
+    assert 'n1 -> n3 [label="right"];' in dot
+    assert 'label="BoolLit\\nTRUE"' in dot
+
+
+def test_export_single_write():
+    class CountingIO(io.StringIO):
+        writes = 0
+
+        def write(self, s):
+            CountingIO.writes += 1
+            return super().write(s)
+
+    output = CountingIO()
+    export_to_dot(parse("(A OR B) AND NOT C"), output)
+    assert CountingIO.writes == 1
+
+
+def test_escape_label():
+    exporter = GraphvizExporter(io.StringIO())
+    assert exporter._escape_label('a\\b"c\nd') == 'a\\\\b\\"c\\nd'
+
+
+def test_export_to_dot_string():
+    expr = parse("(A OR B) AND NOT C")
+    output = io.StringIO()
+    export_to_dot(expr, output, "G")
+    assert export_to_dot_string(expr, "G") == output.getvalue()
@@ -2,6 +2,8 @@
 
 import json
 
+import pytest
+
 from src import ast
 from src.ast import from_json
 from src.parser import parse
@@ -32,11 +34,31 @@ def test_ast_from_json():
 
 def test_ast_json_roundtrip():
     original = parse("(A OR B) AND NOT C")
-    json_str = json.dumps(original.to_json())
-    json_data = json.loads(json_str)
-    restored = from_json(json_data)
-    # Vérifier l'égalité structurelle
-    assert restored == original
+    # Vérifier l'égalité structurelle (dictionnaire passé directement)
+    assert from_json(original.to_json()) == original
+
+
+def test_from_json_accepts_json_string():
+    original = parse("(A OR B) AND NOT C")
+    assert from_json(json.dumps(original.to_json())) == original
+
+
+def test_from_json_deep_nesting():
+    data = {"type": "Var", "name": "A"}
+    for _ in range(5000):
+        data = {"type": "Not", "expr": data}
+    expr = from_json(data)
+    depth = 0
+    while isinstance(expr, ast.Not):
+        expr = expr.expr
+        depth += 1
+    assert depth == 5000
+    assert expr == ast.Var(name="A")
+
+
+def test_from_json_unknown_type():
+    with pytest.raises(ValueError):
+        from_json({"type": "Xor"})
 
 
 def test_ast_eq():
@@ -48,6 +70,24 @@ def test_ast_eq():
     assert expr1 != expr3
 
 
+def test_ast_hash_matches_eq():
+    expr1 = parse("(A OR B) AND NOT C")
+    expr2 = ast.And(
+        left=ast.Or(left=ast.Var(name="A"), right=ast.Var(name="B")),
+        right=ast.Not(expr=ast.Var(name="C")),
+    )
+    assert expr1 is not expr2
+    assert expr1 == expr2
+    assert hash(expr1) == hash(expr2)
+    assert len({expr1, expr2, parse("A OR B")}) == 2
+
+
+def test_parse_shares_identical_subtrees():
+    expr = parse("(A AND NOT B) OR (A AND NOT B)")
+    assert expr.left is expr.right
+    assert parse("A OR B") is parse("A OR B")
+
+
 def test_bool_lit_json():
     expr = ast.BoolLit(value=True)
     json_data = expr.to_json()
@@ -60,3 +100,25 @@ def test_not_json():
     assert json_data["type"] == "Not"
     assert json_data["expr"]["type"] == "Var"
 
+
+
+@pytest.mark.parametrize(
+    "source", ["A", "TRUE", "NOT FALSE", "A AND (B OR NOT C)", "(A OR A) AND NOT (A OR A)"]
+)
+def test_write_json_matches_json_dumps(source):
+    expr = parse(source)
+    chunks: list[str] = []
+    ast.write_json(expr, chunks.append)
+    assert "".join(chunks) == json.dumps(expr.to_json(), indent=2)
+
+
+def test_write_json_deep_nesting():
+    expr = ast.Var(name="é\"x")
+    for _ in range(5000):
+        expr = ast.Not(expr=expr)
+    chunks: list[str] = []
+    ast.write_json(expr, chunks.append, indent=1)  # Parcours itératif
+    text = "".join(chunks)
+    assert text.count('"type": "Not"') == 5000
+    assert '"name": "\\u00e9\\"x"' in text
+    assert text.endswith(" " * 2 + "}\n" + " " + "}\n" + "}")
@@ -0,0 +1,60 @@
+"""Tests pour le lexer PLY."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.errors import LexicalError
+from src.lexer_ply import get_lexer, iter_tokens_ply, tokenize_ply
+
+
+def token_types(source: str) -> list[str]:
+    return [tok.type for tok in tokenize_ply(source)]
+
+
+def test_tokenize_ply_keywords_and_comment():
+    assert token_types("a and (B OR not c) # commentaire") == [
+        "IDENT", "AND", "LPAREN", "IDENT", "OR", "NOT", "IDENT", "RPAREN",
+    ]
+
+
+def test_tokenize_ply_resets_line_numbers():
+    assert tokenize_ply("A\nB")[1].lineno == 2
+    assert tokenize_ply("A\nB")[1].lineno == 2
+
+
+def test_lexer_per_thread():
+    main_lexer = get_lexer()
+    assert get_lexer() is main_lexer
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        assert main_lexer not in set(pool.map(lambda _: get_lexer(), range(8)))
+        results = list(pool.map(token_types, ["A AND B", "NOT C"] * 50))
+    assert results == [["IDENT", "AND", "IDENT"], ["NOT", "IDENT"]] * 50
+
+
+def test_tokenize_ply_matches_ply_lexer():
+    source = "a AND true\n  OR (not B_1) # c\n\nfalse"
+    lexer = get_lexer().clone()
+    lexer.input(source)
+    expected = [(t.type, t.value, t.lineno, t.lexpos) for t in iter(lexer.token, None)]
+    assert [tuple(tok) for tok in tokenize_ply(source)] == expected
+
+
+def test_tokenize_ply_invalid_character():
+    with pytest.raises(LexicalError) as exc_info:
+        tokenize_ply("A\nB & C")
+    assert exc_info.value.location.line == 2
+    assert exc_info.value.location.column == 3
+
+
+def test_tokenize_ply_mixed_case_booleans_are_normalized():
+    assert [(tok.type, tok.value) for tok in tokenize_ply("tRuE oR False")] == [
+        ("BOOL", "TRUE"), ("OR", "oR"), ("BOOL", "FALSE"),
+    ]
+
+
+def test_iter_tokens_ply_is_lazy():
+    tokens = iter_tokens_ply("A & B")
+    assert next(tokens).value == "A"
+    with pytest.raises(LexicalError):
+        next(tokens)
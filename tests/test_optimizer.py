@@ -1,88 +1,141 @@
 """Tests pour l'optimizer avec constant folding."""
 
+import itertools
+
+import pytest
+
 from src import ast
-from src.optimizer import optimize
+from src.optimizer import Optimizer, optimize
 from src.parser import parse
 
-
-def test_optimize_not_true():
-    expr = parse("NOT TRUE")
-    optimized = optimize(expr)
-    assert isinstance(optimized, ast.BoolLit)
-    assert optimized.value is False
+# (source, résultat attendu après constant folding)
+OPTIMIZE_CASES = [
+    ("NOT TRUE", ast.BoolLit(value=False)),
+    ("NOT FALSE", ast.BoolLit(value=True)),
+    ("NOT NOT A", ast.Var(name="A")),
+    ("TRUE AND A", ast.Var(name="A")),
+    ("FALSE AND A", ast.BoolLit(value=False)),
+    ("A AND TRUE", ast.Var(name="A")),
+    ("A AND FALSE", ast.BoolLit(value=False)),
+    ("TRUE OR A", ast.BoolLit(value=True)),
+    ("FALSE OR A", ast.Var(name="A")),
+    # TRUE AND X → X, puis FALSE OR X → X : il ne reste que A
+    ("TRUE AND (FALSE OR A)", ast.Var(name="A")),
+]
+
+
+@pytest.mark.parametrize("source, expected", OPTIMIZE_CASES)
+def test_optimize_constant_folding(source, expected):
+    optimized = optimize(parse(source))
+    assert type(optimized) is type(expected)
+    assert optimized == expected
 
 
-def test_optimize_not_false():
-    expr = parse("NOT FALSE")
+def test_optimize_no_change():
+    # Expression qui ne peut pas être optimisée
+    expr = parse("A AND B")
     optimized = optimize(expr)
-    assert isinstance(optimized, ast.BoolLit)
-    assert optimized.value is True
+    # Devrait rester identique (structure)
+    assert isinstance(optimized, ast.And)
+    assert optimized == expr  # Utilise __eq__
 
 
-def test_optimize_double_not():
-    expr = parse("NOT NOT A")
-    optimized = optimize(expr)
-    assert isinstance(optimized, ast.Var)
-    assert optimized.name == "A"
 
-
-def test_optimize_true_and_x():
-    expr = parse("TRUE AND A")
-    optimized = optimize(expr)
-    assert isinstance(optimized, ast.Var)
-    assert optimized.name == "A"
+def test_optimize_shared_subtree_once():
+    shared = ast.And(left=ast.BoolLit(value=True), right=ast.Not(expr=ast.Not(expr=ast.Var(name="A"))))
+    optimized = optimize(ast.Or(left=shared, right=shared))
+    assert optimized == ast.Or(left=ast.Var(name="A"), right=ast.Var(name="A"))
+    # Le sous-arbre partagé n'est optimisé qu'une fois
+    assert optimized.left is optimized.right
 
 
-def test_optimize_false_and_x():
-    expr = parse("FALSE AND A")
-    optimized = optimize(expr)
-    assert isinstance(optimized, ast.BoolLit)
-    assert optimized.value is False
+def test_optimize_reaches_fixed_point_in_one_pass():
+    for source in (
+        "NOT NOT NOT A",
+        "NOT (NOT TRUE OR NOT NOT (A AND TRUE))",
+        "(FALSE OR NOT NOT NOT FALSE) AND (B OR NOT (TRUE AND FALSE))",
+    ):
+        optimized = optimize(parse(source))
+        assert optimize(optimized) is optimized
+    assert optimize(parse("NOT NOT NOT A")) == ast.Not(expr=ast.Var(name="A"))
 
 
-def test_optimize_x_and_true():
-    expr = parse("A AND TRUE")
-    optimized = optimize(expr)
-    assert isinstance(optimized, ast.Var)
-    assert optimized.name == "A"
+def test_optimize_deep_expression():
+    # Chaîne gauche de 5000 AND : plus profonde que la limite de récursion
+    source = "TRUE AND " + " AND ".join(["A"] * 5000) + " AND NOT NOT B"
+    optimized = optimize(parse(source))
+    node = optimized
+    depth = 0
+    while isinstance(node, ast.And):
+        assert node.right in (ast.Var(name="A"), ast.Var(name="B"))
+        node = node.left
+        depth += 1
+    assert node == ast.Var(name="A") and depth == 5000
 
 
-def test_optimize_x_and_false():
-    expr = parse("A AND FALSE")
-    optimized = optimize(expr)
-    assert isinstance(optimized, ast.BoolLit)
-    assert optimized.value is False
+def test_optimize_all_literal_pairs():
+    for left, right in itertools.product([True, False], repeat=2):
+        for op, source_op in ((ast.mk_and, "AND"), (ast.mk_or, "OR")):
+            expr = op(ast.mk_bool(left), ast.mk_bool(right))
+            expected = (left and right) if source_op == "AND" else (left or right)
+            assert optimize(expr) == ast.BoolLit(value=expected)
 
 
-def test_optimize_true_or_x():
-    expr = parse("TRUE OR A")
-    optimized = optimize(expr)
-    assert isinstance(optimized, ast.BoolLit)
-    assert optimized.value is True
+def test_optimize_returns_literal_singletons():
+    folded = optimize(parse("NOT (A AND FALSE)"))
+    assert folded is ast.mk_bool(True)
+    # Littéral construit directement (hors fabrique mk_bool) : canonicalisé
+    assert optimize(ast.And(left=ast.Var(name="A"), right=ast.BoolLit(value=False))) is ast.mk_bool(False)
+    assert optimize(ast.BoolLit(value=True)) is ast.mk_bool(True)
 
 
-def test_optimize_false_or_x():
-    expr = parse("FALSE OR A")
-    optimized = optimize(expr)
-    assert isinstance(optimized, ast.Var)
-    assert optimized.name == "A"
+def test_foldable_bit_marks_simplifiable_subtrees():
+    assert not parse("A AND (B OR NOT C)").foldable
+    assert parse("A AND (B OR NOT TRUE)").foldable
+    assert parse("A OR NOT NOT B").foldable
 
 
-def test_optimize_complex_expression():
-    expr = parse("TRUE AND (FALSE OR A)")
-    optimized = optimize(expr)
-    # TRUE AND X → X, donc on devrait avoir (FALSE OR A)
-    # Mais FALSE OR A → A (FALSE OR X → X)
-    # Donc le résultat final devrait être A
-    assert isinstance(optimized, ast.Var)
-    assert optimized.name == "A"
+def test_literal_free_tree_is_returned_unchanged():
+    expr = parse("A AND (B OR NOT C)")
+    assert optimize(expr) is expr
+    assert optimize(parse("A OR NOT NOT B")) is parse("A OR B")
 
 
-def test_optimize_no_change():
-    # Expression qui ne peut pas être optimisée
-    expr = parse("A AND B")
-    optimized = optimize(expr)
-    # Devrait rester identique (structure)
-    assert isinstance(optimized, ast.And)
-    assert optimized == expr  # Utilise __eq__
+def test_optimize_results_are_cached():
+    from src.optimizer import _optimize_cached
 
+    _optimize_cached.cache_clear()
+    expr = parse("A AND TRUE")
+    assert optimize(expr) is optimize(expr)
+    assert _optimize_cached.cache_info().hits == 1
+
+
+def test_visit_methods_do_not_leak_memo_between_calls():
+    # Nœuds neufs (hors fabriques mk_*), libérés après chaque appel : leurs
+    # id() sont réutilisés, le mémo ne doit donc pas survivre à l'appel
+    optimizer = Optimizer()
+    for i in range(2000):
+        value = bool(i % 2)
+        assert optimizer.visit_not(ast.Not(expr=ast.Not(expr=ast.BoolLit(value=value)))) == ast.BoolLit(
+            value=value
+        )
+        assert optimizer.visit_and(ast.And(left=ast.BoolLit(value=value), right=ast.Var(name="A"))) == (
+            ast.Var(name="A") if value else ast.BoolLit(value=False)
+        )
+        assert optimizer.visit_or(ast.Or(left=ast.BoolLit(value=value), right=ast.Var(name="A"))) == (
+            ast.BoolLit(value=True) if value else ast.Var(name="A")
+        )
+
+
+def test_optimize_cached_deep_equal_trees():
+    # Deux chaînes de 5000 AND égales mais distinctes : la recherche dans le
+    # cache compare les clés sans récursion
+    def build():
+        expr = ast.Var(name="A")
+        for _ in range(5000):
+            expr = ast.And(left=expr, right=ast.Var(name="B"))
+        return ast.And(left=expr, right=ast.BoolLit(value=True))
+
+    first, second = build(), build()
+    assert first is not second and first == second
+    assert optimize(first) is optimize(second)
@@ -1,65 +1,41 @@
 """Tests pour le parser amélioré."""
 
+import logging
+
 import pytest
 
 from src import ast
 from src.errors import (
     EndOfInputError,
+    LexicalError,
     MissingParenthesisError,
-    ParseError,
     UnexpectedTokenError,
 )
 from src.parser import parse
 
-
-def eval_structure(expr):
-    """Petite aide pour distinguer facilement les types lors des assertions."""
-    return type(expr).__name__
+# Constructeurs abrégés pour écrire les AST attendus
+V = ast.Var
+B = ast.BoolLit
+N = ast.Not
+A = ast.And
+O = ast.Or  # noqa: E741
 
 
 def test_operator_precedence_not_and_or():
     # NOT > AND > OR
-    expr = parse("A OR B AND NOT C")
-    # Attendu : Or(A, And(B, Not(C)))
-    assert isinstance(expr, ast.Or)
-    assert isinstance(expr.left, ast.Var)
-    assert expr.left.name == "A"
-    assert isinstance(expr.right, ast.And)
-    assert isinstance(expr.right.left, ast.Var)
-    assert expr.right.left.name == "B"
-    assert isinstance(expr.right.right, ast.Not)
-    assert isinstance(expr.right.right.expr, ast.Var)
-    assert expr.right.right.expr.name == "C"
+    assert parse("A OR B AND NOT C") == O(V("A"), A(V("B"), N(V("C"))))
 
 
 def test_parentheses_override_precedence():
-    expr = parse("(A OR B) AND C")
-    # Attendu : And(Or(A,B), C)
-    assert isinstance(expr, ast.And)
-    assert isinstance(expr.left, ast.Or)
-    assert isinstance(expr.left.left, ast.Var)
-    assert expr.left.left.name == "A"
-    assert isinstance(expr.left.right, ast.Var)
-    assert expr.left.right.name == "B"
-    assert isinstance(expr.right, ast.Var)
-    assert expr.right.name == "C"
+    assert parse("(A OR B) AND C") == A(O(V("A"), V("B")), V("C"))
 
 
 def test_nested_not():
-    expr = parse("NOT NOT A")
-    assert isinstance(expr, ast.Not)
-    assert isinstance(expr.expr, ast.Not)
-    assert isinstance(expr.expr.expr, ast.Var)
-    assert expr.expr.expr.name == "A"
+    assert parse("NOT NOT A") == N(N(V("A")))
 
 
 def test_bool_literals():
-    expr = parse("TRUE AND FALSE")
-    assert isinstance(expr, ast.And)
-    assert isinstance(expr.left, ast.BoolLit)
-    assert expr.left.value is True
-    assert isinstance(expr.right, ast.BoolLit)
-    assert expr.right.value is False
+    assert parse("TRUE AND FALSE") == A(B(True), B(False))
 
 
 def test_unexpected_token_error():
@@ -83,17 +59,91 @@ def test_end_of_input_error():
         parse("A AND")  # Fin d'entrée inattendue
 
 
-def test_parse_debug_mode():
-    import logging
+def test_parse_debug_mode(caplog):
+    # Niveau DEBUG limité au logger du parser et à ce test
+    with caplog.at_level(logging.DEBUG, logger="src.parser"):
+        expr = parse("A AND B", debug=True)
+    assert expr == A(V("A"), V("B"))
+    assert "[ENTER] parse_expression" in caplog.text
+
 
-    logging.basicConfig(level=logging.DEBUG)
-    # Ne devrait pas lever d'erreur
+def test_complex_expression():
+    assert parse("(A OR B) AND (NOT C OR D)") == A(O(V("A"), V("B")), O(N(V("C")), V("D")))
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        "A",
+        "NOT NOT NOT A",
+        "A AND NOT (B OR TRUE) OR false",
+        "((A)) AND (B OR (C AND NOT D))",
+    ],
+)
+def test_fast_path_matches_debug_path(source, caplog):
+    caplog.set_level(logging.DEBUG, logger="src.parser")
+    assert parse(source) is parse(source, debug=True)
+    assert "[ENTER] parse_expression" in caplog.text
+
+
+@pytest.mark.parametrize(
+    "source, error",
+    [
+        ("(A AND B", MissingParenthesisError),
+        ("A AND", EndOfInputError),
+        ("A B", UnexpectedTokenError),
+        ("AND A", UnexpectedTokenError),
+    ],
+)
+def test_fast_path_errors_match_debug_path(source, error, caplog):
+    caplog.set_level(logging.DEBUG, logger="src.parser")
+    with pytest.raises(error) as fast:
+        parse(source)
+    with pytest.raises(error) as slow:
+        parse(source, debug=True)
+    assert str(fast.value) == str(slow.value)
+
+
+def test_debug_traces_skipped_when_logger_disabled(caplog):
+    caplog.set_level(logging.WARNING, logger="src.parser")
     expr = parse("A AND B", debug=True)
     assert isinstance(expr, ast.And)
+    assert "[ENTER]" not in caplog.text
 
 
-def test_complex_expression():
-    expr = parse("(A OR B) AND (NOT C OR D)")
-    assert isinstance(expr, ast.And)
-    assert isinstance(expr.left, ast.Or)
-    assert isinstance(expr.right, ast.Or)
+def test_binary_operators_are_left_associative():
+    a, b, c = ast.mk_var("A"), ast.mk_var("B"), ast.mk_var("C")
+    assert parse("A AND B AND C") is ast.mk_and(ast.mk_and(a, b), c)
+    assert parse("A OR B OR C") is ast.mk_or(ast.mk_or(a, b), c)
+    assert parse("A OR B AND C OR A") is ast.mk_or(ast.mk_or(a, ast.mk_and(b, c)), a)
+
+
+def test_streaming_parse_reports_lexical_errors():
+    with pytest.raises(LexicalError):
+        parse("A AND @")
+
+
+@pytest.mark.parametrize(
+    "source",
+    ["NOT NOT A", "A AND TRUE OR FALSE", "NOT (TRUE AND B) OR NOT FALSE", "(A OR B) AND NOT C"],
+)
+def test_simplify_folds_during_construction(source):
+    from src.optimizer import optimize
+    from src.parser_ply import parse as parse_ply
+
+    expected = optimize(parse(source))
+    assert parse(source, simplify=True) is expected
+    assert parse_ply(source, simplify=True) is expected
+
+
+def test_parse_results_are_cached_but_errors_are_not():
+    from src.parser import _parse_cached
+
+    _parse_cached.cache_clear()
+    parse("A AND B")
+    parse("A AND B")
+    assert _parse_cached.cache_info().hits == 1
+    for _ in range(2):
+        with pytest.raises(EndOfInputError):
+            parse("A AND")
+    assert _parse_cached.cache_info().currsize == 1
@@ -2,7 +2,7 @@
 
 from src import ast
 from src.parser import parse
-from src.pretty import CaseStyle, pretty_print
+from src.pretty import CaseStyle, SmartPrettyPrinter, pretty_print
 
 
 def test_pretty_print_upper_case():
@@ -58,3 +58,45 @@ def test_pretty_print_complex():
     assert "B" in result
     assert "C" in result
 
+
+
+def test_ast_pretty_print_tree():
+    result = ast.pretty_print(parse("A AND NOT (B OR TRUE)"))
+    assert result.splitlines() == [
+        "And",
+        "  Var(name=A)",
+        "  Not",
+        "    Or",
+        "      Var(name=B)",
+        "      BoolLit(value=True)",
+    ]
+
+
+def test_pretty_print_nested_parentheses_exact_output():
+    assert pretty_print(parse("(A OR B) AND NOT (C AND D)")) == "(A OR B) AND NOT (C AND D)"
+    assert pretty_print(parse("A OR B AND C")) == "A OR B AND C"
+    assert pretty_print(parse("A AND B"), show_parentheses="always") == "(A AND B)"
+
+
+def test_smart_printer_reusable_across_calls():
+    printer = SmartPrettyPrinter()
+    assert printer.format(parse("A OR B")) == "A OR B"
+    assert printer.format(parse("NOT C")) == "NOT C"
+
+
+def test_smart_printer_follows_options_changed_between_calls():
+    printer = SmartPrettyPrinter()
+    expr = parse("NOT A OR TRUE")
+    assert printer.format(expr) == "NOT A OR TRUE"
+    printer.options.case_style = CaseStyle.LOWER
+    printer.options.show_parentheses = "always"
+    assert printer.format(expr) == "(not A or true)"
+
+
+def test_pretty_print_deep_tree_without_recursion():
+    expr = ast.mk_var("A")
+    for _ in range(5000):
+        expr = ast.mk_not(ast.mk_and(ast.mk_var("B"), expr))
+    result = pretty_print(expr)
+    assert result.startswith("NOT (B AND NOT (B AND ")
+    assert result.count("(") == result.count(")") == 5000